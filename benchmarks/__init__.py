@@ -0,0 +1,6 @@
+"""
+Offline benchmarks for schema generation, dumping and loading.
+
+Run with ``python -m benchmarks run`` from the repository root and compare
+against the stored baseline with ``python -m benchmarks compare``.
+"""
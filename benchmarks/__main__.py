@@ -0,0 +1,68 @@
+import argparse
+import os
+import sys
+
+from . import runner
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _run(args: argparse.Namespace) -> int:
+    results = runner.run(args.cases, repeat=args.repeat)
+    runner.report(results)
+    if args.output:
+        runner.save(results, args.output)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    try:
+        regressions = runner.compare(
+            runner.load(args.baseline),
+            runner.load(args.current),
+            args.threshold,
+            normalize=args.normalize,
+        )
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    for line in regressions:
+        print(line)
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    run = commands.add_parser("run", help="Time benchmark cases")
+    run.add_argument("cases", nargs="*", help="Glob patterns, e.g. 'dump.*'")
+    run.add_argument("-o", "--output", help="Store results as JSON")
+    run.add_argument("--repeat", type=int, default=5)
+    run.set_defaults(handler=_run)
+
+    compare = commands.add_parser(
+        "compare", help="Exit with status 1 if any case regressed"
+    )
+    compare.add_argument("current", help="Results stored by run -o")
+    compare.add_argument("--baseline", default=BASELINE)
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown as a fraction, defaults to 0.25",
+    )
+    compare.add_argument(
+        "--normalize",
+        action="store_true",
+        help="Scale timings by the reference loop when comparing across machines",
+    )
+    compare.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Benchmark cases. Every case is a setup function returning the callable that
+is timed, registered with :func:`case` under a dotted name.
+"""
+
+import datetime
+import typing as t
+from decimal import Decimal
+from typing import Any, Callable, Dict, NamedTuple
+from uuid import UUID
+
+import attr
+from marshmallow import class_registry
+
+from marshmallow_annotations.ext.attrs import AttrsSchema
+from marshmallow_annotations.ext.namedtuple import NamedTupleSchema
+from marshmallow_annotations.registry import DefaultTypeRegistry
+from marshmallow_annotations.scheme import AnnotationSchema
+
+Setup = Callable[[], Callable[[], Any]]
+
+CASES: Dict[str, Setup] = {}
+
+MANY = 1000
+DEPTH = 6
+WIDTH = 60
+
+
+def case(name: str) -> Callable[[Setup], Setup]:
+    def register(setup: Setup) -> Setup:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+class Flat:
+    id: int
+    name: str
+    rating: float
+    active: bool
+    price: Decimal
+    uuid: UUID
+    released: datetime.date
+    updated: datetime.datetime
+    tags: t.List[str]
+    note: t.Optional[str]
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+@attr.s(auto_attribs=True)
+class AttrsFlat:
+    id: int
+    name: str
+    rating: float
+    active: bool
+    price: Decimal
+    uuid: UUID
+    released: datetime.date
+    updated: datetime.datetime
+    tags: t.List[str]
+    note: t.Optional[str] = None
+
+
+class TupleFlat(NamedTuple):
+    id: int
+    name: str
+    rating: float
+    active: bool
+    price: Decimal
+    uuid: UUID
+    released: datetime.date
+    updated: datetime.datetime
+    tags: t.List[str]
+    note: t.Optional[str] = None
+
+
+Wide = type(
+    "Wide",
+    (),
+    {"__annotations__": {f"field_{i}": (int, str, float)[i % 3] for i in range(WIDTH)}},
+)
+
+
+def _deep_targets():
+    # Level0 -> Level1 -> ... each level holding one child and a list of them
+    levels = []
+    child = None
+    for depth in reversed(range(DEPTH)):
+        annotations = {"id": int, "name": str}
+        if child is not None:
+            annotations["child"] = t.Optional[child]
+            annotations["children"] = t.List[child]
+        child = type(f"Level{depth}", (), {"__annotations__": annotations})
+        levels.append(child)
+    return list(reversed(levels))
+
+
+def _values(i: int) -> Dict[str, Any]:
+    return {
+        "id": i,
+        "name": f"item {i}",
+        "rating": i / 3,
+        "active": bool(i % 2),
+        "price": Decimal("9.99"),
+        "uuid": UUID(int=i),
+        "released": datetime.date(2018, 1, 1),
+        "updated": datetime.datetime(2018, 1, 1, 12, 30),
+        "tags": ["a", "b", "c"],
+        "note": None if i % 2 else "note",
+    }
+
+
+def _payload(i: int) -> Dict[str, Any]:
+    return {
+        "id": i,
+        "name": f"item {i}",
+        "rating": i / 3,
+        "active": bool(i % 2),
+        "price": "9.99",
+        "uuid": str(UUID(int=i)),
+        "released": "2018-01-01",
+        "updated": "2018-01-01T12:30:00+00:00",
+        "tags": ["a", "b", "c"],
+        "note": None if i % 2 else "note",
+    }
+
+
+def _schema(base, target, name, **meta):
+    meta.setdefault("registry", DefaultTypeRegistry())
+    meta["target"] = target
+    Meta = type("Meta", (), meta)
+    try:
+        return type(base)(name, (base,), {"Meta": Meta})
+    finally:
+        # keep marshmallow's class registry from growing while timing
+        class_registry._registry.pop(name, None)
+
+
+def _build(base, target):
+    return lambda: _schema(base, target, "BenchScheme")
+
+
+@case("build.flat")
+def build_flat():
+    return _build(AnnotationSchema, Flat)
+
+
+@case("build.wide")
+def build_wide():
+    return _build(AnnotationSchema, Wide)
+
+
+@case("build.attrs")
+def build_attrs():
+    return _build(AttrsSchema, AttrsFlat)
+
+
+@case("build.namedtuple")
+def build_namedtuple():
+    return _build(NamedTupleSchema, TupleFlat)
+
+
+@case("build.deep")
+def build_deep():
+    levels = _deep_targets()
+
+    def build():
+        registry = DefaultTypeRegistry()
+        for level in reversed(levels):
+            _schema(
+                AnnotationSchema,
+                level,
+                f"{level.__name__}Scheme",
+                registry=registry,
+                register_as_scheme=True,
+            )
+
+    return build
+
+
+def _dumper(schema, obj, many):
+    return lambda: schema.dump(obj, many=many)
+
+
+def _loader(schema, payload, many):
+    return lambda: schema.load(payload, many=many)
+
+
+def _round_trip_cases(name, base, target, make, **meta):
+    def schema():
+        return _schema(base, target, "BenchScheme", **meta)()
+
+    case(f"dump.one.{name}")(lambda: _dumper(schema(), make(0), False))
+    case(f"dump.many.{name}")(
+        lambda: _dumper(schema(), [make(i) for i in range(MANY)], True)
+    )
+    case(f"load.one.{name}")(lambda: _loader(schema(), _payload(0), False))
+    case(f"load.many.{name}")(
+        lambda: _loader(schema(), [_payload(i) for i in range(MANY)], True)
+    )
+
+
+_round_trip_cases("annotation", AnnotationSchema, Flat, lambda i: Flat(**_values(i)))
+_round_trip_cases("attrs", AttrsSchema, AttrsFlat, lambda i: AttrsFlat(**_values(i)))
+_round_trip_cases(
+    "namedtuple", NamedTupleSchema, TupleFlat, lambda i: TupleFlat(**_values(i))
+)
+_round_trip_cases(
+    "compiled",
+    AttrsSchema,
+    AttrsFlat,
+    lambda i: AttrsFlat(**_values(i)),
+    compile_dump=True,
+    compile_load=True,
+)
+
+
+def _deep_schema():
+    levels = _deep_targets()
+    registry = DefaultTypeRegistry()
+    for level in reversed(levels):
+        schema = _schema(
+            AnnotationSchema,
+            level,
+            f"{level.__name__}Scheme",
+            registry=registry,
+            register_as_scheme=True,
+        )
+        # nested fields find their schema by name
+        class_registry.register(f"{level.__name__}Scheme", schema)
+    return levels, schema()
+
+
+def _deep_object(levels, depth=0):
+    obj = levels[depth]()
+    obj.id = depth
+    obj.name = f"level {depth}"
+    if depth + 1 < len(levels):
+        obj.child = _deep_object(levels, depth + 1)
+        obj.children = [_deep_object(levels, depth + 1) for _ in range(2)]
+    return obj
+
+
+@case("dump.nested")
+def dump_nested():
+    levels, schema = _deep_schema()
+    return _dumper(schema, _deep_object(levels), False)
+
+
+@case("load.nested")
+def load_nested():
+    levels, schema = _deep_schema()
+    payload = schema.dump(_deep_object(levels)).data
+    return _loader(schema, payload, False)
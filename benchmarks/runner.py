@@ -0,0 +1,113 @@
+"""
+Times benchmark cases and compares results against a baseline.
+"""
+
+import fnmatch
+import json
+import platform
+import sys
+import timeit
+from typing import Dict, Iterable, List, Optional
+
+import marshmallow
+
+from marshmallow_annotations import __version__
+
+from .cases import CASES
+
+
+def measure(func, repeat: int = 5) -> float:
+    """
+    Returns the best observed time of a single call in seconds, each of the
+    repeats running the function enough times to take at least 0.2 seconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _reference_loop() -> int:
+    total = 0
+    for i in range(1000):
+        total += i * i
+    return total
+
+
+def run(patterns: Optional[Iterable[str]] = None, repeat: int = 5) -> Dict:
+    """
+    Runs every case matching one of the glob patterns, or every case. The
+    time of a fixed reference loop is recorded along with them to calibrate
+    comparisons across machines.
+    """
+    patterns = list(patterns or ["*"])
+    results = {}
+    for name, setup in sorted(CASES.items()):
+        if not any(fnmatch.fnmatch(name, p) for p in patterns):
+            continue
+        results[name] = measure(setup(), repeat=repeat)
+
+    return {
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "marshmallow": marshmallow.__version__,
+            "marshmallow-annotations": __version__,
+        },
+        "calibration": measure(_reference_loop, repeat=repeat),
+        "results": results,
+    }
+
+
+def machine_scale(baseline: Dict, current: Dict) -> float:
+    """
+    How much slower the current machine ran the reference loop than the
+    baseline's machine did.
+    """
+    if "calibration" not in baseline or "calibration" not in current:
+        raise ValueError(
+            "Both runs need a calibration to normalize, rerun them with this version"
+        )
+    return current["calibration"] / baseline["calibration"]
+
+
+def compare(
+    baseline: Dict, current: Dict, threshold: float, normalize: bool = False
+) -> List[str]:
+    """
+    Lists the cases in both runs that are slower than the baseline by more
+    than the threshold, a fraction of the baseline's time. Raw timings are
+    compared unless normalize is set, in which case timings are first scaled
+    by :func:`machine_scale` so a run on a faster or slower machine can be
+    compared with the baseline.
+    """
+    before, after = baseline["results"], current["results"]
+    scale = machine_scale(baseline, current) if normalize else 1.0
+    suffix = f" after normalizing by {scale:.2f}x" if normalize else ""
+
+    regressions = []
+    for name in sorted(set(before) & set(after)):
+        change = after[name] / (before[name] * scale) - 1
+        if change > threshold:
+            regressions.append(
+                f"{name}: {before[name] * 1e6:.1f}us -> {after[name] * 1e6:.1f}us "
+                f"({change:+.0%}{suffix})"
+            )
+    return regressions
+
+
+def report(results: Dict, stream=sys.stdout) -> None:
+    width = max(map(len, results["results"]), default=0)
+    for name, seconds in results["results"].items():
+        print(f"{name:<{width}}  {seconds * 1e6:>12.1f}us", file=stream)
+
+
+def load(path: str) -> Dict:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save(results: Dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2, sort_keys=True)
+        fh.write("\n")
@@ -26,5 +26,5 @@ setup(
         "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: Implementation :: CPython",
     ],
-    extras_require={"attrs": ["attrs"]},
+    extras_require={"attrs": ["attrs"], "numpy": ["numpy"]},
 )
@@ -1,4 +1,5 @@
 from .converter import BaseConverter
+from .dynamic import schema_for
 from .exceptions import AnnotationConversionError, MarshmallowAnnotationError
 from .registry import TypeRegistry, field_factory, registry, scheme_factory
 from .scheme import AnnotationSchema, AnnotationSchemaMeta
@@ -0,0 +1,108 @@
+"""
+Command line tools, see ``python -m marshmallow_annotations --help``.
+"""
+
+import argparse
+import sys
+from importlib import import_module
+from typing import List, Optional
+
+from .codegen import render_module
+from .profiler import PHASES, profiler
+from .scheme import AnnotationSchema
+from .warmup import all_subclasses
+
+
+def _compile(args: argparse.Namespace) -> int:
+    command = " ".join(
+        ["python -m marshmallow_annotations compile"]
+        + args.references
+        + (["-o", args.output] if args.output else [])
+    )
+    source = render_module(args.references, command=command)
+
+    if args.check:
+        if args.output is None:
+            print("--check requires --output", file=sys.stderr)
+            return 2
+        try:
+            with open(args.output, encoding="utf-8") as fh:
+                current = fh.read()
+        except OSError:
+            current = None
+        if current != source:
+            print(f"{args.output} is out of date", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(source)
+    return 0
+
+
+def _report(args: argparse.Namespace) -> int:
+    profiler.reset()
+    profiler.enable()
+    try:
+        for module in args.modules:
+            import_module(module)
+        # lazy schema would otherwise not be generated at import
+        for schema in all_subclasses(AnnotationSchema):
+            schema.resolve_declared_fields()
+    finally:
+        profiler.disable()
+
+    profiles = profiler.profiles()[: args.limit]
+    width = max([len(p.target) for p in profiles] + [len("target")])
+    header = "".join(f"{phase:>12}" for phase in PHASES)
+    print(f"{'target':<{width}}{'total':>12}{header}")
+    for p in profiles:
+        phases = "".join(f"{p.phases.get(phase, 0) * 1e3:>10.2f}ms" for phase in PHASES)
+        print(f"{p.target:<{width}}{p.total * 1e3:>10.2f}ms{phases}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m marshmallow_annotations")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    compile_ = commands.add_parser(
+        "compile", help="Generate plain marshmallow schema from annotations"
+    )
+    compile_.add_argument(
+        "references",
+        nargs="+",
+        metavar="package.module:Name",
+        help="AnnotationSchema subclasses or annotated classes",
+    )
+    compile_.add_argument("-o", "--output", help="Write to this file, not stdout")
+    compile_.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if the output file is out of date",
+    )
+    compile_.set_defaults(handler=_compile)
+
+    report = commands.add_parser(
+        "report", help="Import modules and list the slowest schema to build"
+    )
+    report.add_argument("modules", nargs="+", metavar="package.module")
+    report.add_argument(
+        "-n", "--limit", type=int, default=20, help="Number of targets to list"
+    )
+    report.set_defaults(handler=_report)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
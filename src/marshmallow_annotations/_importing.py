@@ -0,0 +1,36 @@
+from importlib import import_module
+from typing import Any, Optional
+
+
+def import_reference(reference: str) -> Any:
+    """
+    Imports an object from a ``package.module:Qualified.Name`` reference.
+    """
+    module_name, sep, qualname = reference.partition(":")
+    if not sep or not module_name or not qualname:
+        raise ValueError(
+            f"Expected a reference like package.module:Name, got {reference!r}"
+        )
+
+    obj = import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def reference_of(obj: Any) -> Optional[str]:
+    """
+    Builds the ``package.module:Qualified.Name`` reference of an object, or
+    ``None`` if importing that reference wouldn't produce the same object.
+    """
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if module is None or qualname is None or "<" in qualname:
+        return None
+
+    reference = f"{module}:{qualname}"
+    try:
+        found = import_reference(reference)
+    except (ImportError, AttributeError, ValueError):
+        return None
+    return reference if found is obj else None
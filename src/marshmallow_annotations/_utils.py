@@ -0,0 +1,17 @@
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """
+    Converts a value into something hashable that compares equal for equal
+    values, raises TypeError if that isn't possible.
+    """
+    # type is part of the key so 1, 1.0 and True stay distinct
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(freeze(v) for v in value))
+    hash(value)
+    return (type(value), value)
@@ -0,0 +1,141 @@
+"""
+asyncio adapters for dumping and loading.
+
+Dumping or loading a large ``many=True`` payload on the event loop blocks
+every other task until it's done. The coroutines here process the payload in
+chunks and either hand control back to the loop between chunks or run each
+chunk in an executor.
+"""
+
+import asyncio
+from functools import partial
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+from marshmallow.exceptions import ValidationError
+from marshmallow.schema import MarshalResult, UnmarshalResult
+
+from .stream import _ArrayEncoder, _dump_chunk, chunked, offset_errors
+
+__all__ = ("async_dump", "async_load", "dump_aiter")
+
+
+async def _run(executor: Optional[Any], func: Callable[[], Any]) -> Any:
+    if executor is None:
+        result = func()
+        # let other tasks run before the next chunk
+        await asyncio.sleep(0)
+        return result
+
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, func)
+
+
+async def _process(
+    method: Callable[..., Any],
+    data: Any,
+    chunk_size: int,
+    executor: Optional[Any],
+    result_type: Callable[[Any, Any], Any],
+) -> Any:
+    results: List[Any] = []
+    errors = {}
+    offset = 0
+
+    for chunk in chunked(data, chunk_size):
+        try:
+            chunk_data, chunk_errors = await _run(
+                executor, partial(method, chunk, many=True)
+            )
+        except ValidationError as e:
+            # strict schema
+            raise ValidationError(offset_errors(e.messages, offset), data=e.data)
+
+        results.extend(chunk_data)
+        errors.update(offset_errors(chunk_errors, offset))
+        offset += len(chunk)
+
+    return result_type(results, errors)
+
+
+async def async_dump(
+    schema,
+    obj: Any,
+    many: Optional[bool] = None,
+    chunk_size: int = 1000,
+    executor: Optional[Any] = None,
+) -> MarshalResult:
+    """
+    Coroutine version of ``schema.dump``, see
+    :meth:`~marshmallow_annotations.scheme.AnnotationSchema.async_dump`.
+    """
+    many = schema.many if many is None else bool(many)
+    if not many:
+        return await _run(executor, partial(schema.dump, obj, many=False))
+    return await _process(schema.dump, obj, chunk_size, executor, MarshalResult)
+
+
+async def async_load(
+    schema,
+    data: Any,
+    many: Optional[bool] = None,
+    chunk_size: int = 1000,
+    executor: Optional[Any] = None,
+) -> UnmarshalResult:
+    """
+    Coroutine version of ``schema.load``, see
+    :meth:`~marshmallow_annotations.scheme.AnnotationSchema.async_load`.
+    """
+    many = schema.many if many is None else bool(many)
+    if not many:
+        return await _run(executor, partial(schema.load, data, many=False))
+    return await _process(schema.load, data, chunk_size, executor, UnmarshalResult)
+
+
+async def _achunked(source: Any, size: int) -> AsyncIterator[List[Any]]:
+    if not hasattr(source, "__aiter__"):
+        for chunk in chunked(source, size):
+            yield chunk
+        return
+
+    if size < 1:
+        raise ValueError(f"chunk size must be at least 1, not {size!r}")
+
+    chunk = []
+    async for item in source:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def dump_aiter(
+    schema,
+    objs: Any,
+    chunk_size: int = 1000,
+    encode: bool = False,
+    executor: Optional[Any] = None,
+) -> AsyncIterator[Any]:
+    """
+    Asynchronous version of ``dump_iter``, see
+    :meth:`~marshmallow_annotations.scheme.AnnotationSchema.dump_aiter`.
+    """
+    encoder = _ArrayEncoder(schema.opts.json_module.dumps) if encode else None
+    offset = 0
+
+    async for chunk in _achunked(objs, chunk_size):
+        data = await _run(executor, partial(_dump_chunk, schema, chunk, offset))
+        offset += len(chunk)
+
+        if encoder is None:
+            for item in data:
+                yield item
+            continue
+
+        piece = encoder.encode(data)
+        if piece:
+            yield piece
+
+    if encoder is not None:
+        yield encoder.close()
@@ -155,7 +155,7 @@ class TypeRegistry(ABC):
         pass
 
     @abstractmethod
-    def has(self, target: type) -> bool:
+    def has(self, target: type, exact: bool = False) -> bool:
         """
         Allows safely checking if a type has a companion field mapped already::
 
@@ -166,8 +166,24 @@ class TypeRegistry(ABC):
 
             int in registry     # True
             object in registry  # False
+
+        With ``exact`` only a mapping registered for the type itself counts,
+        not one it would otherwise resolve to, e.g. that of a base class.
+
+        :versionchanged: 2.5.0 Added exact
         """
         pass
 
+    @property
+    def version(self) -> Optional[int]:
+        """
+        Number that changes whenever a registration is made, allowing consumers
+        to cheaply detect changes to the registry. ``None`` means the
+        implementation doesn't track changes.
+
+        :versionchanged: 2.5.0
+        """
+        return None
+
     def __contains__(self, target: type) -> bool:  # pragma: no cover
         return self.has(target)
@@ -0,0 +1,404 @@
+"""
+Ahead of time generation of plain marshmallow schema.
+
+Runs the same conversion pipeline an
+:class:`~marshmallow_annotations.scheme.AnnotationSchema` would and renders
+the resulting fields as the source of a module of regular
+:class:`marshmallow.Schema` classes with explicit fields. Importing the
+generated module skips inspecting type hints entirely.
+"""
+
+import inspect
+import json
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from marshmallow import fields as ma_fields
+from marshmallow.base import FieldABC, SchemaABC
+from marshmallow.utils import missing
+
+from ._importing import import_reference, reference_of
+from .base import GeneratedFields
+from .converter import BaseConverter
+from .exceptions import MarshmallowAnnotationError
+from .fields import SharedNested, _nested_fields
+from .registry import registry as default_registry
+from .scheme import AnnotationSchema
+
+__all__ = ("GeneratedSchema", "plan_schema", "render_module")
+
+# constructor parameters that are stored under a different attribute name
+_PARAMETER_ATTRIBUTES = {"format": "dateformat", "cls_or_instance": "container"}
+
+# deprecated or derived constructor parameters that are handled separately
+_SKIPPED_PARAMETERS = {"self", "error", "error_messages", "allow_none"}
+
+# marshmallow's schema options with their defaults, rendered into Meta when set
+_RENDERED_OPTIONS = {
+    "fields": (),
+    "additional": (),
+    "exclude": (),
+    "strict": False,
+    "dateformat": None,
+    "ordered": False,
+    "index_errors": True,
+    "load_only": (),
+    "dump_only": (),
+}
+
+# options that can't be rendered, schema setting them are refused
+_UNRENDERED_OPTIONS = {"include": {}, "json_module": json}
+
+
+class GeneratedSchema(NamedTuple):
+    """
+    Everything needed to render a schema:
+
+    - reference: the ``package.module:Name`` the schema was generated from
+    - name: the name of the generated schema class
+    - target: the class the schema handles
+    - fields: the generated fields
+    - source: the AnnotationSchema the fields were taken from, if any
+    - constructs_target: whether loading should build instances of the target
+    - options: schema options to render into the generated schema's Meta
+    """
+
+    reference: str
+    name: str
+    target: type
+    fields: GeneratedFields
+    source: Optional[type]
+    constructs_target: bool
+    options: Dict[str, Any]
+
+
+def _converter_for(target: type):
+    if hasattr(target, "__attrs_attrs__"):
+        from .ext.attrs import AttrsConverter
+
+        return AttrsConverter, True
+
+    if issubclass(target, tuple) and hasattr(target, "_fields"):
+        from .ext.namedtuple import NamedTupleConverter
+
+        return NamedTupleConverter, True
+
+    return BaseConverter, False
+
+
+def _schema_options(schema: type, reference: str) -> Dict[str, Any]:
+    opts = schema.opts  # type: ignore
+    for name, default in _UNRENDERED_OPTIONS.items():
+        if not _equals(getattr(opts, name), default):
+            raise MarshmallowAnnotationError(
+                f"Can't render {reference}, its {name} option can't be rendered"
+            )
+    return {
+        name: getattr(opts, name)
+        for name, default in _RENDERED_OPTIONS.items()
+        if not _equals(getattr(opts, name), default)
+    }
+
+
+def _ensure_no_custom_processors(schema: AnnotationSchema, reference: str) -> None:
+    # the generated schema only knows how to construct the target, any
+    # other processor or validator would be silently dropped
+    allowed = set(schema._get_noop_processors())
+    constructor = schema._get_target_constructor()
+    if constructor is not None:
+        name = constructor.processor
+        if getattr(type(schema), name) is getattr(constructor.owner, name):
+            allowed.add(name)
+
+    custom = {n for names in schema.__processors__.values() for n in names} - allowed
+    if custom:
+        raise MarshmallowAnnotationError(
+            f"Can't render {reference}, it declares processors or validators: "
+            f"{', '.join(sorted(custom))}"
+        )
+
+
+def plan_schema(reference: str) -> GeneratedSchema:
+    """
+    Generates fields for a ``package.module:Name`` reference. The reference
+    may point at an :class:`~marshmallow_annotations.scheme.AnnotationSchema`,
+    in which case its fields and options are used, or at an annotated class,
+    which is converted with the global registry and the converter matching
+    the kind of class (attrs, NamedTuple or plain).
+    """
+    obj = import_reference(reference)
+
+    if isinstance(obj, type) and issubclass(obj, AnnotationSchema):
+        target = getattr(obj.opts, "target", None)
+        if target is None:
+            raise MarshmallowAnnotationError(f"{reference} does not declare a target")
+        schema = obj()
+        _ensure_no_custom_processors(schema, reference)
+        return GeneratedSchema(
+            reference,
+            obj.__name__,
+            target,
+            dict(obj.declared_fields),
+            obj,
+            schema._get_target_constructor() is not None,
+            _schema_options(obj, reference),
+        )
+
+    if not isinstance(obj, type):
+        raise MarshmallowAnnotationError(
+            f"{reference} is neither an AnnotationSchema nor a class"
+        )
+
+    converter_factory, constructs_target = _converter_for(obj)
+    converter = converter_factory(registry=default_registry)
+    return GeneratedSchema(
+        reference,
+        f"{obj.__name__}Schema",
+        obj,
+        converter.convert_all(obj),
+        None,
+        constructs_target,
+        {},
+    )
+
+
+def _init_parameters(cls: type) -> List[inspect.Parameter]:
+    parameters: Dict[str, inspect.Parameter] = {}
+    for klass in cls.__mro__:
+        init = klass.__dict__.get("__init__")
+        if init is None:
+            continue
+        for p in inspect.signature(init).parameters.values():
+            if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+                continue
+            parameters.setdefault(p.name, p)
+    return list(parameters.values())
+
+
+def _default_error_messages(cls: type) -> Dict[str, str]:
+    messages: Dict[str, str] = {}
+    for klass in reversed(cls.__mro__):
+        messages.update(getattr(klass, "default_error_messages", {}))
+    return messages
+
+
+def _equals(left: Any, right: Any) -> bool:
+    if left is right:
+        return True
+    try:
+        return bool(left == right)
+    except Exception:
+        return False
+
+
+class _Renderer:
+    def __init__(self, schemas: Sequence[GeneratedSchema]) -> None:
+        names: Set[str] = set()
+        for schema in schemas:
+            if schema.name in names:
+                raise MarshmallowAnnotationError(
+                    f"More than one schema would be rendered as {schema.name}"
+                )
+            names.add(schema.name)
+
+        self.imports: Dict[str, Tuple[str, str]] = {}
+        self.defined: Set[str] = set()
+        self.by_source = {s.source: s.name for s in schemas if s.source is not None}
+        self.by_target: Dict[Any, str] = {s.target: s.name for s in schemas}
+
+    def name_for(self, obj: Any, context: str) -> str:
+        reference = reference_of(obj)
+        if reference is None:
+            raise MarshmallowAnnotationError(
+                f"Can't render {obj!r} for {context}, it isn't importable"
+            )
+
+        module, qualname = reference.split(":")
+        top = qualname.split(".")[0]
+        alias = top
+        counter = 0
+        while alias in self.imports and self.imports[alias] != (module, top):
+            counter += 1
+            alias = f"{top}_{counter}"
+        self.imports[alias] = (module, top)
+        return ".".join([alias] + qualname.split(".")[1:])
+
+    def value(self, value: Any, context: str) -> str:
+        if value is missing:
+            return "missing"
+        if isinstance(value, FieldABC):
+            return self.field(value, context)
+        if isinstance(value, float) and repr(value) in ("nan", "inf", "-inf"):
+            return f"float({repr(value)!r})"
+        if value is None or isinstance(value, (bool, int, float, str, bytes)):
+            return repr(value)
+        if isinstance(value, Decimal):
+            return f"{self.name_for(Decimal, context)}({str(value)!r})"
+        if isinstance(value, (list, tuple, set, frozenset)):
+            items = [self.value(v, context) for v in value]
+            if isinstance(value, list):
+                return f"[{', '.join(items)}]"
+            if isinstance(value, tuple):
+                return f"({', '.join(items)}{',' if len(items) == 1 else ''})"
+            return f"{type(value).__name__}([{', '.join(items)}])"
+        if isinstance(value, dict):
+            items = [
+                f"{self.value(k, context)}: {self.value(v, context)}"
+                for k, v in value.items()
+            ]
+            return f"{{{', '.join(items)}}}"
+        return self.name_for(value, context)
+
+    def generated_name(self, nested: Any) -> Optional[str]:
+        if isinstance(nested, type) and issubclass(nested, SchemaABC):
+            if nested in self.by_source:
+                return self.by_source[nested]
+            target = getattr(getattr(nested, "opts", None), "target", None)
+            return self.by_target.get(target)
+
+        if isinstance(nested, str):
+            for source, name in self.by_source.items():
+                if source.__name__ == nested:
+                    return name
+        return None
+
+    def nested(self, nested: Any, context: str) -> str:
+        name = self.generated_name(nested)
+        if name is None:
+            return self.value(nested, context)
+        # referring to the class directly avoids ambiguous lookups in
+        # marshmallow's class registry, which also holds the originals
+        return name if name in self.defined else repr(name)
+
+    def constructor(self, cls: type, context: str) -> str:
+        if cls is SharedNested:
+            # only differs from Nested in how instances are shared
+            return "fields.Nested"
+        if getattr(ma_fields, cls.__name__, None) is cls:
+            return f"fields.{cls.__name__}"
+        return self.name_for(cls, context)
+
+    def arguments(self, field: FieldABC, context: str) -> List[str]:
+        args: List[str] = []
+        for p in _init_parameters(type(field)):
+            if p.name in _SKIPPED_PARAMETERS:
+                continue
+            attribute = _PARAMETER_ATTRIBUTES.get(p.name, p.name)
+            if not hasattr(field, attribute):
+                continue
+            value = getattr(field, attribute)
+
+            if p.name == "places" and value is not None:
+                value = -value.as_tuple().exponent
+            if p.name == "nested":
+                rendered = self.nested(value, context)
+            else:
+                rendered = self.value(value, f"{context}.{p.name}")
+
+            if p.default is p.empty:
+                args.append(rendered)
+            elif not _equals(value, p.default):
+                args.append(f"{p.name}={rendered}")
+        return args
+
+    def field(self, field: FieldABC, context: str) -> str:
+        cls = type(field)
+        constructor = self.constructor(cls, context)
+        args = self.arguments(field, context)
+
+        if field.allow_none is not (field.missing is None):
+            args.append(f"allow_none={field.allow_none!r}")
+
+        defaults = _default_error_messages(cls)
+        overrides = {
+            k: v for k, v in field.error_messages.items() if defaults.get(k) != v
+        }
+        if overrides:
+            args.append(f"error_messages={self.value(overrides, context)}")
+
+        for k, v in field.metadata.items():
+            args.append(f"{k}={self.value(v, f'{context}.{k}')}")
+
+        return f"{constructor}({', '.join(args)})"
+
+    def schema(self, schema: GeneratedSchema) -> List[str]:
+        lines = [f"class {schema.name}(Schema):"]
+        for name, field in schema.fields.items():
+            lines.append(f"    {name} = {self.field(field, f'{schema.name}.{name}')}")
+
+        if schema.options:
+            if len(lines) > 1:
+                lines.append("")
+            lines.append("    class Meta:")
+            for name, value in schema.options.items():
+                context = f"{schema.name}.Meta.{name}"
+                lines.append(f"        {name} = {self.value(value, context)}")
+
+        if schema.constructs_target:
+            target = self.name_for(schema.target, schema.name)
+            lines += [
+                "",
+                "    @post_load",
+                "    def make_object(self, data):",
+                f"        return {target}(**data)",
+            ]
+        if len(lines) == 1:
+            lines.append("    pass")
+        self.defined.add(schema.name)
+        return lines
+
+    def dependencies(self, schema: GeneratedSchema) -> Set[str]:
+        found: Set[str] = set()
+        for field in _nested_fields(schema.fields.values()):
+            name = self.generated_name(field.nested)
+            if name is not None and name != schema.name:
+                found.add(name)
+        return found
+
+    def ordered(self, schemas: Sequence[GeneratedSchema]) -> List[GeneratedSchema]:
+        # schema are emitted after the schema they nest where possible,
+        # cycles fall back to referring to the schema by name
+        remaining = list(schemas)
+        ordered: List[GeneratedSchema] = []
+        emitted: Set[str] = set()
+        while remaining:
+            ready = next(
+                (s for s in remaining if self.dependencies(s) <= emitted), remaining[0]
+            )
+            remaining.remove(ready)
+            ordered.append(ready)
+            emitted.add(ready.name)
+        return ordered
+
+
+def render_module(references: Sequence[str], command: Optional[str] = None) -> str:
+    """
+    Renders the source of a module containing a plain marshmallow schema for
+    every reference, see :func:`plan_schema` for what a reference may be.
+
+    Nested fields that refer to another schema being rendered refer to the
+    generated schema instead. Values that can't be expressed as source -- such
+    as lambdas or classes defined inside of functions -- raise
+    :class:`~marshmallow_annotations.exceptions.MarshmallowAnnotationError`.
+    """
+    schemas = [plan_schema(r) for r in references]
+    renderer = _Renderer(schemas)
+    bodies = [renderer.schema(s) for s in renderer.ordered(schemas)]
+
+    header = ['"""', "Generated by marshmallow-annotations from:", ""]
+    header += [f"    {s.reference}" for s in schemas]
+    if command is not None:
+        header += ["", "Do not edit, regenerate with:", "", f"    {command}"]
+    header += ['"""', "", "from marshmallow import Schema, fields, missing, post_load"]
+
+    imports = sorted(renderer.imports.items(), key=lambda i: (i[1], i[0]))
+    if imports:
+        header.append("")
+    for alias, (module, name) in imports:
+        suffix = f" as {alias}" if alias != name else ""
+        header.append(f"from {module} import {name}{suffix}")
+
+    lines = header
+    for body in bodies:
+        lines += ["", ""] + body
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,150 @@
+"""
+Column oriented dumping of homogeneous collections.
+
+Instead of a dictionary per object, :func:`dump_columns` produces a list per
+field. Values of each column are pulled from every object in a single pass
+and columns of plain values -- strings, numbers, booleans, UUIDs and dates of
+exactly the expected type -- are formatted in bulk rather than by calling the
+field for every value.
+"""
+
+from datetime import date
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+from uuid import UUID
+
+from marshmallow import fields
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
+from marshmallow.exceptions import ValidationError
+from marshmallow.utils import missing
+
+from .exceptions import MarshmallowAnnotationError
+
+__all__ = ("dump_columns",)
+
+# Fields whose values can be formatted in bulk, mapped to the exact type of
+# values formatted that way and how, None meaning a value is its own output.
+# Anything else goes through Field.serialize one value at a time.
+_BULK_FORMAT: Dict[type, Tuple[type, Optional[Callable[[Any], Any]]]] = {
+    fields.String: (str, None),
+    fields.Integer: (int, None),
+    fields.Float: (float, None),
+    fields.Boolean: (bool, None),
+    fields.UUID: (UUID, str),
+    fields.Date: (date, date.isoformat),
+}
+
+# columns of these fields become NumPy arrays with numpy=True
+_NUMERIC = (fields.Integer, fields.Float, fields.Boolean)
+
+
+def _getter(schema, name: str, field, objs: Sequence[Any]) -> Callable[[Any], Any]:
+    attr = field.attribute if field.attribute is not None else name
+    target = getattr(schema.opts, "target", None)
+    positions = getattr(target, "_fields", None)
+    if (
+        positions is not None
+        and attr in positions
+        and all(obj.__class__ is target for obj in objs)
+    ):
+        return itemgetter(positions.index(attr))
+    return attrgetter(attr)
+
+
+def _bulk_column(schema, name: str, field, objs: Sequence[Any]) -> Optional[list]:
+    spec = _BULK_FORMAT.get(type(field))
+    if spec is None or getattr(field, "as_string", False):
+        return None
+
+    kind, format_ = spec
+    try:
+        values = list(map(_getter(schema, name, field, objs), objs))
+    except (AttributeError, IndexError, KeyError, TypeError):
+        return None
+
+    if not all(v is None or v.__class__ is kind for v in values):
+        return None
+    if format_ is None:
+        return values
+    return [None if v is None else format_(v) for v in values]
+
+
+def _serialized_column(
+    schema, name: str, field, objs: Sequence[Any], errors: Dict[int, Any]
+) -> list:
+    key = field.dump_to or name
+    column = []
+    for i, obj in enumerate(objs):
+        try:
+            value = field.serialize(name, obj, accessor=schema.get_attribute)
+        except ValidationError as e:
+            errors.setdefault(i, {})[key] = e.messages
+            value = None
+        column.append(None if value is missing else value)
+    return column
+
+
+def _transposed(schema, objs: Sequence[Any]) -> Dict[str, list]:
+    keys = [
+        field.dump_to or name
+        for name, field in schema.fields.items()
+        if not field.load_only
+    ]
+    rows, errors = schema.dump(objs, many=True)
+    if errors:
+        raise ValidationError(errors, data=rows)
+    return {key: [row.get(key) for row in rows] for key in keys}
+
+
+def _as_arrays(schema, columns: Dict[str, list]) -> Dict[str, Any]:
+    try:
+        import numpy
+    except ImportError:
+        raise MarshmallowAnnotationError("numpy=True requires NumPy to be installed")
+
+    numeric = {
+        field.dump_to or name
+        for name, field in schema.fields.items()
+        if isinstance(field, _NUMERIC)
+    }
+    return {
+        key: numpy.asarray(column) if key in numeric and None not in column else column
+        for key, column in columns.items()
+    }
+
+
+def _has_dump_processors(schema) -> bool:
+    ignored = schema._get_noop_processors()
+    return any(
+        name not in ignored
+        for tag in (PRE_DUMP, POST_DUMP)
+        for pass_many in (False, True)
+        for name in schema.__processors__.get((tag, pass_many), ())
+    )
+
+
+def dump_columns(schema, objs: Sequence[Any], numpy: bool = False) -> Dict[str, Any]:
+    """
+    Dumps objects into a dictionary of columns, see
+    :meth:`~marshmallow_annotations.scheme.AnnotationSchema.dump_columns`.
+    """
+    objs = objs if isinstance(objs, list) else list(objs)
+
+    if _has_dump_processors(schema):
+        # processors expect rows, the regular result is transposed instead
+        columns = _transposed(schema, objs)
+    else:
+        columns = {}
+        errors: Dict[int, Any] = {}
+        for name, field in schema.fields.items():
+            if field.load_only:
+                continue
+            column = _bulk_column(schema, name, field, objs)
+            if column is None:
+                column = _serialized_column(schema, name, field, objs, errors)
+            columns[field.dump_to or name] = column
+
+        if errors:
+            raise ValidationError(errors, data=columns)
+
+    return _as_arrays(schema, columns) if numpy else columns
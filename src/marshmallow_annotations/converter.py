@@ -1,15 +1,33 @@
-from typing import AbstractSet, Union, get_type_hints
+import sys
+from time import perf_counter
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    get_type_hints,
+)
+from weakref import WeakKeyDictionary
 
 import marshmallow
+from marshmallow.base import FieldABC
 
 from ._compat import _get_base, _is_class_var
 from .base import (
     AbstractConverter,
     ConfigOptions,
+    FieldFactory,
     GeneratedFields,
     NamedConfigs,
     TypeRegistry,
 )
+from ._utils import freeze
+from .profiler import profiler
 from .registry import registry
 
 NoneType = type(None)
@@ -32,10 +50,189 @@ def _extract_optional(typehint):
     return optional_types[0]
 
 
+def _is_annotated_class(typehint):
+    return isinstance(typehint, type) and any(
+        "__annotations__" in vars(cls) for cls in typehint.__mro__[:-1]
+    )
+
+
 def should_include(typehint):
     return not _is_class_var(typehint)
 
 
+# resolved hints for every class seen so far, a parent shared by many targets
+# only has its (potentially string) annotations evaluated once
+_type_hints_cache: "WeakKeyDictionary[type, Dict[str, Any]]" = WeakKeyDictionary()
+
+
+def _own_type_hints(cls: type) -> Dict[str, Any]:
+    annotations = cls.__dict__.get("__annotations__")
+    if not isinstance(annotations, dict) or not annotations:
+        return {}
+
+    # get_type_hints walks the entire MRO of a class, a stand in holding only
+    # the class' own annotations keeps it from evaluating those of its bases.
+    # Names are looked up in the class' module first and its namespace second,
+    # same as get_type_hints does for the class itself.
+    module = sys.modules.get(cls.__module__)
+    stand_in = type(cls.__name__, (), {"__annotations__": dict(annotations)})
+    return get_type_hints(
+        stand_in,
+        globalns=dict(vars(cls)),
+        localns=getattr(module, "__dict__", {}),
+    )
+
+
+def get_cached_type_hints(cls: type) -> Dict[str, Any]:
+    """
+    Resolves the type hints a class declares itself, without those of its
+    bases, and caches them. Hints that fail to resolve, e.g. forward
+    references to classes that don't exist yet, aren't cached and will be
+    attempted again on the next call.
+
+    The returned dictionary is shared and must not be modified.
+    """
+    try:
+        return _type_hints_cache[cls]
+    except KeyError:
+        pass
+
+    hints = _own_type_hints(cls)
+    _type_hints_cache[cls] = hints
+    return hints
+
+
+def invalidate_type_hints(target: type = None) -> None:
+    """
+    Drops cached type hints for the target and every class derived from it,
+    or the entire cache if no target is provided. Needed only if annotations
+    are modified after a schema has been generated for them.
+    """
+    if target is None:
+        _type_hints_cache.clear()
+        return
+
+    for cls in list(_type_hints_cache.keys()):
+        if target in cls.__mro__:
+            _type_hints_cache.pop(cls, None)
+
+
+_FIELD_CACHE_SIZE = 4096
+
+# typehint -> (optional, base, subtypes), only depends on the typehint
+_classifications: Dict[Any, Tuple[bool, Any, Tuple[Any, ...]]] = {}
+
+# prototypes of fields built by stateless factories, whose fields only depend
+# on the options they're passed
+_stateless_prototypes: Dict[Any, "_FieldPrototype"] = {}
+
+# prototypes of fields built by any other factory may depend on the contents of
+# the registry, these are kept per registry and dropped whenever its version
+# changes. Registries without a version aren't cached.
+_registry_prototypes: "WeakKeyDictionary[Any, Tuple[int, Dict[Any, Any]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _bounded(cache: Dict[Any, Any]) -> Dict[Any, Any]:
+    if len(cache) > _FIELD_CACHE_SIZE:
+        cache.clear()
+    return cache
+
+
+def _prototype_cache(registry: TypeRegistry, factory: Any) -> Optional[Dict]:
+    if getattr(factory, "__stateless__", False):
+        return _bounded(_stateless_prototypes)
+
+    version = getattr(registry, "version", None)
+    if version is None:
+        return None
+
+    try:
+        entry = _registry_prototypes.get(registry)
+        if entry is None or entry[0] != version:
+            entry = _registry_prototypes[registry] = (version, {})
+    except TypeError:
+        return None
+    return _bounded(entry[1])
+
+
+def _options_key(kwargs: Dict[str, Any]) -> Any:
+    # options are almost always flat and hashable, skip recursing for those
+    try:
+        key = tuple([(k, type(v), v) for k, v in sorted(kwargs.items())])
+        hash(key)
+        return key
+    except TypeError:
+        return freeze(kwargs)
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, FieldABC):
+        return _FieldPrototype(value).clone()
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+class _FieldPrototype:
+    """
+    Produces copies of a field without running its constructor. Fields inside
+    the field and mutable containers are copied as well.
+    """
+
+    __slots__ = ("cls", "state", "mutable")
+
+    def __init__(self, field: FieldABC) -> None:
+        self.cls = type(field)
+        self.state = field.__dict__.copy()
+        self.mutable = [
+            k for k, v in self.state.items() if isinstance(v, (FieldABC, list, dict))
+        ]
+
+    def clone(self) -> FieldABC:
+        state = self.state.copy()
+        for k in self.mutable:
+            state[k] = _copy_value(state[k])
+        if "_creation_index" in state:
+            # keeps ordered schema ordered by declaration
+            state["_creation_index"] = marshmallow.fields.Field._creation_index
+            marshmallow.fields.Field._creation_index += 1
+
+        clone = object.__new__(self.cls)
+        clone.__dict__ = state
+        return clone
+
+
+class FieldPlan(NamedTuple):
+    """
+    How a field was generated from a typehint:
+
+    - name: the attribute the field is generated for
+    - typehint: the typehint as it was declared
+    - optional: whether ``Optional[...]`` was unwrapped
+    - base: the type the field factory was looked up with, after unwrapping
+      ``Optional`` and reducing generics to their base
+    - subtypes: the arguments of a generic typehint
+    - factory: the field factory chosen by the registry
+    - kwargs: the options handed to the factory, after pre and postprocessing
+    - field: the generated field
+    - duration: seconds spent classifying and generating the field
+    """
+
+    name: Optional[str]
+    typehint: Any
+    optional: bool
+    base: Any
+    subtypes: Tuple[Any, ...]
+    factory: FieldFactory
+    kwargs: Dict[str, Any]
+    field: Optional[FieldABC] = None
+    duration: Optional[float] = None
+
+
 class BaseConverter(AbstractConverter):
     """
     Default implementation of :class:`~marshmallow_annotations.base.AbstractConverter`.
@@ -48,10 +245,31 @@ class BaseConverter(AbstractConverter):
 
     :versionchanged: 2.2.0 Added non-public hooks ``_preprocess_typehint``
         and ``_postprocess_typehint``
+
+    :versionchanged: 2.5.0 Added ``explain`` and non-public hook ``_plan_field``
+
+    :versionchanged: 2.5.0 Typehint classification is cached and fields for
+        identical hints and options are cloned from a prototype instead of
+        calling the field factory again. Factories marked ``__stateless__``,
+        such as those made by
+        :func:`~marshmallow_annotations.registry.field_factory`, share
+        prototypes across registries; all others are dropped whenever the
+        registry changes.
+
+    :versionchanged: 2.5.0 Added ``auto_nested``, called with annotated
+        classes the registry has no field factory for. It's expected to
+        register one, usually a schema for the class, before the registry is
+        consulted again.
     """
 
-    def __init__(self, *, registry: TypeRegistry = registry) -> None:
+    def __init__(
+        self,
+        *,
+        registry: TypeRegistry = registry,
+        auto_nested: Callable[[type], None] = None
+    ) -> None:
         self.registry = registry
+        self.auto_nested = auto_nested
 
     def convert(
         self,
@@ -75,18 +293,101 @@ class BaseConverter(AbstractConverter):
         configs = configs if configs is not None else {}
         for k, default in self._get_field_defaults(target).items():
             configs[k] = {"missing": default, **configs.get(k, {})}
-        return {
-            k: self.convert(v, configs.get(k, {}), field_name=k, target=target)
-            for k, v in self._get_type_hints(target, ignore)
-        }
+
+        with profiler.building(target):
+            timer = profiler.timer()
+            hints = self._get_type_hints(target, ignore)
+            timer.stop(target, "hints")
+
+            return {
+                k: self.convert(v, configs.get(k, {}), field_name=k, target=target)
+                for k, v in hints
+            }
 
     def is_scheme(self, typehint: type) -> bool:
-        constructor = self.registry.get(typehint)
+        constructor = self._get_factory(typehint)
         return getattr(constructor, "__is_scheme__", False)
 
+    def explain(
+        self,
+        target: type,
+        ignore: AbstractSet[str] = frozenset([]),  # noqa
+        configs: NamedConfigs = None,
+    ) -> List["FieldPlan"]:
+        """
+        Converts the target's type hints like
+        :meth:`~marshmallow_annotations.converter.BaseConverter.convert_all`
+        does, but returns how each field was arrived at::
+
+            for plan in converter.explain(Artist):
+                print(plan.name, plan.typehint, plan.factory, plan.duration)
+
+        :versionchanged: 2.5.0
+        """
+        configs = {k: dict(v) for k, v in (configs or {}).items()}
+        for k, default in self._get_field_defaults(target).items():
+            configs[k] = {"missing": default, **configs.get(k, {})}
+
+        plans = []
+        for name, typehint in self._get_type_hints(target, ignore):
+            start = perf_counter()
+            plan = self._plan_field(
+                typehint, configs.get(name, {}), field_name=name, target=target
+            )
+            # factories may modify the options they're handed
+            field = plan.factory(self, plan.subtypes, dict(plan.kwargs))
+            duration = perf_counter() - start
+            plans.append(plan._replace(field=field, duration=duration))
+        return plans
+
     def _field_from_typehint(
         self, typehint, kwargs=None, *, field_name: str = None, target: type = None
     ):
+        plan = self._plan_field(typehint, kwargs, field_name=field_name, target=target)
+
+        timer = profiler.timer()
+        field = self._build_field(plan)
+        # subtypes converted by a factory are part of the outer factory call
+        if target is not None:
+            timer.stop(target, "factory")
+        return field
+
+    def _build_field(self, plan: "FieldPlan") -> FieldABC:
+        # identical hints with identical options produce identical fields, so
+        # the factory only runs once and later fields are cloned from the first
+        cache = _prototype_cache(self.registry, plan.factory)
+        key = None
+        if cache is not None:
+            try:
+                key = (
+                    type(self),
+                    plan.factory,
+                    plan.base,
+                    plan.subtypes,
+                    _options_key(plan.kwargs),
+                )
+                prototype = cache.get(key)
+            except TypeError:
+                key = prototype = None
+            if prototype is not None:
+                return prototype.clone()
+
+        field = plan.factory(self, plan.subtypes, plan.kwargs)
+        if key is not None and isinstance(field, FieldABC):
+            prototype = cache[key] = _FieldPrototype(field)
+            return prototype.clone()
+        return field
+
+    def _plan_field(
+        self, typehint, kwargs=None, *, field_name: str = None, target: type = None
+    ) -> "FieldPlan":
+        """
+        Non-public hookpoint that classifies a typehint and settles on the
+        field factory and options used to build its field.
+
+        :versionchanged: 2.5.0
+        """
+        original = typehint
         # need that immutable dict in the stdlib pls
         kwargs = kwargs if kwargs is not None else {}
         self._preprocess_typehint(typehint, kwargs, field_name, target)
@@ -95,11 +396,53 @@ class BaseConverter(AbstractConverter):
         allow_none = False
         required = True
         missing = marshmallow.missing
+        optional, typehint, subtypes = self._classify(typehint)
 
-        if _is_optional(typehint):
+        if optional:
             allow_none = True
             required = False
             missing = None
+
+        kwargs.setdefault("allow_none", allow_none)
+        kwargs.setdefault("required", required)
+        kwargs.setdefault("missing", missing)
+
+        self._postprocess_typehint(typehint, kwargs, field_name, target)
+
+        timer = profiler.timer()
+        factory = self._get_factory(typehint)
+        timer.stop(target, "registry")
+
+        return FieldPlan(
+            field_name, original, optional, typehint, subtypes, factory, kwargs
+        )
+
+    def _get_factory(self, typehint):
+        if self.auto_nested is not None and self._lacks_schema(typehint):
+            self.auto_nested(typehint)
+        return self.registry.get(typehint)
+
+    def _lacks_schema(self, typehint):
+        registry = self.registry
+        if not _is_annotated_class(typehint) or registry.has(typehint, exact=True):
+            return False
+        if not registry.has(typehint):
+            return True
+        # a schema registered for a base class doesn't know the subclass'
+        # fields, other factories, e.g. for str or datetime, still apply
+        return getattr(registry.get(typehint), "__is_scheme__", False)
+
+    def _classify(self, typehint):
+        # Optional unwrapping and reducing generics to their base only
+        # depend on the typehint itself
+        original = typehint
+        try:
+            return _classifications[typehint]
+        except (KeyError, TypeError):
+            pass
+
+        optional = _is_optional(typehint)
+        if optional:
             typehint = _extract_optional(typehint)
 
         # set this after optional check
@@ -108,13 +451,12 @@ class BaseConverter(AbstractConverter):
         if subtypes != ():
             typehint = _get_base(typehint)
 
-        kwargs.setdefault("allow_none", allow_none)
-        kwargs.setdefault("required", required)
-        kwargs.setdefault("missing", missing)
-
-        self._postprocess_typehint(typehint, kwargs, field_name, target)
-        field_constructor = self.registry.get(typehint)
-        return field_constructor(self, subtypes, kwargs)
+        classification = (optional, typehint, subtypes)
+        try:
+            _bounded(_classifications)[original] = classification
+        except TypeError:
+            pass
+        return classification
 
     def _get_type_hints(self, item, ignore):
         """
@@ -122,10 +464,13 @@ class BaseConverter(AbstractConverter):
 
         :versionchanged: 2.2.0 Push filtering of typehints into this method,
             return type is now Iterable[Tuple[str, type]]
+
+        :versionchanged: 2.5.0 Resolved hints are cached per class, see
+            :func:`~marshmallow_annotations.converter.invalidate_type_hints`
         """
         hints = {}
         for parent in item.__mro__[::-1]:
-            hints.update(get_type_hints(parent))
+            hints.update(get_cached_type_hints(parent))
         return [
             (k, v) for (k, v) in hints.items() if k not in ignore and should_include(v)
         ]
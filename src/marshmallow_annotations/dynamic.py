@@ -0,0 +1,132 @@
+"""
+Schema created on demand for arbitrary targets.
+"""
+
+from collections import OrderedDict
+from threading import RLock
+from typing import Any, Optional, Tuple
+from weakref import WeakValueDictionary, ref
+
+from ._utils import freeze
+from .scheme import AnnotationSchema
+
+__all__ = ("schema_for", "instance_for", "clear_schema_cache")
+
+# schema classes recently asked for are kept alive, beyond that a schema is
+# reused for as long as something else still references it
+_MAXSIZE = 256
+
+_lock = RLock()
+_recent: "OrderedDict[Tuple[Any, Any], type]" = OrderedDict()
+_alive: "WeakValueDictionary[Tuple[Any, Any], type]" = WeakValueDictionary()
+
+
+def _default_base(target: type) -> type:
+    if hasattr(target, "__attrs_attrs__"):
+        from .ext.attrs import AttrsSchema
+
+        return AttrsSchema
+
+    if issubclass(target, tuple) and hasattr(target, "_fields"):
+        from .ext.namedtuple import NamedTupleSchema
+
+        return NamedTupleSchema
+
+    return AnnotationSchema
+
+
+def _build(target: type, base: type, opts: dict) -> type:
+    meta = dict(opts)
+    meta["target"] = target
+    if isinstance(meta.get("Fields"), dict):
+        meta["Fields"] = type("Fields", (), meta["Fields"])
+
+    # an empty name keeps marshmallow from adding the class to its class
+    # registry, which would grow with every dynamically created schema
+    schema: Any = type(base)("", (base,), {"Meta": type("Meta", (), meta)})
+    schema.__name__ = schema.__qualname__ = f"{target.__name__}Schema"
+    schema.__module__ = target.__module__
+    schema.__schema_for__ = target
+    # lets the schema be created again elsewhere, e.g. in another process
+    schema._schema_for_options = (base, opts)
+    return schema
+
+
+def schema_for(target: type, *, base: Optional[type] = None, **opts: Any) -> type:
+    """
+    Returns a schema class for the target, creating it the first time a target
+    and set of options is seen::
+
+        from marshmallow_annotations.dynamic import schema_for
+
+        schema_for(Artist)().dump(artist)
+        schema_for(Artist, converter_factory=MyConverter, lazy=True)
+
+
+    Any keyword argument is used as an option on the schema's Meta, ``Fields``
+    may be given as a dictionary. ``base`` defaults to
+    :class:`~marshmallow_annotations.ext.attrs.AttrsSchema` for attrs classes,
+    :class:`~marshmallow_annotations.ext.namedtuple.NamedTupleSchema` for
+    named tuples and :class:`~marshmallow_annotations.scheme.AnnotationSchema`
+    otherwise.
+
+    The most recently used schema are cached, targets aren't kept alive beyond
+    that. Created schema aren't added to marshmallow's class registry and
+    carry the target they were made for as ``__schema_for__``. Options that
+    can't be hashed, such as validators that define ``__eq__`` but not
+    ``__hash__``, result in a new schema on every call.
+    """
+    if base is None:
+        base = _default_base(target)
+
+    try:
+        key: Any = (ref(target), base, freeze(opts))
+        hash(key)
+    except TypeError:
+        return _build(target, base, opts)
+
+    with _lock:
+        schema = _recent.get(key)
+        if schema is None:
+            schema = _alive.get(key)
+        if schema is None:
+            schema = _build(target, base, opts)
+            _alive[key] = schema
+
+        _recent[key] = schema
+        _recent.move_to_end(key)
+        while len(_recent) > _MAXSIZE:
+            _recent.popitem(last=False)
+    return schema
+
+
+def instance_for(target: type, *, base: Optional[type] = None, **opts: Any) -> Any:
+    """
+    Returns an instance of the schema :func:`schema_for` returns for the same
+    arguments, created with default arguments and shared by every caller::
+
+        instance_for(Artist).dump(artist)
+
+
+    The instance lives as long as its schema class does. Since it's shared, it
+    must not be modified, e.g. by setting its context; create an instance of
+    your own for that.
+    """
+    schema: Any = schema_for(target, base=base, **opts)
+    instance = schema.__dict__.get("_schema_for_instance")
+    if instance is None:
+        with _lock:
+            instance = schema.__dict__.get("_schema_for_instance")
+            if instance is None:
+                instance = schema()
+                schema._schema_for_instance = instance
+    return instance
+
+
+def clear_schema_cache() -> None:
+    """
+    Forgets every schema created by :func:`schema_for`.
+    """
+    with _lock:
+        _recent.clear()
+        _alive.clear()
@@ -6,6 +6,7 @@ from marshmallow import missing, post_load
 
 from ..base import GeneratedFields, NamedConfigs
 from ..exceptions import AnnotationConversionError
+from ..marshalling import TargetConstructor
 from ..scheme import AnnotationSchema, BaseConverter
 
 __all__ = ("AttrsConverter", "AttrsSchema")
@@ -116,3 +117,8 @@ class AttrsSchema(AnnotationSchema):
     @post_load
     def make_object(self, data):
         return self.opts.target(**data)
+
+    def _get_target_constructor(self):
+        target = self.opts.target
+        arguments = [a.name for a in target.__attrs_attrs__ if a.init]
+        return TargetConstructor("make_object", target, arguments, False, AttrsSchema)
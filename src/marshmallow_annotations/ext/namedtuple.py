@@ -2,6 +2,7 @@
 
 import marshmallow
 
+from marshmallow_annotations.marshalling import TargetConstructor
 from marshmallow_annotations.scheme import (
     AnnotationSchema,
     AnnotationSchemaOpts,
@@ -45,6 +46,17 @@ class NamedTupleSchema(AnnotationSchema):
         """Post load, deserialize to target namedtuple class."""
         return self.opts.target(**data)
 
+    def _get_target_constructor(self):
+        target = self.opts.target
+        return TargetConstructor(
+            "make_namedtuple", target, target._fields, True, NamedTupleSchema
+        )
+
+    def _get_noop_processors(self):
+        if self.opts.dump_default_fields:
+            return frozenset(["remove_optional"])
+        return frozenset()
+
     @marshmallow.post_dump
     def remove_optional(self, data):
         """Post dump, strip default fields from serialized output."""
@@ -0,0 +1,167 @@
+"""
+Fields and registrations for NumPy scalars and arrays.
+
+Arrays are never handled an element at a time in Python: they're dumped with
+``tolist()`` or as the base64 of their raw buffer, and loaded with
+``numpy.asarray`` or ``numpy.frombuffer``.
+"""
+
+from base64 import b64decode, b64encode
+from binascii import Error as Base64Error
+from typing import Any, Dict, Generic, Tuple, TypeVar
+
+import numpy
+
+from marshmallow import fields
+from marshmallow.base import FieldABC
+
+from ..base import AbstractConverter, FieldFactory, TypeRegistry
+from ..registry import registry as default_registry
+
+__all__ = ("Array", "NDArray", "Scalar", "register_numpy")
+
+DType = TypeVar("DType")
+
+_SCALAR_TYPES = (
+    numpy.bool_,
+    numpy.int8,
+    numpy.int16,
+    numpy.int32,
+    numpy.int64,
+    numpy.uint8,
+    numpy.uint16,
+    numpy.uint32,
+    numpy.uint64,
+    numpy.float16,
+    numpy.float32,
+    numpy.float64,
+)
+
+_ENCODINGS = ("list", "base64")
+
+
+class NDArray(Generic[DType]):
+    """
+    Annotation for a :class:`numpy.ndarray` of a specific dtype, e.g.
+    ``NDArray[numpy.float32]``. A bare ``NDArray`` or ``numpy.ndarray``
+    annotation leaves the dtype up to NumPy.
+
+    This class is only meant for annotations and is never instantiated.
+    """
+
+
+class Scalar(fields.Field):
+    """
+    Field for NumPy scalars, dumped as the equivalent Python value and loaded
+    as an instance of ``dtype``.
+    """
+
+    default_error_messages = {"invalid": "Not a valid {dtype} value."}
+
+    def __init__(self, dtype, **kwargs):
+        super().__init__(**kwargs)
+        self.dtype = numpy.dtype(dtype)
+
+    def _serialize(self, value, attr, obj):
+        if value is None:
+            return None
+        return self.dtype.type(value).item()
+
+    def _deserialize(self, value, attr, data):
+        # numpy.bool_ considers every non empty string true
+        if self.dtype.kind == "b" and not isinstance(value, (bool, numpy.bool_)):
+            self.fail("invalid", dtype=self.dtype.name)
+        try:
+            return self.dtype.type(value)
+        except (TypeError, ValueError, OverflowError):
+            self.fail("invalid", dtype=self.dtype.name)
+
+
+class Array(fields.Field):
+    """
+    Field for :class:`numpy.ndarray`.
+
+    With the default ``encoding="list"`` arrays are dumped as (nested) lists.
+    ``encoding="base64"`` dumps the raw little endian buffer of the array as
+    base64 instead, which is far more compact for large numeric arrays but
+    requires a ``dtype`` and only round trips one dimensional arrays.
+
+    :param dtype: dtype arrays are converted to, optional for lists
+    :param encoding: either ``"list"`` or ``"base64"``
+    """
+
+    default_error_messages = {
+        "invalid": "Not a valid array.",
+        "invalid_base64": "Not a valid base64 encoded {dtype} array.",
+    }
+
+    def __init__(self, dtype=None, encoding: str = "list", **kwargs):
+        if encoding not in _ENCODINGS:
+            raise ValueError(f"encoding must be one of {_ENCODINGS!r}")
+        self.dtype = None if dtype is None else numpy.dtype(dtype)
+        self._wire_dtype: Any = None
+        if encoding == "base64":
+            if self.dtype is None or self.dtype.hasobject:
+                raise ValueError("base64 encoding requires a non object dtype")
+            self._wire_dtype = self.dtype.newbyteorder("<")
+        super().__init__(**kwargs)
+        self.encoding = encoding
+
+    def _serialize(self, value, attr, obj):
+        if value is None:
+            return None
+        if self.encoding == "list":
+            return numpy.asarray(value, dtype=self.dtype).tolist()
+        array = numpy.ascontiguousarray(value, dtype=self._wire_dtype)
+        return b64encode(array.tobytes()).decode("ascii")
+
+    def _deserialize(self, value, attr, data):
+        if self.encoding == "list":
+            if not isinstance(value, (list, tuple)):
+                self.fail("invalid")
+            try:
+                return numpy.asarray(value, dtype=self.dtype)
+            except (TypeError, ValueError):
+                self.fail("invalid")
+
+        try:
+            raw = b64decode(value, validate=True)
+            # frombuffer is a read only view of raw, astype gives a writable
+            # array in native byte order
+            return numpy.frombuffer(raw, dtype=self._wire_dtype).astype(self.dtype)
+        except (TypeError, ValueError, Base64Error):
+            self.fail("invalid_base64", dtype=self._wire_dtype.name)
+
+
+def _scalar_factory(scalar: type) -> FieldFactory:
+    def _(
+        converter: AbstractConverter, subtypes: Tuple[type], opts: Dict[str, Any]
+    ) -> FieldABC:
+        return Scalar(scalar, **opts)
+
+    _.__name__ = f"{scalar.__name__}FieldFactory"
+    _.__stateless__ = True  # type: ignore
+    return _
+
+
+def _array_factory(
+    converter: AbstractConverter, subtypes: Tuple[type], opts: Dict[str, Any]
+) -> FieldABC:
+    opts.setdefault("dtype", subtypes[0] if subtypes else None)
+    return Array(**opts)
+
+
+# the field only depends on the dtype, which is part of the subtypes, and opts
+_array_factory.__stateless__ = True  # type: ignore
+
+
+def register_numpy(registry: TypeRegistry = default_registry) -> None:
+    """
+    Registers fields for ``numpy.ndarray``,
+    :class:`~marshmallow_annotations.ext.numpy.NDArray` and the fixed size
+    boolean, integer and float scalar types with the registry.
+    """
+    registry.register(numpy.ndarray, _array_factory)
+    registry.register(NDArray, _array_factory)
+    for scalar in _SCALAR_TYPES:
+        registry.register(scalar, _scalar_factory(scalar))
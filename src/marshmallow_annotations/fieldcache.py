@@ -0,0 +1,248 @@
+"""
+Persistent cache of generated schema fields.
+
+Generating fields is deterministic given a target's annotations, the contents
+of the registry and the schema's options. :class:`FieldCache` stores generated
+fields on disk keyed by a fingerprint of all of those so short lived processes
+can skip resolving type hints and consulting the registry entirely.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from io import BytesIO
+from typing import AbstractSet, Any, Iterable, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+import marshmallow
+from marshmallow.utils import missing
+
+from . import __version__
+from .base import GeneratedFields, TypeRegistry
+
+__all__ = ("FieldCache",)
+
+_MISSING_ID = "marshmallow.missing"
+
+
+class _FieldPickler(pickle.Pickler):
+    # marshmallow.missing is compared by identity everywhere and doesn't
+    # survive a regular round trip through pickle
+    def persistent_id(self, obj):
+        if obj is missing:
+            return _MISSING_ID
+        return None
+
+
+class _FieldUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        if pid == _MISSING_ID:
+            return missing
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+def _qualified_name(obj: Any) -> str:
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if module is None or qualname is None:
+        return repr(obj)
+    # factories are closures that only differ by name
+    return f"{module}.{qualname}:{getattr(obj, '__name__', '')}"
+
+
+def _stable_repr(obj: Any) -> Optional[str]:
+    # reprs that include memory addresses change from process to process
+    # and would only ever produce cache misses
+    text = repr(obj)
+    return None if " at 0x" in text else text
+
+
+def _source_fingerprint(cls: type) -> Optional[List[str]]:
+    module = sys.modules.get(cls.__module__)
+    filename = getattr(module, "__file__", None)
+    if filename is None:
+        return None
+
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+
+    annotations = _stable_repr(cls.__dict__.get("__annotations__", {}))
+    if annotations is None:
+        return None
+
+    return [
+        _qualified_name(cls),
+        filename,
+        str(stat.st_mtime_ns),
+        str(stat.st_size),
+        annotations,
+    ]
+
+
+# registries that track a version only need fingerprinting once per change
+_registry_fingerprints: "WeakKeyDictionary[Any, Tuple[int, List[str]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _registry_fingerprint(registry: TypeRegistry) -> Optional[List[str]]:
+    version = getattr(registry, "version", None)
+    if version is not None:
+        try:
+            seen_version, parts = _registry_fingerprints[registry]
+        except (KeyError, TypeError):
+            pass
+        else:
+            if seen_version == version:
+                return parts
+
+    flatten = getattr(registry, "_flatten", None)
+    mapping = flatten() if flatten else getattr(registry, "_registry", None)
+    if mapping is None:
+        return None
+
+    parts = sorted(
+        f"{_qualified_name(target)}={_qualified_name(factory)}"
+        for target, factory in mapping.items()
+    )
+    if version is not None:
+        try:
+            _registry_fingerprints[registry] = (version, parts)
+        except TypeError:
+            pass
+    return parts
+
+
+class FieldCache:
+    """
+    Directory backed cache of generated fields, attached to schema through the
+    ``field_cache`` Meta option::
+
+        from marshmallow_annotations.fieldcache import FieldCache
+
+        cache = FieldCache("/var/cache/myapp/schema")
+
+        class BaseSchema(AnnotationSchema):
+            class Meta:
+                field_cache = cache
+
+
+    Entries are keyed by a fingerprint of:
+
+    - the location, modification time, size and raw annotations of the
+      source of the target and every annotated class in its MRO
+    - every type and field factory in the registry
+    - the converter factory, field configurations and ignored fields
+    - the versions of marshmallow and marshmallow-annotations
+
+    so changing any of these results in the fields being generated again.
+    Targets without a source file and configurations that can't be
+    fingerprinted reliably are never cached, nor are fields that can't be
+    pickled.
+
+    .. danger::
+
+        Entries are stored with :mod:`pickle`, the cache directory must only
+        be writable by trusted users.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def fingerprint(
+        self, opts: Any, target: type, ignore: AbstractSet[str]
+    ) -> Optional[str]:
+        """
+        Computes the cache key for generating fields for the target with the
+        given :class:`~marshmallow_annotations.scheme.AnnotationSchemaOpts`,
+        or ``None`` if the inputs can't be reliably fingerprinted.
+        """
+        parts: List[str] = [__version__, marshmallow.__version__]
+
+        for cls in target.__mro__:
+            # bases like tuple or Generic don't contribute any fields, the
+            # target is always included as it holds the defaults
+            if cls is not target and (
+                cls.__module__ == "builtins" or "__annotations__" not in vars(cls)
+            ):
+                continue
+            source = _source_fingerprint(cls)
+            if source is None:
+                return None
+            parts.extend(source)
+
+        registry = _registry_fingerprint(opts.registry)
+        configs = _stable_repr(sorted(opts.field_configs.items()))
+        if registry is None or configs is None:
+            return None
+
+        parts.extend(registry)
+        parts.extend(
+            [_qualified_name(opts.converter_factory), configs, repr(sorted(ignore))]
+        )
+
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> Optional[GeneratedFields]:
+        """
+        Retrieves previously stored fields, ``None`` if there aren't any or
+        they can't be read.
+        """
+        try:
+            with open(self._path(key), "rb") as fh:
+                return _FieldUnpickler(fh).load()
+        except Exception:
+            return None
+
+    def store(self, key: str, fields: GeneratedFields) -> None:
+        """
+        Stores generated fields, silently skipping them if they can't be
+        pickled or written.
+        """
+        buffer = BytesIO()
+        try:
+            _FieldPickler(buffer, pickle.HIGHEST_PROTOCOL).dump(fields)
+        except Exception:
+            return
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+
+        # written to a temporary file first so concurrent processes never
+        # see a partially written entry
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(buffer.getvalue())
+            os.replace(tmp, self._path(key))
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        for path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _entries(self) -> Iterable[str]:
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return [os.path.join(self.directory, n) for n in names if n.endswith(".pickle")]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pickle")
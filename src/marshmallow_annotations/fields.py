@@ -0,0 +1,129 @@
+"""
+Fields used by generated schema.
+"""
+
+from threading import Lock, local
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
+from marshmallow import fields
+from marshmallow.base import FieldABC, SchemaABC
+from marshmallow.utils import missing
+
+from ._utils import freeze
+
+__all__ = ("SharedNested",)
+
+_shared_lock = Lock()
+
+
+class _DumpDepth(local):
+    # limit is set for the duration of a dump by the outermost schema that
+    # declares a max_depth, depth counts the nested fields currently entered
+    limit: Optional[int] = None
+    depth = 0
+
+
+_dump_depth = _DumpDepth()
+
+
+class SharedNested(fields.Nested):
+    """
+    :class:`~marshmallow.fields.Nested` field that shares instances of the
+    nested schema. marshmallow creates a nested schema instance for every
+    field of every parent schema instance; this field instead uses a single
+    instance per schema class and combination of ``many``, ``only``,
+    ``exclude``, ``load_only``, ``dump_only`` and ``ordered``.
+
+    Sharing only happens if the parent schema's context is empty, otherwise
+    the nested schema is created like marshmallow would, with its own copy of
+    the context.
+
+    While a schema declaring ``max_depth`` is dumped, nested values deeper
+    than that are left out of the output entirely.
+    """
+
+    # set by Nested.__init__ and Nested.schema, declared for type checkers
+    _Nested__schema: Optional[SchemaABC]
+
+    def _serialize(self, nested_obj, attr, obj):
+        state = _dump_depth
+        if state.limit is None:
+            return super()._serialize(nested_obj, attr, obj)
+        if state.depth >= state.limit:
+            return missing
+
+        state.depth += 1
+        try:
+            return super()._serialize(nested_obj, attr, obj)
+        finally:
+            state.depth -= 1
+
+    @property
+    def schema(self):
+        schema = self._Nested__schema
+        if schema:
+            return schema
+
+        nested = self.nested
+        if not (isinstance(nested, type) and issubclass(nested, SchemaABC)):
+            return super().schema
+        if getattr(self.parent, "context", None):
+            return super().schema
+
+        only = (self.only,) if isinstance(self.only, str) else self.only
+        load_only = self._nested_normalized_option("load_only")
+        dump_only = self._nested_normalized_option("dump_only")
+        ordered = getattr(self.parent, "ordered", False)
+        try:
+            key = freeze((self.many, only, self.exclude, load_only, dump_only))
+            key = (key, ordered)
+            hash(key)
+        except TypeError:
+            return super().schema
+
+        shared = _shared_instances(nested)
+        schema = shared.get(key)
+        if schema is None:
+            with _shared_lock:
+                schema = shared.get(key)
+                if schema is None:
+                    schema = nested(
+                        many=self.many,
+                        only=only,
+                        exclude=self.exclude,
+                        load_only=load_only,
+                        dump_only=dump_only,
+                    )
+                    schema.ordered = ordered
+                    shared[key] = schema
+
+        self._Nested__schema = schema
+        return schema
+
+
+def _shared_instances(schema_class: Any) -> Dict[Any, SchemaABC]:
+    # kept on the class itself so dynamically created schema can still be
+    # collected along with their shared instances
+    shared = schema_class.__dict__.get("_shared_nested_instances")
+    if shared is None:
+        with _shared_lock:
+            shared = schema_class.__dict__.get("_shared_nested_instances")
+            if shared is None:
+                shared = {}
+                schema_class._shared_nested_instances = shared
+    return shared
+
+
+def _nested_fields(declared: Iterable[FieldABC]) -> Iterator[fields.Nested]:
+    # nested fields may be inside of containers such as fields.List, whose
+    # bound container refers back to it as its parent
+    pending = list(declared)
+    seen: Set[int] = set()
+    while pending:
+        field = pending.pop()
+        if id(field) in seen:
+            continue
+        seen.add(id(field))
+        if isinstance(field, fields.Nested):
+            yield field
+        pending.extend(v for v in vars(field).values() if isinstance(v, FieldABC))
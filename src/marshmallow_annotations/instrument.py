@@ -0,0 +1,197 @@
+"""
+Opt-in timing of schema and field serialization.
+
+Setting ``instrument`` on an
+:class:`~marshmallow_annotations.scheme.AnnotationSchema`'s Meta to a
+:class:`Collector` reports how long each dump, load and field took::
+
+    from marshmallow_annotations.instrument import StatsCollector
+
+    stats = StatsCollector()
+
+    class ArtistScheme(AnnotationSchema):
+        class Meta:
+            target = Artist
+            instrument = stats
+
+Schema without a collector aren't affected at all.
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from functools import partial
+from math import ceil
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, NamedTuple, Optional, Tuple
+
+__all__ = ("Collector", "StatsCollector", "Timing", "TimingStats")
+
+
+class Timing(NamedTuple):
+    """
+    A single measurement:
+
+    - schema: name of the schema class
+    - field: name of the field, ``None`` for the schema as a whole
+    - operation: ``dump`` or ``load`` for schema, ``serialize`` or
+      ``deserialize`` for fields
+    - duration: in seconds
+    - size: number of objects for schema, the length of the value for fields
+      if it has one
+    """
+
+    schema: str
+    field: Optional[str]
+    operation: str
+    duration: float
+    size: Optional[int]
+
+
+class TimingStats(NamedTuple):
+    """
+    Aggregated measurements, durations are in seconds. Percentiles are
+    computed over the most recent samples only.
+    """
+
+    calls: int
+    total: float
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+    size: int
+
+
+class Collector(ABC):
+    """
+    Receives measurements from instrumented schema. May be called from
+    multiple threads at once.
+    """
+
+    @abstractmethod
+    def record(self, timing: Timing) -> None:
+        pass
+
+
+def _percentile(ordered, q: float) -> float:
+    # nearest rank
+    return ordered[max(0, ceil(q * len(ordered)) - 1)]
+
+
+class StatsCollector(Collector):
+    """
+    Aggregates measurements in process, keyed by ``(schema, field, operation)``,
+    keeping up to ``max_samples`` durations per key for percentiles::
+
+        for (schema, field, operation), timing in stats.stats().items():
+            print(schema, field, operation, timing.p99)
+
+    """
+
+    def __init__(self, max_samples: int = 10000) -> None:
+        self.max_samples = max_samples
+        self._lock = Lock()
+        self._samples: Dict[Tuple, Deque[float]] = {}
+        self._totals: Dict[Tuple, list] = {}
+
+    def record(self, timing: Timing) -> None:
+        key = (timing.schema, timing.field, timing.operation)
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.max_samples)
+                self._totals[key] = [0, 0.0, 0.0, 0]
+            samples.append(timing.duration)
+            totals = self._totals[key]
+            totals[0] += 1
+            totals[1] += timing.duration
+            totals[2] = max(totals[2], timing.duration)
+            totals[3] += timing.size or 0
+
+    def stats(self) -> Dict[Tuple[str, Optional[str], str], TimingStats]:
+        with self._lock:
+            snapshot = {
+                k: (sorted(v), list(self._totals[k])) for k, v in self._samples.items()
+            }
+
+        return {
+            key: TimingStats(
+                calls,
+                total,
+                total / calls,
+                _percentile(ordered, 0.5),
+                _percentile(ordered, 0.9),
+                _percentile(ordered, 0.99),
+                maximum,
+                size,
+            )
+            for key, (ordered, (calls, total, maximum, size)) in snapshot.items()
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+
+def _length(value: Any) -> Optional[int]:
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+def call_timed(
+    collector: Collector,
+    schema: str,
+    field: Optional[str],
+    operation: str,
+    size: Callable[[Any], Optional[int]],
+    func: Callable,
+    *args: Any
+) -> Any:
+    """
+    Calls func with the arguments, reporting its duration and the size of its
+    result.
+    """
+    start = perf_counter()
+    result = None
+    try:
+        result = func(*args)
+        return result
+    finally:
+        duration = perf_counter() - start
+        collector.record(Timing(schema, field, operation, duration, size(result)))
+
+
+def timed(
+    collector: Collector,
+    schema: str,
+    field: Optional[str],
+    operation: str,
+    func: Callable,
+    size: Callable[[Any], Optional[int]] = _length,
+) -> Callable:
+    """
+    Wraps a callable to report its duration and the size of its result.
+    """
+
+    def wrapper(*args, **kwargs):
+        call = partial(func, **kwargs) if kwargs else func
+        return call_timed(collector, schema, field, operation, size, call, *args)
+
+    return wrapper
+
+
+def instrument_fields(collector: Collector, schema: str, fields: Dict) -> None:
+    """
+    Times the serialize and deserialize methods of the field instances, which
+    must belong to a single schema instance.
+    """
+    for name, field in fields.items():
+        field.serialize = timed(collector, schema, name, "serialize", field.serialize)
+        field.deserialize = timed(
+            collector, schema, name, "deserialize", field.deserialize
+        )
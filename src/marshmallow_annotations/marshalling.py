@@ -0,0 +1,413 @@
+"""
+Code generated (de)serialization fast paths for
+:class:`~marshmallow_annotations.scheme.AnnotationSchema`.
+
+The generated functions only ever handle the happy path. Anything unexpected
+-- a value of the wrong type, a missing required value, a validation error --
+raises and the caller falls back to marshmallow's regular machinery which then
+produces the exact same result, errors or exception it always has.
+"""
+
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence
+from uuid import UUID
+
+from marshmallow import fields
+from marshmallow.decorators import (
+    POST_LOAD,
+    PRE_DUMP,
+    PRE_LOAD,
+    VALIDATES,
+    VALIDATES_SCHEMA,
+)
+from marshmallow.schema import Schema
+from marshmallow.utils import missing
+
+__all__ = ("TargetConstructor", "compile_dumper", "compile_loader")
+
+Dumper = Callable[[Any, bool], Any]
+Loader = Callable[[Any, bool], Any]
+
+
+class TargetConstructor(NamedTuple):
+    """
+    Describes how a schema builds its target out of loaded data so a compiled
+    loader can do the same without the intermediate dictionary.
+
+    - processor: name of the post_load processor the compiled loader replaces
+    - target: the callable that builds the target
+    - arguments: names of the target's arguments, in order
+    - positional: whether arguments are passed positionally or by keyword
+    - owner: the schema class defining the processor, schema that override it
+      aren't compiled
+    """
+
+    processor: str
+    target: Callable
+    arguments: Sequence[str]
+    positional: bool
+    owner: type
+
+
+# Fields whose value lookup and serialization can be inlined, mapped to the
+# exact value type that serializes to itself (or a cheap expression of itself)
+# and that expression. Fields not listed here, or subclasses of the ones that
+# are, always go through Field.serialize.
+_INLINE_DUMP: Dict[type, Optional[tuple]] = {
+    fields.String: (str, "{v}"),
+    fields.Integer: (int, "{v}"),
+    fields.Float: (float, "{v}"),
+    fields.Boolean: (bool, "{v}"),
+    fields.UUID: (UUID, "str({v})"),
+    fields.Date: (date, "{v}.isoformat()"),
+    fields.DateTime: None,
+    fields.Time: None,
+    fields.TimeDelta: None,
+    fields.Decimal: None,
+    fields.Dict: None,
+    fields.Raw: None,
+    fields.Field: None,
+}
+
+
+# Fields whose deserialization of an exact value type can be skipped entirely,
+# mapped to that type. Any other value goes through Field.deserialize.
+_INLINE_LOAD: Dict[type, type] = {
+    fields.String: str,
+    fields.Integer: int,
+    fields.Float: float,
+    fields.Boolean: bool,
+    fields.UUID: UUID,
+}
+
+
+@lru_cache(maxsize=512)
+def _compile(source: str, filename: str):
+    return compile(source, filename, "exec")
+
+
+def _admit_for_getattr(cls: type) -> bool:
+    # marshmallow's accessor tries obj[key] before getattr(obj, key), an object
+    # that doesn't support item access (or rejects string keys the way tuples
+    # do) can have its attributes read directly
+    getitem = getattr(cls, "__getitem__", None)
+    return getitem is None or getitem is tuple.__getitem__
+
+
+def _inline_spec(field):
+    if type(field) not in _INLINE_DUMP:
+        return None, False
+    if isinstance(field, fields.Number) and field.as_string:
+        return None, True
+    return _INLINE_DUMP[type(field)], True
+
+
+def _dump_field_lines(i: int, name: str, field) -> list:
+    key = field.dump_to or name
+    attr = field.attribute if field.attribute is not None else name
+    spec, inline = _inline_spec(field)
+
+    if not inline or "." in attr:
+        return [
+            f"    v = _f{i}.serialize({name!r}, obj, _accessor)",
+            "    if v is not _missing:",
+            f"        ret[{key!r}] = v",
+        ]
+
+    lines = [f"    v = _getattr(obj, {attr!r}, _missing)"]
+    branch = "if"
+    if spec is not None:
+        expr = spec[1].format(v="v")
+        lines += [
+            "    if v is None:",
+            f"        ret[{key!r}] = None",
+            f"    elif v.__class__ is _t{i}:",
+            f"        ret[{key!r}] = {expr}",
+        ]
+        branch = "elif"
+    lines += [
+        f"    {branch} v is not _missing:",
+        "        if _callable(v):",
+        "            v = v()",
+        f"        ret[{key!r}] = _f{i}._serialize(v, {name!r}, obj)",
+    ]
+    if field.default is not missing:
+        value = f"_d{i}()" if callable(field.default) else f"_d{i}"
+        lines += ["    else:", f"        ret[{key!r}] = {value}"]
+    return lines
+
+
+def _dumper_source(schema_fields) -> str:
+    lines = [
+        "def dump_one(obj):",
+        "    cls = obj.__class__",
+        "    if cls not in _admitted:",
+        "        if not _admit(cls):",
+        "            raise _Fallback",
+        "        _admitted.add(cls)",
+        "    ret = {}",
+    ]
+    for i, (name, field) in enumerate(schema_fields):
+        lines.extend(_dump_field_lines(i, name, field))
+    lines += [
+        "    return ret if _dict_class is dict else _dict_class(ret)",
+        "",
+        "def dump(obj, many):",
+        "    if many:",
+        "        return [dump_one(o) for o in obj]",
+        "    return dump_one(obj)",
+    ]
+    return "\n".join(lines)
+
+
+class _Fallback(Exception):
+    pass
+
+
+def _can_compile_dump(schema) -> bool:
+    return (
+        not schema.prefix
+        and not schema.extra
+        and not schema.opts.fields
+        and not schema.opts.additional
+        and type(schema).get_attribute is Schema.get_attribute
+        and not schema.__processors__.get((PRE_DUMP, False))
+        and not schema.__processors__.get((PRE_DUMP, True))
+    )
+
+
+def compile_dumper(schema) -> Optional[Dumper]:
+    """
+    Generates a serializer for the bound fields of a schema instance. The
+    returned callable accepts ``(obj, many)`` and returns the marshalled data.
+
+    The generated serializer reads attributes directly and formats values of
+    the primitive fields found in
+    :class:`~marshmallow_annotations.registry.DefaultTypeRegistry` in line,
+    every other field is serialized through its own ``serialize`` method.
+
+    It raises on anything outside of the happy path -- including validation
+    errors -- and callers are expected to redo the work through marshmallow
+    to get identical results. Returns ``None`` if the schema instance uses a
+    feature the generated code doesn't account for (pre_dump processors,
+    a custom ``get_attribute``, implicit fields, prefixes).
+    """
+    if not _can_compile_dump(schema):
+        return None
+
+    schema_fields = [(k, f) for k, f in schema.fields.items() if not f.load_only]
+    source = _dumper_source(schema_fields)
+    namespace = {
+        "_accessor": schema.get_attribute,
+        "_admit": _admit_for_getattr,
+        "_admitted": set(),
+        "_callable": callable,
+        "_dict_class": schema.dict_class,
+        "_Fallback": _Fallback,
+        "_getattr": getattr,
+        "_missing": missing,
+    }
+    for i, (_, field) in enumerate(schema_fields):
+        spec, _ = _inline_spec(field)
+        namespace[f"_f{i}"] = field
+        namespace[f"_d{i}"] = field.default
+        if spec is not None:
+            namespace[f"_t{i}"] = spec[0]
+
+    filename = f"<{type(schema).__qualname__} dumper>"
+    exec(_compile(source, filename), namespace)
+    return namespace["dump"]
+
+
+def _load_field_lines(i: int, name: str, field) -> list:
+    lines = [f"    v = data.get({name!r}, _missing)"]
+    if field.load_from:
+        lines += [
+            "    if v is _missing:",
+            f"        v = data.get({field.load_from!r}, _missing)",
+        ]
+
+    # mirrors marshmallow's Unmarshaller: missing values are replaced by the
+    # field's missing value, if there's still nothing then the field is either
+    # left out or it's an error
+    lines.append("    if v is _missing:")
+    indent = ""
+    if field.missing is not missing:
+        value = f"_m{i}()" if callable(field.missing) else f"_m{i}"
+        lines.append(f"        v = {value}")
+    elif field.required:
+        lines.append("        raise _Fallback")
+    else:
+        lines += [f"        a{i} = _missing", "    else:"]
+        indent = "    "
+
+    attr = field.load_from or name
+    null = f"a{i} = None" if field.allow_none is True else "raise _Fallback"
+    body = ["    if v is None:", f"        {null}"]
+    if type(field) in _INLINE_LOAD:
+        body += [f"    elif v.__class__ is _t{i}:", f"        a{i} = v"]
+        if field.validators:
+            body.append(f"        _f{i}._validate(v)")
+    body += ["    else:", f"        a{i} = _f{i}.deserialize(v, {attr!r}, data)"]
+    lines.extend(indent + line for line in body)
+    return lines
+
+
+def _may_skip(field) -> bool:
+    # a field only ever ends up missing from loaded data if its value wasn't
+    # provided and there's nothing to fall back on, or if a field (other than
+    # the ones known here) decided to deserialize to missing
+    return type(field) not in _INLINE_LOAD or (
+        not field.required and field.missing is missing
+    )
+
+
+def _construct_lines(schema_fields, constructor: Optional[TargetConstructor]):
+    keys = [(i, field.attribute or name, field) for i, (name, field) in schema_fields]
+
+    if constructor is None:
+        lines = ["    ret = {}"]
+        for i, key, field in keys:
+            if _may_skip(field):
+                lines += [
+                    f"    if a{i} is not _missing:",
+                    f"        ret[{key!r}] = a{i}",
+                ]
+            else:
+                lines.append(f"    ret[{key!r}] = a{i}")
+        lines.append("    return ret if _dict_class is dict else _dict_class(ret)")
+        return lines
+
+    by_key = {key: (i, field) for i, key, field in keys}
+    lines, arguments, optional = [], [], []
+    for argument in constructor.arguments:
+        if argument not in by_key:
+            continue
+        i, field = by_key[argument]
+        if not _may_skip(field):
+            arguments.append(f"a{i}" if constructor.positional else f"{argument}=a{i}")
+        elif constructor.positional:
+            lines += [f"    if a{i} is _missing:", "        raise _Fallback"]
+            arguments.append(f"a{i}")
+        else:
+            optional.append((i, argument))
+
+    if optional:
+        lines.append("    kw = {}")
+        for i, argument in optional:
+            lines += [
+                f"    if a{i} is not _missing:",
+                f"        kw[{argument!r}] = a{i}",
+            ]
+        arguments.append("**kw")
+
+    lines.append(f"    return _target({', '.join(arguments)})")
+    return lines
+
+
+def _loader_source(schema_fields, constructor) -> str:
+    lines = [
+        "def load_one(data):",
+        "    if data.__class__ is not dict:",
+        "        raise _Fallback",
+    ]
+    for i, (name, field) in schema_fields:
+        lines.extend(_load_field_lines(i, name, field))
+    lines.extend(_construct_lines(schema_fields, constructor))
+    lines += [
+        "",
+        "def load(data, many):",
+        "    if many:",
+        "        if data.__class__ is not list and data.__class__ is not tuple:",
+        "            raise _Fallback",
+        "        return [load_one(d) for d in data]",
+        "    return load_one(data)",
+    ]
+    return "\n".join(lines)
+
+
+def _can_compile_load(schema, constructor: Optional[TargetConstructor]) -> bool:
+    processors = schema.__processors__
+    expected = [constructor.processor] if constructor is not None else []
+
+    if (
+        schema.opts.fields
+        or schema.opts.additional
+        or processors.get((POST_LOAD, False), []) != expected
+        or any(
+            processors.get((tag, many))
+            for tag in (PRE_LOAD, POST_LOAD, VALIDATES, VALIDATES_SCHEMA)
+            for many in (True, False)
+            if (tag, many) != (POST_LOAD, False)
+        )
+    ):
+        return False
+
+    keys = {
+        field.attribute or name
+        for name, field in schema.fields.items()
+        if not field.dump_only
+    }
+
+    if any("." in key for key in keys):
+        return False
+
+    if constructor is None:
+        return True
+
+    # an overridden processor may build something else entirely
+    name = constructor.processor
+    if getattr(type(schema), name) is not getattr(constructor.owner, name):
+        return False
+
+    if not keys <= set(constructor.arguments):
+        return False
+
+    # positional construction can't leave anything out
+    return not constructor.positional or keys == set(constructor.arguments)
+
+
+def compile_loader(
+    schema, constructor: Optional[TargetConstructor] = None
+) -> Optional[Loader]:
+    """
+    Generates a deserializer for the bound fields of a schema instance. The
+    returned callable accepts ``(data, many)`` and returns the loaded data.
+
+    Values that are already of the type the primitive fields of
+    :class:`~marshmallow_annotations.registry.DefaultTypeRegistry` produce are
+    accepted in line, every other value is deserialized through its field's
+    ``deserialize`` method.
+
+    If a :class:`TargetConstructor` is provided, the loader builds the target
+    directly from the deserialized values instead of returning a dictionary
+    that the constructor's post_load processor would receive.
+
+    Like :func:`compile_dumper`, anything off the happy path raises and
+    callers are expected to redo the work through marshmallow. Returns
+    ``None`` if the schema instance uses a feature the generated code
+    doesn't account for (load processors other than the constructor,
+    validators, implicit fields, dotted attributes).
+    """
+    if not _can_compile_load(schema, constructor):
+        return None
+
+    schema_fields = [
+        (i, (k, f)) for i, (k, f) in enumerate(schema.fields.items()) if not f.dump_only
+    ]
+    source = _loader_source(schema_fields, constructor)
+    namespace = {
+        "_dict_class": schema.dict_class,
+        "_Fallback": _Fallback,
+        "_missing": missing,
+        "_target": constructor.target if constructor is not None else None,
+    }
+    for i, (_, field) in schema_fields:
+        namespace[f"_f{i}"] = field
+        namespace[f"_m{i}"] = field.missing
+        namespace[f"_t{i}"] = _INLINE_LOAD.get(type(field))
+
+    filename = f"<{type(schema).__qualname__} loader>"
+    exec(_compile(source, filename), namespace)
+    return namespace["load"]
@@ -0,0 +1,269 @@
+"""
+Dumping and loading very large batches across processes.
+
+Schema aren't pickled. Workers are sent an importable reference to the
+schema's class -- or for schema made by
+:func:`~marshmallow_annotations.dynamic.schema_for`, to its target -- along
+with the arguments the schema was created with, and create the schema
+themselves the first time they see it.
+"""
+
+import os
+import pickle
+import threading
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from marshmallow.exceptions import ValidationError
+from marshmallow.schema import MarshalResult, UnmarshalResult
+
+from ._importing import import_reference, reference_of
+from ._utils import freeze
+from .exceptions import MarshmallowAnnotationError
+from .registry import registry as default_registry
+from .stream import _load_one, chunked, offset_errors
+
+__all__ = ("SchemaReference", "parallel_dump", "parallel_load")
+
+# instance arguments carried over to the schema created by workers
+_ARGUMENTS = (
+    "only",
+    "exclude",
+    "strict",
+    "context",
+    "load_only",
+    "dump_only",
+    "partial",
+)
+
+
+def _is_picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def _portable_options(schema_class: type, options: Dict[str, Any]) -> Dict[str, Any]:
+    portable = {}
+    for name, value in options.items():
+        if name == "registry" and value is default_registry:
+            # workers use their own default registry, which holds a lock
+            continue
+        if not _is_picklable(value):
+            raise MarshmallowAnnotationError(
+                f"The {name} option of {schema_class.__qualname__} can't be sent "
+                "to worker processes, declare the schema at module level instead"
+            )
+        portable[name] = value
+    return portable
+
+
+class SchemaReference(NamedTuple):
+    """
+    Everything a worker needs to create a schema again:
+
+    - schema: reference of the schema class, ``None`` for dynamic schema
+    - target: reference of the target of a dynamic schema
+    - base: reference of the base of a dynamic schema
+    - options: the options a dynamic schema was created with
+    - arguments: the arguments the schema instance was created with
+    """
+
+    schema: Optional[str]
+    target: Optional[str]
+    base: Optional[str]
+    options: Dict[str, Any]
+    arguments: Dict[str, Any]
+
+    @classmethod
+    def of(cls, schema) -> "SchemaReference":
+        """
+        Builds the reference of a schema instance, raises
+        :class:`~marshmallow_annotations.exceptions.MarshmallowAnnotationError`
+        if it can't be created again by importing something. The schema's
+        context and the options of dynamic schema must be picklable, except
+        for the default registry.
+        """
+        arguments = {name: getattr(schema, name) for name in _ARGUMENTS}
+        schema_class = type(schema)
+
+        if not _is_picklable(arguments["context"]):
+            raise MarshmallowAnnotationError(
+                f"The context of this {schema_class.__qualname__} can't be sent "
+                "to worker processes"
+            )
+
+        reference = reference_of(schema_class)
+        if reference is not None:
+            return cls(reference, None, None, {}, arguments)
+
+        target = schema_class.__dict__.get("__schema_for__")
+        if target is not None:
+            base, options = schema_class._schema_for_options
+            target_reference = reference_of(target)
+            base_reference = reference_of(base)
+            if target_reference is not None and base_reference is not None:
+                options = _portable_options(schema_class, options)
+                return cls(None, target_reference, base_reference, options, arguments)
+
+        raise MarshmallowAnnotationError(
+            f"{schema_class.__qualname__} can't be imported by worker processes, "
+            "declare it at module level"
+        )
+
+    def create(self):
+        """
+        Creates the referenced schema.
+        """
+        if self.schema is not None:
+            schema_class = import_reference(self.schema)
+        elif self.target is None or self.base is None:
+            raise MarshmallowAnnotationError(
+                "A reference needs either a schema or a target and base"
+            )
+        else:
+            from .dynamic import schema_for
+
+            schema_class = schema_for(
+                import_reference(self.target),
+                base=import_reference(self.base),
+                **self.options,
+            )
+        return schema_class(**self.arguments)
+
+
+# schema created while working for others, per thread as executors other
+# than process pools may run several chunks at once
+_worker = threading.local()
+
+
+def _worker_schema(reference: SchemaReference):
+    schemas = getattr(_worker, "schemas", None)
+    if schemas is None:
+        schemas = _worker.schemas = {}
+
+    try:
+        key: Any = freeze(reference)
+        schema = schemas.get(key)
+    except TypeError:
+        return reference.create()
+
+    if schema is None:
+        schema = schemas[key] = reference.create()
+    return schema
+
+
+def _process_chunk(
+    reference: SchemaReference, method: str, chunk: list, offset: int
+) -> Tuple[Any, Dict[Any, Any]]:
+    schema = _worker_schema(reference)
+    try:
+        data, errors = getattr(schema, method)(chunk, many=True)
+    except ValidationError as e:
+        # strict schema, raised again once every chunk is done
+        data, errors = e.data, e.messages
+
+    if errors and method == "load":
+        # like load_iter, post load processors still run for valid records
+        data, errors = [], {}
+        for i, record in enumerate(chunk):
+            obj, record_errors = _load_one(schema, record)
+            data.append(obj)
+            if record_errors:
+                errors[i] = record_errors
+
+    return data, offset_errors(errors, offset)
+
+
+def _pending_limit(executor: Executor, max_workers: Optional[int]) -> int:
+    workers = max_workers or getattr(executor, "_max_workers", None)
+    return 2 * (workers or os.cpu_count() or 1)
+
+
+def _results(
+    executor: Executor,
+    limit: int,
+    reference: SchemaReference,
+    method: str,
+    data: Iterable[Any],
+    chunk_size: int,
+) -> Iterator[Tuple[Any, Dict[Any, Any]]]:
+    # only a few chunks are handed out ahead of the one being waited on so
+    # the input isn't consumed faster than workers can keep up with
+    pending: Deque[Any] = deque()
+    offset = 0
+    for chunk in chunked(data, chunk_size):
+        pending.append(
+            executor.submit(_process_chunk, reference, method, chunk, offset)
+        )
+        offset += len(chunk)
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _parallel(
+    schema,
+    method: str,
+    data: Iterable[Any],
+    chunk_size: int,
+    executor: Optional[Executor],
+    max_workers: Optional[int],
+) -> Tuple[list, Dict[Any, Any]]:
+    reference = SchemaReference.of(schema)
+    owned = executor is None
+    pool = ProcessPoolExecutor(max_workers) if executor is None else executor
+
+    results: list = []
+    errors: Dict[Any, Any] = {}
+    try:
+        limit = _pending_limit(pool, max_workers)
+        for chunk_data, chunk_errors in _results(
+            pool, limit, reference, method, data, chunk_size
+        ):
+            results.extend(chunk_data)
+            errors.update(chunk_errors)
+    finally:
+        if owned:
+            pool.shutdown()
+
+    if errors and schema.strict:
+        raise ValidationError(errors, data=results)
+    return results, errors
+
+
+def parallel_dump(
+    schema,
+    objs: Iterable[Any],
+    chunk_size: int = 10000,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> MarshalResult:
+    """
+    Dumps a batch across processes, see
+    :meth:`~marshmallow_annotations.scheme.AnnotationSchema.parallel_dump`.
+    """
+    return MarshalResult(
+        *_parallel(schema, "dump", objs, chunk_size, executor, max_workers)
+    )
+
+
+def parallel_load(
+    schema,
+    data: Iterable[Any],
+    chunk_size: int = 10000,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> UnmarshalResult:
+    """
+    Loads a batch across processes, see
+    :meth:`~marshmallow_annotations.scheme.AnnotationSchema.parallel_load`.
+    """
+    return UnmarshalResult(
+        *_parallel(schema, "load", data, chunk_size, executor, max_workers)
+    )
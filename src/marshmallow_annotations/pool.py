@@ -0,0 +1,84 @@
+"""
+Reuse of schema instances.
+
+marshmallow deep copies every declared field whenever a schema is
+instantiated, which for small payloads can cost as much as dumping them. A
+:class:`SchemaPool` keeps instances around per thread and hands them out again
+instead.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List
+
+from marshmallow.base import FieldABC, SchemaABC
+
+from ._utils import freeze
+from .fields import _nested_fields
+
+__all__ = ("SchemaPool",)
+
+
+def _forget_nested_schema(fields: Iterable[FieldABC]) -> None:
+    # nested schema are created on first use with a copy of the parent's
+    # context and would otherwise keep seeing the previous context
+    for field in _nested_fields(fields):
+        field._Nested__schema = None
+
+
+class SchemaPool:
+    """
+    Per thread pool of instances of a schema, keyed by the arguments the
+    schema is instantiated with. Instances are checked out for the duration of
+    a with block, so a schema used again further down the stack on the same
+    thread -- e.g. from within a ``post_dump`` -- gets an instance of its own::
+
+        pool = SchemaPool(ArtistScheme)
+
+        with pool.checkout(many=True, context={"user": user}) as schema:
+            result = schema.dump(artists)
+
+
+    Each checkout sets the context passed, or an empty one. At most
+    ``maxsize`` idle instances are kept per thread and set of arguments.
+    """
+
+    def __init__(self, schema_class: type, maxsize: int = 8) -> None:
+        self.schema_class = schema_class
+        self.maxsize = maxsize
+        self._local = threading.local()
+
+    @contextmanager
+    def checkout(self, *, context: Dict = None, **kwargs: Any) -> Iterator[SchemaABC]:
+        try:
+            key = freeze(kwargs)
+            idle = self._idle().setdefault(key, [])
+        except TypeError:
+            yield self.schema_class(context=dict(context or {}), **kwargs)
+            return
+
+        if idle:
+            schema = idle.pop()
+            self._set_context(schema, context)
+        else:
+            schema = self.schema_class(context=dict(context or {}), **kwargs)
+
+        try:
+            yield schema
+        finally:
+            if len(idle) < self.maxsize:
+                idle.append(schema)
+
+    def _idle(self) -> Dict[Any, List[SchemaABC]]:
+        idle = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = self._local.idle = {}
+        return idle
+
+    @staticmethod
+    def _set_context(schema: SchemaABC, context: Dict = None) -> None:
+        if not schema.context and not context:
+            return
+
+        schema.context = dict(context or {})
+        _forget_nested_schema(schema.declared_fields.values())
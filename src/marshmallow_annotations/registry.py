@@ -1,14 +1,17 @@
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from typing import Dict, List, Tuple, Union
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from marshmallow import fields
+from marshmallow import class_registry, fields
 from marshmallow.base import FieldABC, SchemaABC
+from marshmallow.exceptions import RegistryError
 
 from ._compat import _get_base
 from .base import AbstractConverter, ConfigOptions, FieldFactory, TypeRegistry
 from .exceptions import AnnotationConversionError
+from .fields import SharedNested
 
 
 def _is_generic(typehint: type) -> bool:
@@ -29,21 +32,35 @@ def field_factory(field: FieldABC) -> FieldFactory:
         return field(**opts)
 
     _.__name__ = f"{field.__name__}FieldFactory"
+    # the field only depends on opts, see BaseConverter._build_field
+    _.__stateless__ = True  # type: ignore
     return _
 
 
 def scheme_factory(scheme_name: str) -> FieldFactory:
     """
     Maps a scheme or scheme name into a field factory
+
+    :versionchanged: 2.5.0 Produces
+        :class:`~marshmallow_annotations.fields.SharedNested` fields, scheme
+        names are resolved when the field is created if possible
     """
 
     def _(
         converter: AbstractConverter, subtypes: Tuple[type], opts: ConfigOptions
     ) -> FieldABC:
-        return fields.Nested(scheme_name, **opts)
+        nested = scheme_name
+        if isinstance(nested, str):
+            try:
+                nested = class_registry.get_class(nested)
+            except RegistryError:
+                # not declared yet or ambiguous, leave it to marshmallow
+                pass
+        return SharedNested(nested, **opts)
 
     _.__name__ = f"{scheme_name}FieldFactory"
     _.__is_scheme__ = True  # type: ignore
+    _.__scheme__ = scheme_name  # type: ignore
     return _
 
 
@@ -78,6 +95,26 @@ class DefaultTypeRegistry(TypeRegistry):
 
     As well as a special factory for typing.List[T] that will generate either
     fields.List or fields.Nested
+
+    Classes without an entry of their own resolve to the entry of their
+    nearest registered base class, e.g. an ``IntEnum`` or a ``str`` subclass
+    is handled by the field for ``int`` or ``str``. Schema registered for a base
+    class aren't used for its subclasses. Resolutions are memoized until the
+    next registration.
+
+    Lookups never take a lock: registering swaps in a new copy of the mapping
+    rather than changing the current one, so schema may be created from
+    several threads at once.
+
+    Registries may be layered with ``parent`` or
+    :meth:`~marshmallow_annotations.registry.DefaultTypeRegistry.new_child`,
+    in which case the registry only holds its own registrations and consults
+    its parent for everything else.
+
+    :versionchanged: 2.5.0 Subclasses of registered types resolve through
+        their MRO
+    :versionchanged: 2.5.0 Registration is copy on write and versioned
+    :versionchanged: 2.5.0 Added parent and new_child
     """
 
     _registry = {
@@ -102,19 +139,116 @@ class DefaultTypeRegistry(TypeRegistry):
     _registry[List] = _list_converter
     _registry[list] = _list_converter
 
-    def __init__(self, registry: Dict[type, FieldFactory] = None) -> None:
-        if registry is None:
-            registry = {}
+    def __init__(
+        self,
+        registry: Dict[type, FieldFactory] = None,
+        *,
+        parent: "DefaultTypeRegistry" = None,
+    ) -> None:
+        self._lock = Lock()
+        self._version = 0
+        self._parent = parent
+
+        if parent is not None:
+            mapping = dict(registry or {})
+        elif registry:
+            mapping = {**self._registry, **registry}
+        else:
+            # shared with the class, registering copies it before writing
+            mapping = self._registry
+
+        self._swap(mapping)
+
+    @property
+    def version(self) -> int:
+        if self._parent is None:
+            return self._version
+        return self._version + self._parent.version
+
+    def new_child(
+        self, registry: Dict[type, FieldFactory] = None
+    ) -> "DefaultTypeRegistry":
+        """
+        Creates a registry layered over this one. The child only holds its own
+        registrations and falls back to this registry for everything else,
+        including registrations made here after the child was created::
+
+            tenant = registry.new_child({Money: tenant_money_factory})
 
-        self._registry = {**self._registry, **registry}
+        :versionchanged: 2.5.0
+        """
+        return type(self)(registry, parent=self)
+
+    def _swap(self, mapping: Dict[type, FieldFactory]) -> None:
+        # the mapping and the memo of resolutions made against it are replaced
+        # together so a lookup racing a registration can't memoize a stale
+        # resolution into the new memo
+        parent_version = None if self._parent is None else self._parent.version
+        self._registry = mapping
+        self._state: Tuple[Dict[type, FieldFactory], Dict[Any, Any], Any] = (
+            mapping,
+            {},
+            parent_version,
+        )
 
     def register(self, target: type, constructor: FieldFactory) -> None:
-        self._registry[target] = constructor
+        with self._lock:
+            self._swap({**self._registry, target: constructor})
+            self._version += 1
 
-    def get(self, target: type) -> FieldFactory:
-        converter = self._registry.get(target)
+    def _lookup(self, target: type) -> Optional[FieldFactory]:
+        registry: Optional[DefaultTypeRegistry] = self
+        while registry is not None:
+            converter = registry._registry.get(target)
+            if converter is not None:
+                return converter
+            registry = registry._parent
+        return None
+
+    def _flatten(self) -> Dict[type, FieldFactory]:
+        if self._parent is None:
+            return self._registry
+        return {**self._parent._flatten(), **self._registry}
+
+    def _resolve(self, target: type) -> Optional[FieldFactory]:
+        mapping, resolved, parent_version = self._state
+        if self._parent is not None and self._parent.version != parent_version:
+            with self._lock:
+                if self._state[0] is mapping:
+                    self._swap(mapping)
+            mapping, resolved, parent_version = self._state
+
+        try:
+            return resolved[target]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable hints can't be registered or memoized
+            return None
+
+        converter = self._lookup(target)
         if converter is None and _is_generic(target):
-            converter = self._registry.get(_get_base(target))
+            converter = self._lookup(_get_base(target))
+        if converter is None and isinstance(target, type):
+            converter = self._lookup_bases(target)
+
+        resolved[target] = converter
+        return converter
+
+    def _lookup_bases(self, target: type) -> Optional[FieldFactory]:
+        # nearest registered base class, object is never a sensible match.
+        # Schema registered for a base class don't know the fields a subclass
+        # adds, so those are never inherited
+        for base in target.__mro__[1:-1]:
+            converter = self._lookup(base)
+            if converter is not None and not getattr(
+                converter, "__is_scheme__", False
+            ):
+                return converter
+        return None
+
+    def get(self, target: type) -> FieldFactory:
+        converter = self._resolve(target)
 
         if converter is None:
             raise AnnotationConversionError(f"No field factory found for {target!r} (forgot to register_as_scheme attribute?)")
@@ -128,8 +262,10 @@ class DefaultTypeRegistry(TypeRegistry):
     ) -> None:
         self.register(target, scheme_factory(scheme_or_name))
 
-    def has(self, target: type) -> bool:
-        return target in self._registry
+    def has(self, target: type, exact: bool = False) -> bool:
+        if exact:
+            return self._lookup(target) is not None
+        return self._resolve(target) is not None
 
 
 registry = DefaultTypeRegistry()
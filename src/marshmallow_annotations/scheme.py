@@ -1,10 +1,43 @@
+from functools import partial
 from inspect import getmro
+from threading import Lock, RLock
+from typing import AbstractSet, Any, Dict, List
+from weakref import WeakSet
+
+from marshmallow.base import FieldABC
+from marshmallow.decorators import POST_DUMP
+from marshmallow.exceptions import ValidationError
+from marshmallow.schema import MarshalResult, Schema, SchemaMeta, SchemaOpts
+from marshmallow.utils import is_iterable_but_not_string
+
+from .base import TypeRegistry
+from .aio import async_dump, async_load, dump_aiter
+from .columns import dump_columns
+from .converter import BaseConverter, FieldPlan
+from .fields import _dump_depth
+from .instrument import call_timed, instrument_fields
+from .marshalling import compile_dumper, compile_loader
+from .parallel import parallel_dump, parallel_load
+from .pool import SchemaPool
+from .profiler import profiler
+from .registry import registry
+from .stream import dump_iter, load_iter
 
-from marshmallow.schema import Schema, SchemaMeta, SchemaOpts
 
-from .converter import BaseConverter
-from .registry import registry
-from typing import Dict, Any
+# options a schema takes from its parents' opts and its own Meta, in that order
+_INHERITED_OPTIONS = (
+    "converter_factory",
+    "register_as_scheme",
+    "target",
+    "registry",
+    "compile_dump",
+    "compile_load",
+    "lazy",
+    "field_cache",
+    "instrument",
+    "auto_nested",
+    "max_depth",
+)
 
 
 class AnnotationSchemaOpts(SchemaOpts):
@@ -17,19 +50,38 @@ class AnnotationSchemaOpts(SchemaOpts):
     - target
     - field_configs
     - converter
+    - compile_dump
+    - compile_load
+    - lazy
+    - field_cache
+    - instrument
+    - auto_nested
+    - max_depth
+
+    :versionchanged: 2.5.0 Added compile_dump, compile_load, lazy, field_cache
+        and instrument
+
+    :versionchanged: 2.5.0 Added auto_nested and max_depth
     """
 
     def __init__(self, meta, schema=None):
+        timer = profiler.timer()
         super().__init__(meta)
         self.__sentinel = object()
         self.field_configs: Dict[str, Dict[str, Any]] = {}
 
         self._process(meta, schema)
         self._finalize()
-        self.converter = self.converter_factory(registry=self.registry)
+        timer.stop(getattr(self, "target", None), "opts")
+        self.converter = self._create_converter()
 
-        if schema is not None and self.register_as_scheme and hasattr(self, "target"):
-            self.converter.registry.register_scheme_factory(self.target, schema)
+        if schema is not None and hasattr(self, "target"):
+            if self.register_as_scheme:
+                self.registry.register_scheme_factory(self.target, schema)
+            if self.auto_nested:
+                # later references to the target from anywhere in the graph,
+                # including the target itself, resolve to this schema
+                self.converter.registry.register_scheme_factory(self.target, schema)
 
         del self.__sentinel
 
@@ -51,14 +103,9 @@ class AnnotationSchemaOpts(SchemaOpts):
             f(opts)
 
     def _extract_from(self, source):
-        if hasattr(source, "converter_factory"):
-            self.converter_factory = source.converter_factory
-        if hasattr(source, "register_as_scheme"):
-            self.register_as_scheme = source.register_as_scheme
-        if hasattr(source, "target"):
-            self.target = source.target
-        if hasattr(source, "registry"):
-            self.registry = source.registry
+        for name in _INHERITED_OPTIONS:
+            if hasattr(source, name):
+                setattr(self, name, getattr(source, name))
 
     def _gather_field_configs(self, schema, meta):
         def merge_field_configs(opts):
@@ -87,9 +134,79 @@ class AnnotationSchemaOpts(SchemaOpts):
         self.converter_factory = getattr(self, "converter_factory", BaseConverter)
         self.register_as_scheme = getattr(self, "register_as_scheme", False)
         self.registry = getattr(self, "registry", registry)
+        self.compile_dump = getattr(self, "compile_dump", False)
+        self.compile_load = getattr(self, "compile_load", False)
+        self.lazy = getattr(self, "lazy", False)
+        self.field_cache = getattr(self, "field_cache", None)
+        self.instrument = getattr(self, "instrument", None)
+        self.auto_nested = getattr(self, "auto_nested", False)
+        self.max_depth = getattr(self, "max_depth", None)
+
+    def _create_converter(self):
+        if not self.auto_nested:
+            return self.converter_factory(registry=self.registry)
+
+        graph = _nesting_graph(self.registry)
+        return self.converter_factory(
+            registry=graph, auto_nested=partial(_generate_nested, graph)
+        )
+
+
+# registries holding the schema generated for a graph of targets, schema
+# generated while converting the graph share it rather than starting another
+_nesting_graphs: "WeakSet[TypeRegistry]" = WeakSet()
+
+
+def _nesting_graph(registry: TypeRegistry) -> TypeRegistry:
+    if registry in _nesting_graphs:
+        return registry
+
+    new_child = getattr(registry, "new_child", None)
+    graph = new_child() if new_child is not None else registry
+    _nesting_graphs.add(graph)
+    return graph
+
+
+def _generate_nested(graph: TypeRegistry, target: type) -> None:
+    from .dynamic import schema_for
+
+    # creating the schema registers it with the graph before any fields are
+    # generated, lazy defers generating them -- and resolving any forward
+    # references -- until the schema is first used
+    schema_for(target, registry=graph, auto_nested=True, lazy=True)
+
+
+def _dumped_size(result):
+    data = result.data if result is not None else None
+    return len(data) if isinstance(data, list) else 1
+
+
+def _loaded_size(result):
+    data = result[0] if result is not None else None
+    return len(data) if isinstance(data, list) else 1
+
+
+# guards deferred field generation, reentrant as generating one schema's
+# fields may require another's
+_deferred_fields_lock = RLock()
+
+# guards creating the instance pool of a schema
+_pool_lock = Lock()
 
 
 class AnnotationSchemaMeta(SchemaMeta):
+    # set by SchemaMeta.__new__, declared for type checkers
+    _declared_fields: Dict[str, FieldABC]
+
+    def __new__(mcls, name, bases, attrs):
+        # fields are inherited by way of _declared_fields so any deferred
+        # generation in a parent needs to happen before the subclass is made
+        for base in bases:
+            if isinstance(base, AnnotationSchemaMeta):
+                base.resolve_declared_fields()
+
+        return super().__new__(mcls, name, bases, attrs)
+
     @classmethod
     def get_declared_fields(mcls, klass, cls_fields, inherited_fields, dict_cls):
         fields = super().get_declared_fields(
@@ -101,16 +218,69 @@ class AnnotationSchemaMeta(SchemaMeta):
         if target is None:
             return fields
 
-        converter = klass.opts.converter
-
         # ignore anything explicitly declared on this scheme
         # or any parent scheme, also ignore anything explicitly
         # passed into exclude
         ignore = set(fields) | set(klass.opts.exclude)
-        fields.update(converter.convert_all(target, ignore, klass.opts.field_configs))
+        klass._generation_ignore = frozenset(ignore)
+
+        if klass.opts.lazy:
+            klass._deferred_fields_ignore = ignore
+            return fields
+
+        fields.update(mcls._generate_fields(klass, target, ignore))
+        return fields
 
+    @staticmethod
+    def _generate_fields(klass, target, ignore):
+        timer = profiler.timer()
+        opts = klass.opts
+        cache = opts.field_cache
+        key = cache.fingerprint(opts, target, ignore) if cache is not None else None
+
+        fields = cache.load(key) if key is not None else None
+        if fields is None:
+            fields = opts.converter.convert_all(target, ignore, opts.field_configs)
+            if key is not None:
+                cache.store(key, fields)
+
+        timer.stop(target, "generate")
         return fields
 
+    @property
+    def declared_fields(cls) -> Dict[str, FieldABC]:
+        """
+        The fields declared on and generated for the schema class, generating
+        them first if the schema is lazy. Shared by every instance of the
+        schema, so it must not be modified. Instances have their own copy as
+        ``declared_fields``.
+
+        :versionadded: 2.5.0
+        """
+        cls.resolve_declared_fields()
+        return cls._declared_fields
+
+    def resolve_declared_fields(cls) -> None:
+        """
+        Generates the fields of a schema declared with ``lazy = True`` if
+        that hasn't happened yet. Happens automatically the first time the
+        schema is instantiated or subclassed, but may be called to force
+        generation ahead of time. Safe to call from multiple threads, fields
+        are only ever generated once.
+        """
+        if "_deferred_fields_ignore" not in cls.__dict__:
+            return
+
+        with _deferred_fields_lock:
+            ignore = cls.__dict__.get("_deferred_fields_ignore")
+            if ignore is None:
+                return
+
+            fields = cls._declared_fields.copy()
+            fields.update(cls._generate_fields(cls, cls.opts.target, ignore))
+            cls._declared_fields = fields
+            del cls._deferred_fields_ignore
+
 
 class AnnotationSchema(Schema, metaclass=AnnotationSchemaMeta):
     """
@@ -124,10 +294,327 @@ class AnnotationSchema(Schema, metaclass=AnnotationSchemaMeta):
                 target = Artist
                 register_as_scheme = True
 
+
+    Setting ``compile_dump = True`` or ``compile_load = True`` on the Meta
+    generates a specialized serializer or deserializer for the schema that's
+    used whenever possible and ``lazy = True`` defers generating fields until
+    the schema is first used, see :ref:`performance` for details.
+
+    Setting ``instrument`` to a
+    :class:`~marshmallow_annotations.instrument.Collector` reports timings of
+    every dump, load and field, see :ref:`instrumentation`.
+
+    Setting ``auto_nested = True`` generates schema for any annotated class
+    reachable from the target that has no field factory, including recursive
+    and mutually referential ones, and ``max_depth`` bounds how deeply nested
+    values are dumped, see :ref:`recursive-targets`.
     """
 
     OPTIONS_CLASS_TYPE = AnnotationSchemaOpts
 
+    def __init__(self, *args, **kwargs):
+        type(self).resolve_declared_fields()
+        super().__init__(*args, **kwargs)
+
+        collector = self.opts.instrument
+        if collector is not None:
+            name = type(self).__name__
+            instrument_fields(collector, name, self.declared_fields)
+
     @classmethod
     def OPTIONS_CLASS(cls, meta):
         return cls.OPTIONS_CLASS_TYPE(meta, cls)
+
+    def dump(self, obj, many=None, update_fields=True, **kwargs):
+        collector = self.opts.instrument
+        if collector is None:
+            return self._bounded_dump(obj, many, update_fields, kwargs)
+        return call_timed(
+            collector,
+            type(self).__name__,
+            None,
+            "dump",
+            _dumped_size,
+            self._bounded_dump,
+            obj,
+            many,
+            update_fields,
+            kwargs,
+        )
+
+    def _bounded_dump(self, obj, many, update_fields, kwargs):
+        max_depth = self.opts.max_depth
+        state = _dump_depth
+        if max_depth is None or state.limit is not None:
+            return self._dump(obj, many, update_fields, **kwargs)
+
+        state.limit = max_depth
+        try:
+            return self._dump(obj, many, update_fields, **kwargs)
+        finally:
+            state.limit = None
+
+    def _dump(self, obj, many, update_fields, **kwargs):
+        dumper = None if kwargs else self._get_compiled_dumper()
+        if dumper is None:
+            return super().dump(obj, many=many, update_fields=update_fields, **kwargs)
+
+        many = self.many if many is None else bool(many)
+        if many and is_iterable_but_not_string(obj):
+            obj = list(obj)
+
+        # the compiled dumper only handles the happy path, anything else is
+        # redone by marshmallow so errors and exceptions are exactly the same
+        try:
+            result = dumper(obj, many)
+        except Exception:
+            return super().dump(obj, many=many, update_fields=update_fields)
+
+        if self._has_processors:
+            try:
+                result = self._invoke_dump_processors(
+                    POST_DUMP, result, many, original_data=obj
+                )
+            except ValidationError:
+                return super().dump(obj, many=many, update_fields=update_fields)
+
+        return MarshalResult(result, {})
+
+    def _get_compiled_dumper(self):
+        # instrumented schema time individual fields, which compiled code skips
+        if not self.opts.compile_dump or self.opts.instrument is not None:
+            return None
+
+        # generated code is bound to the current field instances, which are
+        # swapped out whenever marshmallow decides to update this schema's fields
+        compiled = self.__dict__.get("_compiled_dumper")
+        if compiled is None or compiled[0] is not self.fields:
+            compiled = (self.fields, compile_dumper(self))
+            self._compiled_dumper = compiled
+        return compiled[1]
+
+    def _do_load(self, data, many=None, partial=None, postprocess=True):
+        collector = self.opts.instrument
+        if collector is None:
+            return self._load(data, many, partial, postprocess)
+        return call_timed(
+            collector,
+            type(self).__name__,
+            None,
+            "load",
+            _loaded_size,
+            self._load,
+            data,
+            many,
+            partial,
+            postprocess,
+        )
+
+    def _load(self, data, many, partial, postprocess):
+        loader = None
+        if postprocess and not (self.partial if partial is None else partial):
+            loader = self._get_compiled_loader()
+
+        if loader is not None:
+            # see dump, anything off the happy path is redone by marshmallow
+            try:
+                return loader(data, self.many if many is None else bool(many)), {}
+            except Exception:
+                pass
+
+        return super()._do_load(
+            data, many=many, partial=partial, postprocess=postprocess
+        )
+
+    def _get_compiled_loader(self):
+        if not self.opts.compile_load or self.opts.instrument is not None:
+            return None
+
+        compiled = self.__dict__.get("_compiled_loader")
+        if compiled is None or compiled[0] is not self.fields:
+            loader = compile_loader(self, self._get_target_constructor())
+            compiled = (self.fields, loader)
+            self._compiled_loader = compiled
+        return compiled[1]
+
+    def dump_iter(self, objs, chunk_size=1000, encode=False):
+        """
+        Dumps an iterable of objects incrementally instead of building every
+        result up front like ``dump(objs, many=True)`` does. Any iterable is
+        accepted, including generators and database cursors, and only
+        ``chunk_size`` objects are dumped at a time::
+
+            for data in schema.dump_iter(cursor):
+                ...
+
+            response.body = schema.dump_iter(cursor, encode=True)
+
+
+        Yields the serialized dicts, or with ``encode=True`` chunks of bytes
+        that together form a JSON array. Errors raise a
+        :class:`~marshmallow.exceptions.ValidationError` whose indices refer
+        to positions in the entire iterable, for strict schema as well.
+        """
+        return dump_iter(self, objs, chunk_size, encode)
+
+    def load_iter(self, source, chunk_size=1000, with_errors=False):
+        """
+        Loads records incrementally instead of all at once like
+        ``load(data, many=True)`` does. The source may be any iterable of
+        dicts or a file like object holding newline delimited JSON, including
+        memory mapped files; records are loaded ``chunk_size`` at a time::
+
+            with open("artists.ndjson", "rb") as fh:
+                for artist in schema.load_iter(fh):
+                    ...
+
+
+        Yields loaded objects, an invalid record raises a
+        :class:`~marshmallow.exceptions.ValidationError` keyed by its position
+        in the source. With ``with_errors=True`` yields ``(obj, errors)``
+        pairs for every record instead, where ``errors`` is empty for valid
+        records.
+        """
+        return load_iter(self, source, chunk_size, with_errors)
+
+    def async_dump(self, obj, many=None, chunk_size=1000, executor=None):
+        """
+        Coroutine version of ``dump`` that doesn't block the event loop for
+        the entire payload::
+
+            result = await schema.async_dump(artists, many=True)
+
+
+        ``many=True`` payloads are dumped ``chunk_size`` objects at a time,
+        between chunks control returns to the event loop. If an ``executor``
+        is given every chunk is dumped there instead. The result is the same
+        as dump's, except that ``pass_many`` processors see one chunk at a
+        time.
+        """
+        return async_dump(self, obj, many, chunk_size, executor)
+
+    def async_load(self, data, many=None, chunk_size=1000, executor=None):
+        """
+        Coroutine version of ``load``, chunked like
+        :meth:`~marshmallow_annotations.scheme.AnnotationSchema.async_dump`.
+        As processors run per chunk, ``post_load`` is skipped only for chunks
+        containing invalid data rather than for the entire payload.
+        """
+        return async_load(self, data, many, chunk_size, executor)
+
+    def dump_aiter(self, objs, chunk_size=1000, encode=False, executor=None):
+        """
+        Asynchronous generator version of
+        :meth:`~marshmallow_annotations.scheme.AnnotationSchema.dump_iter`
+        for streaming responses. Accepts regular and asynchronous iterables
+        and hands control back to the event loop, or uses the ``executor``,
+        like :meth:`~marshmallow_annotations.scheme.AnnotationSchema.async_dump`::
+
+            async for piece in schema.dump_aiter(cursor, encode=True):
+                await response.write(piece)
+        """
+        return dump_aiter(self, objs, chunk_size, encode, executor)
+
+    def dump_columns(self, objs, numpy=False):
+        """
+        Dumps a list of objects of the same kind into a dictionary of columns
+        rather than a list of dictionaries::
+
+            >>> PointScheme().dump_columns([Point(1, 2), Point(3, 4)])
+            {'x': [1, 3], 'y': [2, 4]}
+
+
+        Each column is pulled from all objects in a single pass -- by position
+        for NamedTuple targets -- and columns of plain values are formatted in
+        bulk. Other fields, and values of unexpected types, go through the
+        field as usual. Values missing from an object are ``None`` in its
+        column. Schema with dump processors are dumped as usual and the result
+        transposed. Errors raise a
+        :class:`~marshmallow.exceptions.ValidationError`.
+
+        With ``numpy=True`` columns of integer, float and boolean fields that
+        contain no ``None`` are returned as NumPy arrays.
+        """
+        return dump_columns(self, objs, numpy)
+
+    def parallel_dump(self, objs, chunk_size=10000, executor=None, max_workers=None):
+        """
+        Dumps a large batch across a pool of processes, ``chunk_size``
+        objects per task. Results and errors are merged in input order, with
+        errors keyed by position in the entire batch::
+
+            result = schema.parallel_dump(records, max_workers=16)
+
+
+        A :class:`~concurrent.futures.ProcessPoolExecutor` is created for the
+        call unless an ``executor`` is given. The schema isn't pickled,
+        workers import it by reference and create it with the same ``only``,
+        ``exclude``, ``strict``, ``context``, ``load_only`` and ``dump_only``,
+        so the schema must be declared at module level or be made by
+        :func:`~marshmallow_annotations.dynamic.schema_for` for a module
+        level target. Objects and results must be picklable.
+        """
+        return parallel_dump(self, objs, chunk_size, executor, max_workers)
+
+    def parallel_load(self, data, chunk_size=10000, executor=None, max_workers=None):
+        """
+        Loads a large batch across a pool of processes, see
+        :meth:`~marshmallow_annotations.scheme.AnnotationSchema.parallel_dump`.
+        Chunks containing invalid records are loaded again record by record,
+        so ``post_load`` still runs for every valid record.
+        """
+        return parallel_load(self, data, chunk_size, executor, max_workers)
+
+    @classmethod
+    def pooled(cls, **kwargs):
+        """
+        Checks out an instance of this schema from a per thread pool for the
+        duration of a with block, accepts the same arguments as the schema::
+
+            with ArtistScheme.pooled(many=True) as schema:
+                schema.dump(artists)
+
+
+        See :class:`~marshmallow_annotations.pool.SchemaPool` for details.
+        """
+        pool = cls.__dict__.get("_instance_pool")
+        if pool is None:
+            with _pool_lock:
+                pool = cls.__dict__.get("_instance_pool")
+                if pool is None:
+                    pool = SchemaPool(cls)
+                    cls._instance_pool = pool
+        return pool.checkout(**kwargs)
+
+    @classmethod
+    def explain(cls) -> List[FieldPlan]:
+        """
+        Describes how each generated field of this schema is arrived at, see
+        :class:`~marshmallow_annotations.converter.FieldPlan`. Fields are
+        generated again in the process, explicitly declared fields aren't
+        included.
+        """
+        opts = cls.opts
+        target = getattr(opts, "target", None)
+        if target is None:
+            return []
+
+        ignore: AbstractSet[str] = getattr(cls, "_generation_ignore", frozenset())
+        return opts.converter.explain(target, ignore, opts.field_configs)
+
+    def _get_noop_processors(self):
+        """
+        Non-public hookpoint for schema whose processors don't change anything
+        about the output, returns the names of those that
+        :meth:`~marshmallow_annotations.scheme.AnnotationSchema.dump_columns`
+        and generated code may skip.
+        """
+        return frozenset()
+
+    def _get_target_constructor(self):
+        """
+        Non-public hookpoint for schema that load into instances of their target,
+        returns a :class:`~marshmallow_annotations.marshalling.TargetConstructor`
+        that allows compiled loaders to build the target directly.
+        """
+        return None
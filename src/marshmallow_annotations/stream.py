@@ -0,0 +1,164 @@
+"""
+Incremental dumping and loading of large collections.
+
+``many=True`` builds the entire result in memory before returning it. The
+functions here split the input into chunks and hand out results chunk by
+chunk, so memory use is bounded by the chunk size rather than the size of the
+collection.
+"""
+
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from marshmallow.exceptions import ValidationError
+
+__all__ = ("chunked", "offset_errors", "dump_iter", "records", "load_iter")
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Splits an iterable into lists of at most ``size`` items, consuming it
+    only as far as needed.
+    """
+    if size < 1:
+        raise ValueError(f"chunk size must be at least 1, not {size!r}")
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def offset_errors(errors: Dict[Any, Any], offset: int) -> Dict[Any, Any]:
+    """
+    Shifts the indices of errors reported for a ``many=True`` chunk so they
+    refer to positions in the entire collection. Keys that aren't indices,
+    such as ``_schema``, are kept as they are.
+    """
+    if not offset:
+        return errors
+    return {(k + offset if isinstance(k, int) else k): v for k, v in errors.items()}
+
+
+def _dump_chunk(schema, chunk: List[Any], offset: int) -> List[Any]:
+    try:
+        data, errors = schema.dump(chunk, many=True)
+    except ValidationError as e:
+        # strict schema
+        data, errors = e.data, e.messages
+    if errors:
+        raise ValidationError(offset_errors(errors, offset), data=data)
+    return data
+
+
+class _ArrayEncoder:
+    # encodes chunks of dumped data as consecutive pieces of one JSON array
+    def __init__(self, dumps: Any) -> None:
+        self.dumps = dumps
+        self.separator = b"["
+
+    def encode(self, data: List[Any]) -> bytes:
+        if not data:
+            return b""
+        piece = self.separator + ",".join(self.dumps(d) for d in data).encode("utf-8")
+        self.separator = b","
+        return piece
+
+    def close(self) -> bytes:
+        # an empty iterable is still an (empty) array
+        return b"[]" if self.separator == b"[" else b"]"
+
+
+def dump_iter(
+    schema, objs: Iterable[Any], chunk_size: int = 1000, encode: bool = False
+) -> Iterator[Any]:
+    """
+    Dumps any iterable -- including generators and database cursors -- one
+    chunk at a time, see
+    :meth:`~marshmallow_annotations.scheme.AnnotationSchema.dump_iter`.
+    """
+    encoder = _ArrayEncoder(schema.opts.json_module.dumps) if encode else None
+    offset = 0
+
+    for chunk in chunked(objs, chunk_size):
+        data = _dump_chunk(schema, chunk, offset)
+        offset += len(chunk)
+
+        if encoder is None:
+            yield from data
+            continue
+
+        piece = encoder.encode(data)
+        if piece:
+            yield piece
+
+    if encoder is not None:
+        yield encoder.close()
+
+
+def records(source: Any, loads: Any) -> Iterator[Any]:
+    """
+    Yields the records of a source one at a time. File like sources -- any
+    object with ``readline``, including memory mapped files -- are read as
+    newline delimited JSON, as are strings and bytes in any other iterable.
+    Everything else is yielded as it is. Blank lines are skipped.
+    """
+    readline = getattr(source, "readline", None)
+    if readline is not None:
+        # mmap objects have readline but iterate byte by byte
+        lines: Iterable[Any] = iter(readline, source.read(0))
+    else:
+        lines = source
+
+    for line in lines:
+        if isinstance(line, (str, bytes)):
+            if not line.strip():
+                continue
+            line = loads(line)
+        yield line
+
+
+def _load_one(schema, record: Any) -> Tuple[Any, Dict[Any, Any]]:
+    try:
+        # a schema created with many=True would treat the record as a list
+        return schema.load(record, many=False)
+    except ValidationError as e:
+        # strict schema
+        return e.data, e.messages
+
+
+def load_iter(
+    schema, source: Any, chunk_size: int = 1000, with_errors: bool = False
+) -> Iterator[Any]:
+    """
+    Loads records from an iterable or NDJSON stream one chunk at a time, see
+    :meth:`~marshmallow_annotations.scheme.AnnotationSchema.load_iter`.
+    """
+    offset = 0
+    for chunk in chunked(records(source, schema.opts.json_module.loads), chunk_size):
+        try:
+            data, errors = schema.load(chunk, many=True)
+        except ValidationError:
+            errors = True
+
+        if not errors:
+            if with_errors:
+                yield from ((obj, {}) for obj in data)
+            else:
+                yield from data
+            offset += len(chunk)
+            continue
+
+        # post load processors don't run for a chunk with any invalid record,
+        # the valid ones are loaded again on their own
+        for record in chunk:
+            obj, errors = _load_one(schema, record)
+            if with_errors:
+                yield obj, errors
+            elif errors:
+                raise ValidationError({offset: errors}, data=obj)
+            else:
+                yield obj
+            offset += 1
@@ -0,0 +1,149 @@
+"""
+Building every schema ahead of time.
+
+Schema are cheap to declare but do most of their work -- generating deferred
+fields, resolving nested schema by name, creating shared nested instances --
+the first time they're used. In a preforking server that happens in every
+worker, each ending up with a private copy. :func:`warmup` does all of it in
+the parent process instead so workers share the result copy on write.
+"""
+
+import gc
+from collections import deque
+from time import perf_counter
+from typing import (
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from marshmallow import class_registry
+from marshmallow.base import SchemaABC
+from marshmallow.exceptions import RegistryError
+
+from .base import TypeRegistry
+from .fields import _nested_fields
+from .registry import registry as default_registry
+from .scheme import AnnotationSchema, AnnotationSchemaMeta
+
+__all__ = ("WarmupReport", "all_subclasses", "warmup")
+
+
+class WarmupReport(NamedTuple):
+    """
+    What :func:`warmup` did:
+
+    - schemas: every schema class that was built
+    - nested: the number of nested schema instances created
+    - errors: ``(schema class, exception)`` for every schema that failed
+    - frozen: whether the garbage collector was frozen afterwards
+    - duration: the time taken, in seconds
+    """
+
+    schemas: Tuple[type, ...]
+    nested: int
+    errors: Tuple[Tuple[type, Exception], ...]
+    frozen: bool
+    duration: float
+
+
+T = TypeVar("T")
+
+
+def all_subclasses(cls: Type[T]) -> List[Type[T]]:
+    """
+    Every class derived from ``cls``, directly or not.
+    """
+    found: List[Type[T]] = []
+    pending = [cls]
+    while pending:
+        subclasses: List[Type[T]] = pending.pop().__subclasses__()
+        for sub in subclasses:
+            if sub not in found:
+                found.append(sub)
+                pending.append(sub)
+    return found
+
+
+def _registered_schemas(registry: TypeRegistry) -> Iterator[type]:
+    flatten = getattr(registry, "_flatten", None)
+    if flatten is None:
+        return
+
+    for factory in flatten().values():
+        scheme = getattr(factory, "__scheme__", None)
+        if isinstance(scheme, str):
+            try:
+                scheme = class_registry.get_class(scheme)
+            except RegistryError:
+                continue
+        if isinstance(scheme, type) and issubclass(scheme, SchemaABC):
+            yield scheme
+
+
+def warmup(
+    registries: Iterable[TypeRegistry] = (default_registry,), freeze: bool = False
+) -> WarmupReport:
+    """
+    Fully builds every subclass of
+    :class:`~marshmallow_annotations.scheme.AnnotationSchema` and every schema
+    registered as a scheme in ``registries``: deferred fields are generated,
+    which also resolves and caches type hints, and nested schema -- including
+    ones referred to by name -- are resolved and their shared instances
+    created, all the way down. Meant to be called before forking workers,
+    e.g. from a gunicorn config with ``preload_app``::
+
+        def on_starting(server):
+            report = warmup(freeze=True)
+            server.log.info("built %d schema", len(report.schemas))
+
+
+    ``freeze=True`` calls :func:`gc.freeze` afterwards, where available, so
+    the garbage collector in the workers doesn't touch -- and thereby copy --
+    the pages holding everything built here. Schema that fail to build are
+    reported rather than raised.
+    """
+    start = perf_counter()
+    pending: Deque[type] = deque(all_subclasses(AnnotationSchema))
+    for registry in registries:
+        pending.extend(_registered_schemas(registry))
+
+    seen: Set[type] = set()
+    built: List[type] = []
+    errors: List[Tuple[type, Exception]] = []
+    nested = 0
+
+    while pending:
+        schema_class = pending.popleft()
+        if schema_class in seen:
+            continue
+        seen.add(schema_class)
+
+        try:
+            # plain marshmallow schema may be registered as schemes as well
+            if isinstance(schema_class, AnnotationSchemaMeta):
+                schema_class.resolve_declared_fields()
+            schema = schema_class()
+            for field in _nested_fields(schema.fields.values()):
+                pending.append(type(field.schema))
+                nested += 1
+        except Exception as e:
+            errors.append((schema_class, e))
+            continue
+        built.append(schema_class)
+
+    frozen = False
+    if freeze and hasattr(gc, "freeze"):
+        gc.collect()
+        gc.freeze()
+        frozen = True
+
+    return WarmupReport(
+        tuple(built), nested, tuple(errors), frozen, perf_counter() - start
+    )
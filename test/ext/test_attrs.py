@@ -163,3 +163,57 @@ def test_handles_contained_not_attrs_class(registry_):
     result = s.dump(inst)
     assert not result.errors
     assert result.data == expected
+
+
+def test_compiled_load_builds_target_directly(registry_):
+    class SomeClassSchema(AttrsSchema):
+        class Meta:
+            registry = registry_
+            target = SomeClass
+            compile_load = True
+
+    s = SomeClassSchema()
+
+    def explode(data):
+        raise AssertionError("make_object should have been bypassed")
+
+    s.make_object = explode
+    result = s.load([{"a": 1}, {"a": 2, "b": 3, "f": [1, 2]}], many=True)
+
+    expected = [SomeClass(a=1), SomeClass(a=2, b=3, f=[1, 2])]  # type: ignore
+    assert not result.errors
+    assert result.data == expected
+
+
+def test_compiled_load_reports_same_errors(registry_):
+    class SomeClassSchema(AttrsSchema):
+        class Meta:
+            registry = registry_
+            target = SomeClass
+
+    class CompiledSomeClassSchema(SomeClassSchema):
+        class Meta:
+            compile_load = True
+
+    expected = SomeClassSchema().load({"b": "x"})
+    result = CompiledSomeClassSchema().load({"b": "x"})
+
+    assert result.errors == expected.errors
+    assert result.data == expected.data
+
+
+def test_compiled_load_respects_overridden_make_object(registry_):
+    class SomeClassSchema(AttrsSchema):
+        class Meta:
+            registry = registry_
+            target = SomeClass
+            compile_load = True
+
+        @ma.post_load
+        def make_object(self, data):
+            return data
+
+    result = SomeClassSchema().load({"a": 1})
+
+    assert not result.errors
+    assert result.data == {"a": 1, "d": 1, "e": ""}
@@ -70,3 +70,19 @@ def test_no_dump_default_fields(registry_):
     expected2 = {"a": 1, "b": 5, "c": None}
     assert not result2.errors
     assert result2.data == expected2
+
+
+def test_compiled_load_builds_target_directly(registry_):
+    class SomeTupleSchema(NamedTupleSchema):
+        class Meta:
+            registry = registry_
+            target = SomeTuple
+            compile_load = True
+
+    s = SomeTupleSchema()
+    result = s.load([{"a": 1}, {"a": 2, "b": "3", "c": None}], many=True)
+
+    expected = [SomeTuple(a=1, b=None, c=5), SomeTuple(a=2, b=3, c=None)]
+    assert s._get_compiled_loader() is not None
+    assert not result.errors
+    assert result.data == expected
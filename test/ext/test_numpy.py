@@ -0,0 +1,104 @@
+from typing import Optional
+
+from marshmallow import ValidationError
+
+import pytest
+from marshmallow_annotations.scheme import AnnotationSchema
+
+numpy = pytest.importorskip("numpy")
+
+from marshmallow_annotations.ext.numpy import (  # noqa: E402 isort:skip
+    Array,
+    NDArray,
+    Scalar,
+    register_numpy,
+)
+
+
+class Sensor:
+    name: str
+    gain: numpy.float32
+    count: numpy.int64
+    active: numpy.bool_
+    samples: NDArray[numpy.float64]
+    raw: Optional[numpy.ndarray]
+
+    def __init__(self, name, gain, count, active, samples, raw=None):
+        self.name = name
+        self.gain = gain
+        self.count = count
+        self.active = active
+        self.samples = samples
+        self.raw = raw
+
+
+@pytest.fixture
+def sensor_scheme(registry_):
+    register_numpy(registry_)
+
+    class SensorScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Sensor
+
+            class Fields:
+                samples = {"encoding": "base64"}
+
+    return SensorScheme
+
+
+def test_round_trips_numpy_values(sensor_scheme):
+    schema = sensor_scheme()
+    sensor = Sensor(
+        "probe",
+        numpy.float32(0.5),
+        numpy.int64(3),
+        numpy.bool_(True),
+        numpy.linspace(0, 1, 5),
+        numpy.arange(6).reshape(2, 3),
+    )
+
+    dumped = schema.dump(sensor).data
+    loaded = schema.load(dumped).data
+
+    assert dumped["gain"] == 0.5 and type(dumped["gain"]) is float
+    assert dumped["count"] == 3 and dumped["active"] is True
+    assert isinstance(dumped["samples"], str)
+    assert dumped["raw"] == [[0, 1, 2], [3, 4, 5]]
+    assert type(loaded["count"]) is numpy.int64
+    assert loaded["samples"].dtype == numpy.float64
+    assert numpy.array_equal(loaded["samples"], sensor.samples)
+    assert numpy.array_equal(loaded["raw"], sensor.raw)
+
+
+def test_base64_arrays_are_little_endian_and_writable():
+    field = Array(">i4", encoding="base64")
+    array = numpy.array([1, 2, 3], dtype=">i4")
+
+    dumped = field.serialize("a", {"a": array})
+    loaded = field.deserialize(dumped)
+
+    assert numpy.array_equal(loaded, array)
+    assert loaded.flags.writeable
+    assert field.serialize("a", {"a": array.astype("<i4")}) == dumped
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        (Array(float), "not a list"),
+        (Array(float), ["a", "b"]),
+        (Array(float, encoding="base64"), "not base64!"),
+        (Array(float, encoding="base64"), "AAAA"),
+        (Scalar(numpy.bool_), "false"),
+        (Scalar(numpy.int32), "x"),
+    ],
+)
+def test_rejects_invalid_values(field, value):
+    with pytest.raises(ValidationError):
+        field.deserialize(value)
+
+
+def test_base64_encoding_requires_dtype():
+    with pytest.raises(ValueError):
+        Array(encoding="base64")
@@ -0,0 +1,122 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from marshmallow import ValidationError
+
+import pytest
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Reading:
+    id: int
+    name: str
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_async_dump_matches_dump(registry_, use_executor):
+    class ReadingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Reading
+
+    schema = ReadingScheme()
+    readings = [{"id": i, "name": str(i)} for i in range(5)]
+
+    with ThreadPoolExecutor(1) as executor:
+        result = run(
+            schema.async_dump(
+                readings,
+                many=True,
+                chunk_size=2,
+                executor=executor if use_executor else None,
+            )
+        )
+
+    assert result == schema.dump(readings, many=True)
+    assert run(schema.async_dump(readings[0])) == schema.dump(readings[0])
+
+
+def test_async_dump_yields_to_event_loop_between_chunks(registry_):
+    class ReadingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Reading
+
+    schema = ReadingScheme()
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0)
+        await schema.async_dump([{"id": 1}] * 10, many=True, chunk_size=2)
+        task.cancel()
+
+    run(main())
+
+    assert len(ticks) >= 5
+
+
+def test_async_load_merges_chunk_errors(registry_):
+    class ReadingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Reading
+
+    data = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": "x", "name": "c"}]
+
+    result = run(ReadingScheme().async_load(data, many=True, chunk_size=2))
+
+    assert result.data[:2] == data[:2]
+    assert list(result.errors) == [2]
+
+
+def test_async_load_offsets_strict_errors(registry_):
+    class ReadingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Reading
+
+    schema = ReadingScheme(strict=True)
+    data = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": "x", "name": "c"}]
+
+    with pytest.raises(ValidationError) as excinfo:
+        run(schema.async_load(data, many=True, chunk_size=2))
+
+    assert list(excinfo.value.messages) == [2]
+
+
+def test_dump_aiter_accepts_async_iterables(registry_):
+    class ReadingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Reading
+
+    schema = ReadingScheme()
+    readings = [{"id": i, "name": str(i)} for i in range(5)]
+
+    async def source():
+        for reading in readings:
+            yield reading
+
+    async def collect(objs, **kwargs):
+        return [piece async for piece in schema.dump_aiter(objs, **kwargs)]
+
+    dumped = run(collect(source(), chunk_size=2))
+    encoded = run(collect(readings, chunk_size=2, encode=True))
+
+    assert dumped == schema.dump(readings, many=True).data
+    assert json.loads(b"".join(encoded)) == dumped
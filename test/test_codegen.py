@@ -0,0 +1,187 @@
+import datetime
+import typing as t
+
+from marshmallow import Schema, post_dump, validates
+
+import pytest
+from marshmallow_annotations.__main__ import main
+from marshmallow_annotations.codegen import plan_schema, render_module
+from marshmallow_annotations.exceptions import MarshmallowAnnotationError
+from marshmallow_annotations.ext.namedtuple import NamedTupleSchema
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Track:
+    name: str
+    length: t.Optional[int]
+
+
+class Album:
+    name: str
+    released: datetime.date
+    tracks: t.List[Track]
+
+
+class TrackScheme(AnnotationSchema):
+    class Meta:
+        target = Track
+        register_as_scheme = True
+
+
+class AlbumScheme(AnnotationSchema):
+    class Meta:
+        target = Album
+        register_as_scheme = True
+
+        class Fields:
+            name = {"load_from": "title", "dump_to": "title"}
+
+
+class Unrenderable(AnnotationSchema):
+    class Meta:
+        target = Track
+
+        class Fields:
+            name = {"validate": lambda v: True}
+
+
+class OrderedTrackScheme(AnnotationSchema):
+    class Meta:
+        target = Track
+        ordered = True
+        exclude = ("length",)
+
+
+class ShoutingTrackScheme(AnnotationSchema):
+    @post_dump
+    def shout(self, data):
+        return {k: v.upper() for k, v in data.items()}
+
+    class Meta:
+        target = Track
+
+
+class ValidatedTrackScheme(AnnotationSchema):
+    @validates("name")
+    def validate_name(self, value):
+        pass
+
+    class Meta:
+        target = Track
+
+
+class Point(t.NamedTuple):
+    x: int
+    y: int = 0
+
+
+class SparsePointScheme(NamedTupleSchema):
+    class Meta:
+        target = Point
+        dump_default_fields = False
+
+
+class PointScheme(NamedTupleSchema):
+    class Meta:
+        target = Point
+
+
+def compile_module(source):
+    namespace = {}
+    exec(compile(source, "<generated>", "exec"), namespace)
+    return namespace
+
+
+def test_generated_schema_behaves_like_the_original():
+    source = render_module([f"{__name__}:TrackScheme", f"{__name__}:AlbumScheme"])
+    namespace = compile_module(source)
+
+    album = Album()
+    album.name = "Ashes"
+    album.released = datetime.date(2018, 1, 1)
+    track = Track()
+    track.name = "Embers"
+    track.length = None
+    album.tracks = [track]
+
+    generated = namespace["AlbumScheme"]()
+    assert isinstance(generated, Schema)
+    assert not isinstance(generated, AnnotationSchema)
+    assert generated.dump(album).data == AlbumScheme().dump(album).data
+
+    payload = {"title": "Ashes", "released": "2018-01-01", "tracks": [{"name": "x"}]}
+    assert generated.load(payload) == AlbumScheme().load(payload)
+
+
+def test_nested_refers_to_generated_schema():
+    source = render_module([f"{__name__}:AlbumScheme", f"{__name__}:TrackScheme"])
+
+    assert source.index("class TrackScheme") < source.index("class AlbumScheme")
+    assert "fields.Nested(TrackScheme, required=True, many=True)" in source
+    assert "import TrackScheme" not in source
+
+
+def test_plain_target_gets_schema_name():
+    planned = plan_schema(f"{__name__}:Track")
+
+    assert planned.name == "TrackSchema"
+    assert planned.target is Track
+    assert set(planned.fields) == {"name", "length"}
+    assert not planned.constructs_target
+
+
+class TrackSchema(AnnotationSchema):
+    class Meta:
+        target = Track
+
+
+def test_colliding_names_raise():
+    with pytest.raises(MarshmallowAnnotationError):
+        render_module([f"{__name__}:TrackSchema", f"{__name__}:Track"])
+
+
+def test_unrenderable_values_raise():
+    with pytest.raises(MarshmallowAnnotationError):
+        render_module([f"{__name__}:Unrenderable"])
+
+
+def test_schema_options_are_rendered():
+    namespace = compile_module(render_module([f"{__name__}:OrderedTrackScheme"]))
+    generated = namespace["OrderedTrackScheme"]
+
+    assert generated.opts.ordered
+    assert generated.opts.exclude == ("length",)
+
+
+@pytest.mark.parametrize(
+    "name", ["ShoutingTrackScheme", "ValidatedTrackScheme", "SparsePointScheme"]
+)
+def test_custom_processors_and_validators_raise(name):
+    with pytest.raises(MarshmallowAnnotationError):
+        render_module([f"{__name__}:{name}"])
+
+
+def test_noop_processors_and_constructor_are_allowed():
+    namespace = compile_module(render_module([f"{__name__}:PointScheme"]))
+
+    assert namespace["PointScheme"]().load({"x": 1}).data == Point(1)
+
+
+def test_output_is_deterministic():
+    references = [f"{__name__}:TrackScheme", f"{__name__}:AlbumScheme"]
+    assert render_module(references) == render_module(references)
+
+
+def test_check_reports_stale_output(tmp_path, capsys):
+    output = str(tmp_path / "generated.py")
+    reference = f"{__name__}:TrackScheme"
+
+    assert main(["compile", reference, "-o", output, "--check"]) == 1
+    assert main(["compile", reference, "-o", output]) == 0
+    assert main(["compile", reference, "-o", output, "--check"]) == 0
+
+    with open(output, "a") as fh:
+        fh.write("# edited\n")
+
+    assert main(["compile", reference, "-o", output, "--check"]) == 1
+    assert "out of date" in capsys.readouterr().err
@@ -0,0 +1,138 @@
+import typing as t
+from datetime import date, datetime
+from uuid import UUID
+
+import attr
+from marshmallow import ValidationError, fields, post_dump
+
+import pytest
+from marshmallow_annotations.ext.attrs import AttrsSchema
+from marshmallow_annotations.ext.namedtuple import NamedTupleSchema
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Point(t.NamedTuple):
+    x: int
+    y: float
+    label: t.Optional[str] = None
+
+
+@attr.s(auto_attribs=True)
+class Reading:
+    id: UUID
+    day: date
+    taken: datetime
+    value: float
+
+
+def test_dump_columns_matches_dump(registry_):
+    class PointScheme(NamedTupleSchema):
+        class Meta:
+            registry = registry_
+            target = Point
+
+    schema = PointScheme()
+    points = [Point(1, 2.0, "a"), Point(3, 4.5)]
+
+    columns = schema.dump_columns(points)
+    rows = schema.dump(points, many=True).data
+
+    assert columns == {key: [row[key] for row in rows] for key in rows[0]}
+
+
+def test_dump_columns_formats_attrs_columns(registry_):
+    class ReadingScheme(AttrsSchema):
+        class Meta:
+            registry = registry_
+            target = Reading
+
+    schema = ReadingScheme()
+    readings = [
+        Reading(UUID(int=1), date(2020, 1, 2), datetime(2020, 1, 2, 3, 4), 1.5),
+        Reading(UUID(int=2), date(2020, 1, 3), datetime(2020, 1, 3, 3, 4), 2.5),
+    ]
+
+    columns = schema.dump_columns(readings)
+    rows = schema.dump(readings, many=True).data
+
+    assert columns == {key: [row[key] for row in rows] for key in rows[0]}
+
+
+def test_dump_columns_falls_back_for_unexpected_values(registry_):
+    class PointScheme(NamedTupleSchema):
+        class Meta:
+            registry = registry_
+            target = Point
+
+    schema = PointScheme()
+
+    columns = schema.dump_columns([Point(True, 1, None), Point(2, "3.5")])
+
+    assert columns == {"x": [1, 2], "y": [1.0, 3.5], "label": [None, None]}
+
+
+def test_dump_columns_transposes_schema_with_processors(registry_):
+    class Plain:
+        x: int
+
+        def __init__(self, x):
+            self.x = x
+
+    class DoublingScheme(AnnotationSchema):
+        @post_dump
+        def double(self, data):
+            return {"x": data["x"] * 2}
+
+        class Meta:
+            registry = registry_
+            target = Plain
+
+    assert DoublingScheme().dump_columns([Plain(1), Plain(2)]) == {"x": [2, 4]}
+
+
+def test_dump_columns_reports_errors_by_index(registry_):
+    class Plain:
+        x: int
+
+        def __init__(self, x):
+            self.x = x
+
+    class PlainScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Plain
+
+    with pytest.raises(ValidationError) as excinfo:
+        PlainScheme().dump_columns([Plain(1), Plain("x")])
+
+    assert list(excinfo.value.messages) == [1]
+
+
+def test_dump_columns_as_numpy_arrays(registry_):
+    numpy = pytest.importorskip("numpy")
+
+    class PointScheme(NamedTupleSchema):
+        class Meta:
+            registry = registry_
+            target = Point
+
+    schema = PointScheme()
+
+    columns = schema.dump_columns([Point(1, 2.0), Point(3, 4.0)], numpy=True)
+
+    assert isinstance(columns["x"], numpy.ndarray)
+    assert columns["y"].tolist() == [2.0, 4.0]
+    assert columns["label"] == [None, None]
+
+
+def test_dump_columns_keys_columns_by_dump_to(registry_):
+    class LabelledScheme(NamedTupleSchema):
+        label = fields.String(dump_to="name")
+
+        class Meta:
+            registry = registry_
+            target = Point
+
+    columns = LabelledScheme().dump_columns([Point(1, 2.0, "a")])
+
+    assert columns["name"] == ["a"]
@@ -2,7 +2,13 @@ import typing
 
 from marshmallow import fields, missing
 
-from marshmallow_annotations.converter import BaseConverter
+import pytest
+from marshmallow_annotations import converter as converter_module
+from marshmallow_annotations.converter import (
+    BaseConverter,
+    get_cached_type_hints,
+    invalidate_type_hints,
+)
 
 
 class SomeType:
@@ -106,3 +112,169 @@ def test_can_convert_Dict_type_to_DictField(registry_):
     generated_fields = converter.convert_all(HasDictField)
 
     assert isinstance(generated_fields["mapping"], fields.Dict)
+
+
+@pytest.fixture
+def hint_calls(monkeypatch):
+    calls = []
+    own_type_hints = converter_module._own_type_hints
+
+    def tattle(cls):
+        calls.append(cls)
+        return own_type_hints(cls)
+
+    monkeypatch.setattr(converter_module, "_own_type_hints", tattle)
+    yield calls
+    invalidate_type_hints()
+
+
+def test_type_hints_resolved_once_per_class(registry_, hint_calls):
+    class Base:
+        id: int
+
+    class Left(Base):
+        name: str
+
+    class Right(Base):
+        points: typing.List[float]
+
+    converter = BaseConverter(registry=registry_)
+    converter.convert_all(Left)
+    converter.convert_all(Right)
+    converter.convert_all(Left)
+
+    assert hint_calls.count(Base) == 1
+    assert hint_calls.count(Left) == 1
+    assert hint_calls.count(Right) == 1
+
+
+_evaluated = []
+
+
+def evaluated(hint):
+    _evaluated.append(hint)
+    return hint
+
+
+def test_string_annotations_of_shared_bases_are_evaluated_once(registry_):
+    class Base:
+        id: "evaluated(int)"
+
+    class Left(Base):
+        name: "evaluated(str)"
+
+    class Right(Base):
+        pass
+
+    converter = BaseConverter(registry=registry_)
+    try:
+        for target in (Base, Left, Right):
+            converter.convert_all(target)
+    finally:
+        invalidate_type_hints()
+
+    assert _evaluated == [int, str]
+
+
+def test_string_annotations_resolve_like_get_type_hints():
+    class Annotated:
+        Alias = int
+        alias: "Alias"
+        hint: "typing.Optional[SomeType]"
+        constant: "typing.ClassVar[int]" = 1
+
+    assert get_cached_type_hints(Annotated) == typing.get_type_hints(Annotated)
+
+
+def test_invalidating_type_hints_includes_subclasses(hint_calls):
+    class Base:
+        id: int
+
+    class Child(Base):
+        name: str
+
+    get_cached_type_hints(Child)
+    invalidate_type_hints(Base)
+    get_cached_type_hints(Child)
+
+    assert hint_calls.count(Child) == 2
+
+
+def test_unresolved_type_hints_are_not_cached(hint_calls):
+    class Later:
+        other: "NotYetDefined"  # noqa: F821
+
+    with pytest.raises(NameError):
+        get_cached_type_hints(Later)
+
+    Later.__annotations__["other"] = "int"
+
+    assert get_cached_type_hints(Later) == {"other": int}
+
+
+def test_explain_describes_generated_fields(registry_):
+    class Explained:
+        id: int
+        name: typing.Optional[str]
+        tags: typing.List[str]
+
+    converter = BaseConverter(registry=registry_)
+    configs = {"id": {"dump_to": "ident"}}
+    plans = {p.name: p for p in converter.explain(Explained, configs=configs)}
+
+    assert plans["id"].factory is registry_.get(int)
+    assert plans["id"].kwargs["dump_to"] == "ident"
+    assert isinstance(plans["id"].field, fields.Integer)
+    assert plans["name"].optional
+    assert plans["name"].base is str
+    assert plans["name"].kwargs["allow_none"]
+    assert plans["tags"].base in (list, typing.List)
+    assert plans["tags"].subtypes == (str,)
+    assert all(p.duration >= 0 for p in plans.values())
+    assert configs == {"id": {"dump_to": "ident"}}
+
+
+def test_identical_hints_are_cloned_from_a_prototype(registry_):
+    calls = []
+
+    def counting(converter, subtypes, opts):
+        calls.append(opts)
+        return fields.String(**opts)
+
+    counting.__stateless__ = True
+    registry_.register(str, counting)
+    converter = BaseConverter(registry=registry_)
+
+    first = converter.convert(str, {"validate": len})
+    second = converter.convert(str, {"validate": len})
+
+    assert len(calls) == 1
+    assert first is not second
+    assert type(second) is fields.String
+    assert second.validators == [len]
+    assert second.validators is not first.validators
+    assert second.error_messages is not first.error_messages
+    assert second._creation_index > first._creation_index
+
+    converter.convert(str, {"validate": len, "dump_to": "other"})
+    assert len(calls) == 2
+
+
+def test_cloned_containers_get_their_own_inner_field(registry_):
+    converter = BaseConverter(registry=registry_)
+
+    first = converter.convert(typing.List[int])
+    second = converter.convert(typing.List[int])
+
+    assert isinstance(second, fields.List)
+    assert second.container is not first.container
+    assert isinstance(second.container, fields.Integer)
+
+
+def test_registry_changes_drop_prototypes(registry_):
+    converter = BaseConverter(registry=registry_)
+    assert isinstance(converter.convert(typing.List[int]).container, fields.Integer)
+
+    registry_.register_field_for_type(int, fields.Float)
+
+    assert isinstance(converter.convert(typing.List[int]).container, fields.Float)
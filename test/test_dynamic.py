@@ -0,0 +1,108 @@
+import gc
+import typing as t
+import weakref
+
+import attr
+from marshmallow.class_registry import _registry
+
+import pytest
+from marshmallow_annotations import dynamic
+from marshmallow_annotations.dynamic import (
+    clear_schema_cache,
+    instance_for,
+    schema_for,
+)
+from marshmallow_annotations.ext.attrs import AttrsSchema
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Artist:
+    name: str
+    rating: t.Optional[int]
+
+
+@attr.s(auto_attribs=True)
+class Album:
+    name: str
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_schema_cache()
+    yield
+    clear_schema_cache()
+
+
+def test_schema_is_created_once_per_target_and_options(registry_):
+    schema = schema_for(Artist, registry=registry_)
+
+    assert schema is schema_for(Artist, registry=registry_)
+    assert schema is not schema_for(Artist, registry=registry_, ordered=True)
+    assert issubclass(schema, AnnotationSchema)
+    assert schema.__name__ == "ArtistSchema"
+    assert schema.__schema_for__ is Artist
+    assert set(schema._declared_fields) == {"name", "rating"}
+
+
+def test_instance_is_shared_per_schema(registry_):
+    instance = instance_for(Artist, registry=registry_)
+
+    assert type(instance) is schema_for(Artist, registry=registry_)
+    assert instance is instance_for(Artist, registry=registry_)
+    assert instance is not instance_for(Artist, registry=registry_, ordered=True)
+
+
+def test_schema_stays_out_of_class_registry(registry_):
+    schema_for(Artist, registry=registry_)
+
+    assert "ArtistSchema" not in _registry
+
+
+def test_base_follows_kind_of_target(registry_):
+    schema = schema_for(Album, registry=registry_)
+
+    assert issubclass(schema, AttrsSchema)
+    assert schema().load({"name": "Ashes"}).data == Album("Ashes")
+
+
+def test_fields_may_be_given_as_dict(registry_):
+    schema = schema_for(
+        Artist, registry=registry_, Fields={"name": {"dump_to": "title"}}
+    )
+
+    assert schema._declared_fields["name"].dump_to == "title"
+
+
+def test_least_recently_used_schema_are_released(registry_, monkeypatch):
+    monkeypatch.setattr(dynamic, "_MAXSIZE", 2)
+
+    def make_target():
+        return type("Dynamic", (), {"__annotations__": {"id": int}})
+
+    target = make_target()
+    collected = weakref.ref(target)
+    schema_for(target, registry=registry_)
+    del target
+
+    kept = make_target()
+    for _ in range(2):
+        schema_for(make_target(), registry=registry_)
+    first = schema_for(kept, registry=registry_)
+    gc.collect()
+
+    assert collected() is None
+    assert schema_for(kept, registry=registry_) is first
+
+
+class Unhashable:
+    __hash__ = None
+
+    def __call__(self, value):
+        return True
+
+
+def test_unhashable_options_create_new_schema(registry_):
+    configs = {"name": {"validate": Unhashable()}}
+    first = schema_for(Artist, registry=registry_, Fields=configs)
+
+    assert schema_for(Artist, registry=registry_, Fields=configs) is not first
@@ -0,0 +1,111 @@
+import typing as t
+
+from marshmallow import fields, missing
+
+import pytest
+from marshmallow_annotations.converter import BaseConverter
+from marshmallow_annotations.ext.namedtuple import NamedTupleSchema
+from marshmallow_annotations.fieldcache import FieldCache
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Cached:
+    id: int
+    name: t.Optional[str]
+    tags: t.List[str]
+
+
+class CachedTuple(t.NamedTuple):
+    id: int
+    name: str = "unnamed"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    yield FieldCache(str(tmp_path))
+
+
+def make_scheme(registry_, cache, **configs):
+    class CachedScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Cached
+            field_cache = cache
+            Fields = type("Fields", (), configs)
+
+    return CachedScheme
+
+
+def test_rehydrates_fields_from_cache(registry_, cache, monkeypatch):
+    make_scheme(registry_, cache)
+
+    def explode(*args, **kwargs):
+        raise AssertionError("fields should have come from the cache")
+
+    monkeypatch.setattr(BaseConverter, "convert_all", explode)
+    scheme = make_scheme(registry_, cache)
+
+    declared = scheme._declared_fields
+    assert isinstance(declared["id"], fields.Integer)
+    assert isinstance(declared["tags"].container, fields.String)
+    assert declared["id"].missing is missing
+
+    result = scheme().dump(Cached())
+    assert result.data == {}
+
+
+def test_caches_namedtuple_fields(registry_, cache, monkeypatch):
+    def make_tuple_scheme():
+        class CachedTupleScheme(NamedTupleSchema):
+            class Meta:
+                registry = registry_
+                target = CachedTuple
+                field_cache = cache
+
+        return CachedTupleScheme
+
+    first = make_tuple_scheme()
+    assert cache.fingerprint(first.opts, CachedTuple, frozenset()) is not None
+
+    def explode(*args, **kwargs):
+        raise AssertionError("fields should have come from the cache")
+
+    monkeypatch.setattr(BaseConverter, "convert_all", explode)
+    scheme = make_tuple_scheme()
+
+    assert scheme._declared_fields["name"].missing == "unnamed"
+    assert scheme().load({"id": 1}).data == CachedTuple(1)
+
+
+def test_fingerprint_changes_with_options(registry_, cache):
+    first = make_scheme(registry_, cache)
+    ignore = frozenset()
+
+    key = cache.fingerprint(first.opts, Cached, ignore)
+
+    assert key == cache.fingerprint(make_scheme(registry_, cache).opts, Cached, ignore)
+    assert key != cache.fingerprint(first.opts, Cached, frozenset(["id"]))
+
+
+def test_fingerprint_changes_with_registry(registry_, cache):
+    scheme = make_scheme(registry_, cache)
+    key = cache.fingerprint(scheme.opts, Cached, frozenset())
+
+    registry_.register_field_for_type(bytes, fields.String)
+
+    assert key != cache.fingerprint(scheme.opts, Cached, frozenset())
+
+
+def test_unpicklable_fields_are_not_cached(registry_, cache, tmp_path):
+    make_scheme(registry_, cache, name={"validate": lambda v: True})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_clear_removes_entries(registry_, cache, tmp_path):
+    make_scheme(registry_, cache)
+    assert list(tmp_path.iterdir())
+
+    cache.clear()
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,139 @@
+import typing as t
+
+from marshmallow import Schema, fields
+
+from marshmallow_annotations.fields import SharedNested, _nested_fields
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Track:
+    name: str
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Album:
+    name: str
+    first: Track
+    tracks: t.List[Track]
+
+    def __init__(self, name, tracks):
+        self.name = name
+        self.first = tracks[0]
+        self.tracks = tracks
+
+
+def test_nested_schema_shared_across_parent_instances(registry_):
+    class TrackScheme(AnnotationSchema):
+        owner = fields.Function(lambda obj, context: context.get("owner"))
+
+        class Meta:
+            registry = registry_
+            target = Track
+            register_as_scheme = True
+
+    class AlbumScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Album
+
+    first, second = AlbumScheme(), AlbumScheme()
+
+    assert isinstance(first.fields["tracks"], SharedNested)
+    assert first.fields["tracks"].schema is second.fields["tracks"].schema
+    assert first.fields["first"].schema is second.fields["first"].schema
+    assert first.fields["tracks"].schema is not first.fields["first"].schema
+    assert first.fields["tracks"].schema.many
+    assert isinstance(first.fields["first"].schema, TrackScheme)
+
+
+def test_dumps_and_loads_like_nested(registry_):
+    class TrackScheme(AnnotationSchema):
+        owner = fields.Function(lambda obj, context: context.get("owner"))
+
+        class Meta:
+            registry = registry_
+            target = Track
+            register_as_scheme = True
+
+    class AlbumScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Album
+
+    album = Album("Ashes", [Track("Embers"), Track("Cinders")])
+
+    result = AlbumScheme().dump(album).data
+
+    assert result["first"] == {"name": "Embers", "owner": None}
+    assert [t["name"] for t in result["tracks"]] == ["Embers", "Cinders"]
+    assert AlbumScheme().load(result).data["tracks"][1] == {"name": "Cinders"}
+
+
+def test_parent_context_gets_a_private_schema(registry_):
+    class TrackScheme(AnnotationSchema):
+        owner = fields.Function(lambda obj, context: context.get("owner"))
+
+        class Meta:
+            registry = registry_
+            target = Track
+            register_as_scheme = True
+
+    class AlbumScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Album
+
+    shared = AlbumScheme().fields["first"].schema
+
+    schema = AlbumScheme(context={"owner": "alec"})
+    album = Album("Ashes", [Track("Embers")])
+
+    assert schema.fields["first"].schema is not shared
+    assert schema.dump(album).data["first"]["owner"] == "alec"
+
+
+def test_only_and_exclude_are_part_of_the_key():
+    class ItemSchema(Schema):
+        a = fields.Integer()
+        b = fields.Integer()
+
+    class ParentSchema(Schema):
+        everything = SharedNested(ItemSchema)
+        just_a = SharedNested(ItemSchema, only=("a",))
+        also_a = SharedNested(ItemSchema, only=("a",))
+
+    parent = ParentSchema()
+
+    assert parent.fields["just_a"].schema is parent.fields["also_a"].schema
+    assert parent.fields["just_a"].schema is not parent.fields["everything"].schema
+
+
+def test_scheme_names_resolve_when_the_field_is_made(registry_):
+    class TrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+
+    registry_.register_scheme_factory(Track, "TrackScheme")
+
+    field = registry_.get(Track)(None, (), {})
+
+    assert field.nested is TrackScheme
+
+
+def test_nested_fields_are_found_inside_containers():
+    class NestingSchema(Schema):
+        one = fields.Nested(Schema)
+        many = fields.List(fields.Nested(Schema))
+        plain = fields.List(fields.Integer())
+
+    schema = NestingSchema()
+    declared = schema.fields
+
+    found = list(_nested_fields(declared.values()))
+
+    assert len(found) == 2
+    assert declared["one"] in found
+    assert declared["many"].container in found
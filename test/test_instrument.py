@@ -0,0 +1,141 @@
+import typing as t
+
+import pytest
+from marshmallow_annotations.instrument import (
+    Collector,
+    StatsCollector,
+    Timing,
+    _percentile,
+)
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Track:
+    name: str
+    length: int
+
+    def __init__(self, name, length):
+        self.name = name
+        self.length = length
+
+
+class Album:
+    name: str
+    tracks: t.List[Track]
+
+    def __init__(self, name, tracks):
+        self.name = name
+        self.tracks = tracks
+
+
+class ListCollector(Collector):
+    def __init__(self):
+        self.timings = []
+
+    def record(self, timing):
+        self.timings.append(timing)
+
+
+@pytest.fixture
+def collector():
+    return ListCollector()
+
+
+def test_reports_schema_and_field_timings(registry_, collector):
+    class TrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+            register_as_scheme = True
+            instrument = collector
+
+    class AlbumScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Album
+            instrument = collector
+
+    schema = AlbumScheme()
+    album = Album("Ashes", [Track("Embers", 10), Track("Cinders", 20)])
+
+    schema.dump(album)
+    recorded = {(t.schema, t.field, t.operation): t for t in collector.timings}
+
+    assert recorded["AlbumScheme", None, "dump"].size == 1
+    assert recorded["AlbumScheme", "name", "serialize"].size == len("Ashes")
+    assert recorded["AlbumScheme", "tracks", "serialize"].size == 2
+    assert recorded["TrackScheme", None, "dump"].size == 2
+    assert recorded["TrackScheme", "length", "serialize"].duration >= 0
+    assert "dump" not in schema.__dict__
+    assert "_do_load" not in schema.__dict__
+
+
+def test_reports_loads(registry_, collector):
+    class TrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+            instrument = collector
+
+    schema = TrackScheme()
+
+    schema.load([{"name": "Embers", "length": 10}] * 3, many=True)
+    recorded = {(t.schema, t.field, t.operation): t for t in collector.timings}
+
+    assert recorded["TrackScheme", None, "load"].size == 3
+    assert ("TrackScheme", "name", "deserialize") in recorded
+
+
+def test_instrumented_schema_skip_compiled_paths(registry_, collector):
+    class TrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+            instrument = collector
+            compile_dump = True
+            compile_load = True
+
+    schema = TrackScheme()
+
+    assert schema._get_compiled_dumper() is None
+    assert schema._get_compiled_loader() is None
+
+
+def test_uninstrumented_schema_are_untouched(registry_):
+    class TrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+
+    schema = TrackScheme()
+
+    assert "dump" not in schema.__dict__
+    assert "serialize" not in schema.fields["name"].__dict__
+
+
+def test_stats_collector_aggregates():
+    stats = StatsCollector(max_samples=50)
+
+    for i in range(1, 101):
+        stats.record(Timing("Scheme", "f", "serialize", i / 1000, 2))
+
+    result = stats.stats()[("Scheme", "f", "serialize")]
+
+    assert result.calls == 100
+    assert result.size == 200
+    assert result.max == pytest.approx(0.1)
+    assert result.mean == pytest.approx(0.0505)
+    # only the last 50 samples are retained for percentiles
+    assert result.p50 == pytest.approx(0.075)
+
+    stats.reset()
+    assert stats.stats() == {}
+
+
+def test_percentile_nearest_rank():
+    ordered = list(range(1, 11))
+
+    assert _percentile(ordered, 0.5) == 5
+    assert _percentile(ordered, 0.9) == 9
+    assert _percentile(ordered, 0.99) == 10
+    assert _percentile([3], 0.5) == 3
@@ -0,0 +1,247 @@
+import typing as t
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from marshmallow import fields
+
+import pytest
+from marshmallow_annotations.ext.namedtuple import NamedTupleSchema
+from marshmallow_annotations.marshalling import compile_dumper
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Track:
+    id: int
+    name: str
+    length: float
+    explicit: bool
+    uid: UUID
+    released: date
+    recorded: t.Optional[datetime]
+    price: Decimal
+    tags: t.List[str]
+
+    def __init__(self, **kwargs):
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+
+class SomeTuple(t.NamedTuple):
+    a: int
+    b: t.Optional[int]
+    c: t.Optional[int] = 5
+
+
+def make_track(**kwargs):
+    values = dict(
+        id=1,
+        name="Letting Them Fall",
+        length=4.5,
+        explicit=False,
+        uid=UUID("12345678123456781234567812345678"),
+        released=date(2018, 1, 1),
+        recorded=None,
+        price=Decimal("1.99"),
+        tags=["death", "metal"],
+    )
+    values.update(kwargs)
+    return Track(**values)
+
+
+@pytest.fixture
+def schemas(registry_):
+    class PlainTrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+
+    class CompiledTrackScheme(PlainTrackScheme):
+        class Meta:
+            compile_dump = True
+
+    return PlainTrackScheme, CompiledTrackScheme
+
+
+def test_compiled_dump_matches_marshmallow(schemas):
+    plain, compiled = schemas
+    track = make_track()
+
+    expected = plain().dump(track)
+    result = compiled().dump(track)
+
+    assert not result.errors
+    assert result.data == expected.data
+
+
+def test_compiled_dump_many_matches_marshmallow(schemas):
+    plain, compiled = schemas
+    tracks = [make_track(id=i, name=f"track {i}") for i in range(5)]
+
+    expected = plain(many=True).dump(tracks)
+    result = compiled().dump(iter(tracks), many=True)
+
+    assert not result.errors
+    assert result.data == expected.data
+
+
+def test_compiled_dump_inlines_primitive_fields(schemas):
+    _, compiled = schemas
+    s = compiled()
+
+    def explode(*a, **k):
+        raise AssertionError("should have been inlined")
+
+    s.fields["id"].serialize = explode
+    s.fields["name"].serialize = explode
+
+    assert s.dump(make_track()).data["id"] == 1
+
+
+def test_compiled_dump_coerces_like_marshmallow(schemas):
+    plain, compiled = schemas
+    track = make_track(id="12", length=3, explicit=1, name=b"bytes")
+
+    assert compiled().dump(track).data == plain().dump(track).data
+
+
+def test_compiled_dump_falls_back_for_errors(schemas):
+    plain, compiled = schemas
+    tracks = [make_track(), make_track(id="not an int")]
+
+    expected = plain().dump(tracks, many=True)
+    result = compiled().dump(tracks, many=True)
+
+    assert result.errors == expected.errors == {1: {"id": ["Not a valid integer."]}}
+    assert result.data == expected.data
+
+
+def test_compiled_dump_respects_field_options(registry_):
+    class Thing:
+        id: int
+        name: str
+        secret: str
+
+    class ThingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Thing
+            compile_dump = True
+
+            class Fields:
+                id = {"dump_to": "identifier"}
+                name = {"default": "anonymous"}
+                secret = {"load_only": True}
+
+    thing = Thing()
+    thing.id = 1
+    thing.secret = "hunter2"
+
+    result = ThingScheme().dump(thing)
+
+    assert result.data == {"identifier": 1, "name": "anonymous"}
+
+
+def test_compiled_dump_handles_mappings_through_marshmallow(schemas):
+    plain, compiled = schemas
+    track = vars(make_track())
+
+    assert compiled().dump(track).data == plain().dump(track).data
+
+
+def test_compiled_dump_runs_post_dump_processors(registry_):
+    class SomeTupleSchema(NamedTupleSchema):
+        class Meta:
+            registry = registry_
+            target = SomeTuple
+            dump_default_fields = False
+            compile_dump = True
+
+    result = SomeTupleSchema().dump(SomeTuple(a=1, b=None, c=5))
+
+    assert not result.errors
+    assert result.data == {"a": 1}
+
+
+def test_declines_to_compile_custom_accessor(registry_):
+    class CustomAccessorScheme(AnnotationSchema):
+        id = fields.Integer()
+
+        def get_attribute(self, attr, obj, default):
+            return 1
+
+    assert compile_dumper(CustomAccessorScheme()) is None
+
+
+def test_compiled_load_matches_marshmallow(registry_):
+    class Thing:
+        id: int
+        name: t.Optional[str]
+        uid: UUID
+        tags: t.List[str]
+
+    class PlainThingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Thing
+
+    class CompiledThingScheme(PlainThingScheme):
+        class Meta:
+            compile_load = True
+
+    payloads = [
+        {"id": 1, "name": "a", "uid": UUID(int=1), "tags": ["x"]},
+        {"id": "2", "uid": str(UUID(int=2)), "tags": []},
+        {"id": 3, "name": None, "uid": str(UUID(int=3)), "tags": ["y"]},
+    ]
+
+    s = CompiledThingScheme(many=True)
+    expected = PlainThingScheme(many=True).load(payloads)
+    result = s.load(payloads)
+
+    assert s._get_compiled_loader() is not None
+    assert not result.errors
+    assert result.data == expected.data
+
+
+def test_compiled_load_falls_back_for_errors(registry_):
+    class Thing:
+        id: int
+        name: str
+
+    class PlainThingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Thing
+
+    class CompiledThingScheme(PlainThingScheme):
+        class Meta:
+            compile_load = True
+
+    payloads = [{"id": 1, "name": "a"}, {"id": "x"}, {"id": 2, "name": None}]
+
+    expected = PlainThingScheme(many=True).load(payloads)
+    result = CompiledThingScheme(many=True).load(payloads)
+
+    assert result.errors == expected.errors
+    assert set(result.errors) == {1, 2}
+    assert result.data == expected.data
+
+
+def test_declines_to_compile_load_with_validators(registry_):
+    from marshmallow import validates
+
+    class Thing:
+        id: int
+
+    class ThingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Thing
+            compile_load = True
+
+        @validates("id")
+        def validate_id(self, value):
+            pass
+
+    assert ThingScheme()._get_compiled_loader() is None
@@ -0,0 +1,120 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from marshmallow import ValidationError, post_load
+
+import pytest
+from marshmallow_annotations.dynamic import schema_for
+from marshmallow_annotations.exceptions import MarshmallowAnnotationError
+from marshmallow_annotations.parallel import SchemaReference
+from marshmallow_annotations.registry import registry
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Row:
+    id: int
+    name: str
+
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+    def __eq__(self, other):
+        return (self.id, self.name) == (other.id, other.name)
+
+
+class RowScheme(AnnotationSchema):
+    @post_load
+    def make_row(self, data):
+        return Row(**data)
+
+    class Meta:
+        target = Row
+
+
+DATA = [{"id": i, "name": str(i)} for i in range(7)]
+
+
+def test_parallel_load_merges_results_in_order():
+    data = DATA + [{"id": "x", "name": "bad"}, {"id": 8, "name": "8"}]
+
+    with ThreadPoolExecutor(3) as executor:
+        result = RowScheme().parallel_load(data, chunk_size=2, executor=executor)
+
+    assert result.data[:7] == [Row(**d) for d in DATA]
+    assert result.data[8] == Row(8, "8")
+    assert list(result.errors) == [7]
+
+
+def test_parallel_load_raises_merged_errors_for_strict_schema():
+    data = [{"id": "x", "name": "a"}] + DATA + [{"id": "y", "name": "b"}]
+
+    with ThreadPoolExecutor(2) as executor, pytest.raises(ValidationError) as excinfo:
+        RowScheme(strict=True).parallel_load(data, chunk_size=3, executor=executor)
+
+    assert sorted(excinfo.value.messages) == [0, 8]
+
+
+def test_parallel_dump_across_processes():
+    objs = [Row(**d) for d in DATA]
+    schema = RowScheme(only=("id",))
+
+    result = schema.parallel_dump(objs, chunk_size=3, max_workers=2)
+
+    assert result == schema.dump(objs, many=True)
+
+
+def test_parallel_load_keeps_partial():
+    data = [{"id": i} for i in range(5)]
+
+    with ThreadPoolExecutor(2) as executor:
+        result = schema_for(Row)(partial=True).parallel_load(
+            data, chunk_size=2, executor=executor
+        )
+
+    assert result == (data, {})
+
+
+def test_context_must_be_picklable():
+    schema = RowScheme(context={"lock": threading.Lock()})
+
+    with pytest.raises(MarshmallowAnnotationError) as excinfo:
+        SchemaReference.of(schema)
+
+    assert "context" in str(excinfo.value)
+
+
+def test_dynamic_schema_are_referenced_by_target():
+    schema = schema_for(Row, ordered=True)(exclude=("name",))
+
+    reference = SchemaReference.of(schema)
+    created = reference.create()
+
+    assert reference.schema is None
+    assert reference.target == f"{__name__}:Row"
+    assert type(created) is type(schema)
+    assert created.exclude == {"name"}
+
+
+def test_local_schema_cant_be_referenced(registry_):
+    class LocalScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Row
+
+    with pytest.raises(MarshmallowAnnotationError):
+        SchemaReference.of(LocalScheme())
+
+
+def test_dynamic_schema_options_must_be_picklable(registry_):
+    schema = schema_for(Row, registry=registry_)()
+
+    with pytest.raises(MarshmallowAnnotationError):
+        SchemaReference.of(schema)
+
+
+def test_default_registry_is_left_to_workers():
+    reference = SchemaReference.of(schema_for(Row, registry=registry)())
+
+    assert "registry" not in reference.options
+    assert type(reference.create()) is schema_for(Row)
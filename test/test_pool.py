@@ -0,0 +1,155 @@
+import typing as t
+from threading import Thread
+
+from marshmallow import fields, post_dump
+
+from marshmallow_annotations.pool import SchemaPool
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Track:
+    name: str
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Album:
+    name: str
+    tracks: t.List[Track]
+
+    def __init__(self, name, tracks):
+        self.name = name
+        self.tracks = tracks
+
+
+def test_instances_are_reused_per_arguments(registry_):
+    class TrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+
+    with TrackScheme.pooled() as first:
+        pass
+    with TrackScheme.pooled() as second:
+        pass
+    with TrackScheme.pooled(many=True) as third:
+        pass
+
+    assert first is second
+    assert third is not first
+    assert third.many
+
+
+def test_nested_checkouts_get_their_own_instance(registry_):
+    class TrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+
+    with TrackScheme.pooled() as outer:
+        with TrackScheme.pooled() as inner:
+            assert inner is not outer
+
+
+def test_context_is_set_on_every_checkout(registry_):
+    class TrackScheme(AnnotationSchema):
+        owner = fields.Function(lambda obj, context: context.get("owner"))
+
+        class Meta:
+            registry = registry_
+            target = Track
+            register_as_scheme = True
+
+    class AlbumScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Album
+
+    album = Album("Ashes", [Track("Embers")])
+
+    with AlbumScheme.pooled(context={"owner": "alec"}) as pooled:
+        assert pooled.dump(album).data["tracks"][0]["owner"] == "alec"
+
+    with AlbumScheme.pooled(context={"owner": "sam"}) as pooled:
+        assert pooled.dump(album).data["tracks"][0]["owner"] == "sam"
+
+    with AlbumScheme.pooled() as pooled:
+        assert pooled.context == {}
+        assert pooled.dump(album).data["tracks"][0]["owner"] is None
+
+
+def test_context_is_set_for_schema_with_list_fields(registry_):
+    class Chart:
+        positions: t.List[int]
+
+        def __init__(self, positions):
+            self.positions = positions
+
+    class ChartScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Chart
+
+    with ChartScheme.pooled(context={"owner": "alec"}) as pooled:
+        assert pooled.dump(Chart([1, 2])).data == {"positions": [1, 2]}
+
+    with ChartScheme.pooled(context={"owner": "sam"}) as pooled:
+        assert pooled.context == {"owner": "sam"}
+
+
+def test_pools_are_per_thread(registry_):
+    class TrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+
+    pool = SchemaPool(TrackScheme)
+    seen = []
+
+    def checkout():
+        with pool.checkout() as schema:
+            seen.append(schema)
+
+    checkout()
+    thread = Thread(target=checkout)
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not seen[1]
+
+
+def test_idle_instances_are_bounded(registry_):
+    class TrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+
+    pool = SchemaPool(TrackScheme, maxsize=1)
+
+    with pool.checkout() as first:
+        with pool.checkout() as second:
+            pass
+
+    with pool.checkout() as again:
+        assert again is second
+        with pool.checkout() as fresh:
+            assert fresh is not first
+
+
+def test_processors_see_pooled_context(registry_):
+    class ContextScheme(AnnotationSchema):
+        @post_dump
+        def add_owner(self, data):
+            data["owner"] = self.context.get("owner")
+            return data
+
+        class Meta:
+            registry = registry_
+            target = Track
+
+    track = Track("Embers")
+
+    for owner in ["alec", "sam"]:
+        with ContextScheme.pooled(context={"owner": owner}) as schema:
+            assert schema.dump(track).data["owner"] == owner
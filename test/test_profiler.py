@@ -0,0 +1,96 @@
+import typing as t
+
+import pytest
+from marshmallow_annotations.__main__ import main
+from marshmallow_annotations.profiler import BuildProfiler, _NOOP_TIMER, profiler
+from marshmallow_annotations.scheme import AnnotationSchema
+
+
+class Tag:
+    name: str
+
+
+class Post:
+    title: str
+    tags: t.List[Tag]
+
+
+@pytest.fixture
+def enabled():
+    profiler.reset()
+    profiler.enable()
+    yield profiler
+    profiler.disable()
+    profiler.reset()
+
+
+def test_disabled_profiler_records_nothing(registry_):
+    assert BuildProfiler().timer() is _NOOP_TIMER
+
+    profiler.reset()
+
+    class TagScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Tag
+
+    assert profiler.profiles() == []
+
+
+def test_records_phases_per_target(registry_, enabled):
+    class TagScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Tag
+            register_as_scheme = True
+
+    class PostScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Post
+
+    profiles = {p.target: p for p in enabled.profiles()}
+    post = profiles[f"{__name__}.Post"]
+
+    assert set(post.phases) == {"opts", "generate", "hints", "registry", "factory"}
+    assert post.calls["factory"] == 2
+    # the element type of List[Tag] is looked up on behalf of Post
+    assert post.calls["registry"] == 3
+    assert post.total == pytest.approx(post.phases["opts"] + post.phases["generate"])
+    assert f"{__name__}.Tag" in profiles
+
+
+def test_profiles_are_ordered_slowest_first():
+    profiler = BuildProfiler(enabled=True)
+    profiler.record(Tag, "generate", 0.001)
+    profiler.record(Post, "generate", 0.002)
+    profiler.record(Post, "opts", 0.001)
+
+    assert [p.target for p in profiler.profiles()] == [
+        f"{__name__}.Post",
+        f"{__name__}.Tag",
+    ]
+
+
+def test_report_lists_targets(tmp_path, monkeypatch, capsys):
+    (tmp_path / "profiled_schema.py").write_text(
+        "from marshmallow_annotations.registry import DefaultTypeRegistry\n"
+        "from marshmallow_annotations.scheme import AnnotationSchema\n"
+        "\n"
+        "class Target:\n"
+        "    id: int\n"
+        "\n"
+        "class TargetScheme(AnnotationSchema):\n"
+        "    class Meta:\n"
+        "        registry = DefaultTypeRegistry()\n"
+        "        target = Target\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    assert main(["report", "profiled_schema", "-n", "5"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split()[:2] == ["target", "total"]
+    assert any(line.startswith("profiled_schema.Target ") for line in lines)
+    assert not profiler.enabled
+    profiler.reset()
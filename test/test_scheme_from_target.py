@@ -7,6 +7,7 @@ from marshmallow import fields
 
 import pytest
 from marshmallow_annotations.converter import BaseConverter
+from marshmallow_annotations.exceptions import AnnotationConversionError
 from marshmallow_annotations.scheme import AnnotationSchema
 
 
@@ -26,6 +27,26 @@ class SomeType:
         self.children = children
 
 
+class TreeNode:
+    name: str
+    children: t.List["TreeNode"]
+
+    def __init__(self, name, children=()):
+        self.name = name
+        self.children = list(children)
+
+
+class CatalogArtist:
+    name: str
+    albums: t.List["CatalogAlbum"]
+
+
+class CatalogAlbum:
+    title: str
+    artist: t.Optional[CatalogArtist]
+    tracks: t.List["CatalogTrack"]  # noqa: F821
+
+
 def test_autogenerates_fields(registry_):
     class SomeTypeThingScheme(AnnotationSchema):
         class Meta:
@@ -231,3 +252,267 @@ def test_excludes_fields_declared_in_exclude(registry_):
             exclude = ("id",)
 
     assert "id" not in SomeTypeThingScheme._declared_fields
+
+
+class CountingConverter(BaseConverter):
+    calls = 0
+
+    def convert_all(self, target, ignore=frozenset(), configs=None):  # noqa: B008
+        type(self).calls += 1
+        return super().convert_all(target, ignore, configs)
+
+
+def test_lazy_scheme_defers_field_generation(registry_):
+    class LazyConverter(CountingConverter):
+        calls = 0
+
+    class SomeTypeThingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = SomeTypeThing
+            converter_factory = LazyConverter
+            lazy = True
+
+    assert LazyConverter.calls == 0
+    assert "id" not in SomeTypeThingScheme._declared_fields
+
+    SomeTypeThingScheme()
+    SomeTypeThingScheme()
+
+    assert LazyConverter.calls == 1
+    assert isinstance(SomeTypeThingScheme._declared_fields["id"], fields.UUID)
+
+
+def test_lazy_scheme_generates_fields_on_class_level_access(registry_):
+    class LazyConverter(CountingConverter):
+        calls = 0
+
+    class SomeTypeThingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = SomeTypeThing
+            converter_factory = LazyConverter
+            lazy = True
+
+    assert isinstance(SomeTypeThingScheme.declared_fields["id"], fields.UUID)
+    assert "id" in SomeTypeThingScheme._declared_fields
+    assert LazyConverter.calls == 1
+
+
+def test_lazy_scheme_generates_fields_once_across_threads(registry_):
+    from concurrent.futures import ThreadPoolExecutor
+
+    class LazyConverter(CountingConverter):
+        calls = 0
+
+    class SomeTypeThingScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = SomeTypeThing
+            converter_factory = LazyConverter
+            lazy = True
+
+    with ThreadPoolExecutor(8) as pool:
+        schemas = list(pool.map(lambda _: SomeTypeThingScheme(), range(32)))
+
+    assert LazyConverter.calls == 1
+    assert all(set(s.fields) == {"id", "name"} for s in schemas)
+
+
+def test_lazy_setting_is_inherited_and_resolved_for_subclasses(registry_):
+    class LazyScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            lazy = True
+
+    class SomeTypeThingScheme(LazyScheme):
+        class Meta:
+            target = SomeTypeThing
+
+    assert SomeTypeThingScheme.opts.lazy
+    assert "id" not in SomeTypeThingScheme._declared_fields
+
+    class SomeTypeThingSchemeJr(SomeTypeThingScheme):
+        extra = fields.String()
+
+    assert "id" in SomeTypeThingScheme._declared_fields
+    SomeTypeThingSchemeJr.resolve_declared_fields()
+    assert set(SomeTypeThingSchemeJr._declared_fields) == {"id", "name", "extra"}
+
+
+class LazyArtist:
+    name: str
+    albums: t.List["LazyAlbum"]
+
+
+class LazyAlbum:
+    name: str
+    artist: LazyArtist
+
+
+def test_lazy_scheme_allows_schemes_registered_later(registry_):
+    class LazyArtistScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = LazyArtist
+            register_as_scheme = True
+            lazy = True
+
+    # without lazy, LazyArtistScheme would've failed as there's no
+    # scheme for LazyAlbum registered yet
+    class LazyAlbumScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = LazyAlbum
+            register_as_scheme = True
+
+    artist_fields = LazyArtistScheme().fields
+
+    assert isinstance(artist_fields["albums"], fields.Nested)
+    assert artist_fields["albums"].many
+    assert isinstance(LazyAlbumScheme().fields["artist"], fields.Nested)
+
+
+def test_explain_skips_declared_fields(registry_):
+    class Explained:
+        id: int
+        name: str
+
+    class ExplainedScheme(AnnotationSchema):
+        name = fields.Email()
+
+        class Meta:
+            registry = registry_
+            target = Explained
+
+    plans = ExplainedScheme.explain()
+
+    assert [p.name for p in plans] == ["id"]
+    assert plans[0].factory is registry_.get(int)
+
+
+def test_auto_nested_builds_recursive_schema(registry_):
+    class TreeNodeScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = TreeNode
+            auto_nested = True
+
+    tree = TreeNode("root", [TreeNode("leaf")])
+    result = TreeNodeScheme().dump(tree)
+
+    assert TreeNodeScheme._declared_fields["children"].nested is TreeNodeScheme
+    assert result.data == {
+        "name": "root",
+        "children": [{"name": "leaf", "children": []}],
+    }
+
+
+def test_auto_nested_converts_each_target_once(registry_, monkeypatch):
+    converted = []
+    convert_all = BaseConverter.convert_all
+
+    def spy(self, target, *args, **kwargs):
+        converted.append(target)
+        return convert_all(self, target, *args, **kwargs)
+
+    monkeypatch.setattr(BaseConverter, "convert_all", spy)
+
+    class CatalogArtistScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = CatalogArtist
+            auto_nested = True
+
+    # nested schema are generated on first use, forward references only
+    # need to resolve by then
+    class CatalogTrack:
+        title: str
+        album: CatalogAlbum
+
+    monkeypatch.setitem(globals(), "CatalogTrack", CatalogTrack)
+
+    album_scheme = CatalogArtistScheme._declared_fields["albums"].schema
+    track_scheme = album_scheme.fields["tracks"].schema
+
+    assert album_scheme.fields["artist"].nested is CatalogArtistScheme
+    assert track_scheme.fields["album"].nested is type(album_scheme)
+    assert sorted(c.__name__ for c in converted) == [
+        "CatalogAlbum",
+        "CatalogArtist",
+        "CatalogTrack",
+    ]
+    # generated schema are kept to the graph rather than the registry
+    assert not registry_.has(CatalogAlbum)
+
+
+def test_auto_nested_generates_schema_for_subclass_of_registered_target(registry_):
+    class Pet:
+        name: str
+
+    class Dog(Pet):
+        breed: str
+
+    class Owner:
+        dog: Dog
+
+    class PetScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Pet
+            register_as_scheme = True
+
+    class OwnerScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Owner
+            auto_nested = True
+
+    nested = OwnerScheme._declared_fields["dog"].schema
+
+    assert type(nested) is not PetScheme
+    assert set(nested.fields) == {"name", "breed"}
+
+
+def test_subclass_of_registered_target_needs_own_schema(registry_):
+    class Pet:
+        name: str
+
+    class Dog(Pet):
+        breed: str
+
+    class Owner:
+        dog: Dog
+
+    class PetScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Pet
+            register_as_scheme = True
+
+    with pytest.raises(AnnotationConversionError):
+
+        class OwnerScheme(AnnotationSchema):
+            class Meta:
+                registry = registry_
+                target = Owner
+
+
+def test_max_depth_omits_deeper_nested_values(registry_):
+    class TreeNodeScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = TreeNode
+            auto_nested = True
+            max_depth = 1
+
+    tree = TreeNode("a", [TreeNode("b", [TreeNode("c")])])
+
+    assert TreeNodeScheme().dump(tree).data == {
+        "name": "a",
+        "children": [{"name": "b"}],
+    }
+    # the limit only applies for the duration of the dump
+    assert TreeNodeScheme(many=True).dump([tree]).data[0]["children"][0] == {
+        "name": "b"
+    }
@@ -0,0 +1,187 @@
+import io
+import json
+import mmap
+
+from marshmallow import ValidationError, fields, post_load
+
+import pytest
+from marshmallow_annotations.scheme import AnnotationSchema
+from marshmallow_annotations.stream import chunked, offset_errors, records
+
+
+class Row:
+    id: int
+    name: str
+
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+
+def test_chunked_splits_lazily():
+    consumed = []
+
+    def source():
+        for i in range(5):
+            consumed.append(i)
+            yield i
+
+    chunks = chunked(source(), 2)
+
+    assert next(chunks) == [0, 1]
+    assert consumed == [0, 1]
+    assert list(chunks) == [[2, 3], [4]]
+
+
+def test_chunked_rejects_empty_chunks():
+    with pytest.raises(ValueError):
+        list(chunked([1], 0))
+
+
+def test_offset_errors_shifts_indices_only():
+    errors = {0: {"id": ["bad"]}, "_schema": ["worse"]}
+
+    assert offset_errors(errors, 10) == {10: {"id": ["bad"]}, "_schema": ["worse"]}
+
+
+def test_dump_iter_yields_dicts(registry_):
+    class RowScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Row
+
+    schema = RowScheme()
+    rows = [Row(i, f"row {i}") for i in range(5)]
+
+    result = list(schema.dump_iter(iter(rows), chunk_size=2))
+
+    assert result == schema.dump(rows, many=True).data
+
+
+@pytest.mark.parametrize("count", [0, 1, 7])
+def test_dump_iter_encodes_json_array(registry_, count):
+    class RowScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Row
+
+    schema = RowScheme()
+    rows = [Row(i, f"row {i}") for i in range(count)]
+
+    chunks = list(schema.dump_iter(iter(rows), chunk_size=3, encode=True))
+
+    assert all(isinstance(c, bytes) for c in chunks)
+    assert json.loads(b"".join(chunks)) == schema.dump(rows, many=True).data
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_dump_iter_reports_errors_by_position_in_iterable(registry_, strict):
+    class IntegerIdScheme(AnnotationSchema):
+        id = fields.Integer()
+
+        class Meta:
+            registry = registry_
+            target = Row
+
+    schema = IntegerIdScheme(strict=strict)
+    objs = [Row(1, "a"), Row(2, "b"), Row("three", "c")]
+
+    with pytest.raises(ValidationError) as excinfo:
+        list(schema.dump_iter(objs, chunk_size=2))
+
+    assert list(excinfo.value.messages) == [2]
+
+
+NDJSON = b'{"id": 1, "name": "a"}\n\n{"id": 2, "name": "b"}\n{"id": "x", "name": "c"}\n'
+
+
+def test_records_reads_ndjson_sources(tmp_path):
+    path = tmp_path / "rows.ndjson"
+    path.write_bytes(NDJSON)
+    expected = [json.loads(line) for line in NDJSON.splitlines() if line]
+
+    with open(path, "rb") as fh, mmap.mmap(
+        fh.fileno(), 0, access=mmap.ACCESS_READ
+    ) as m:
+        assert list(records(m, json.loads)) == expected
+
+    assert list(records(io.StringIO(NDJSON.decode()), json.loads)) == expected
+    assert list(records(NDJSON.splitlines(), json.loads)) == expected
+    assert list(records(expected, json.loads)) == expected
+
+
+def test_load_iter_loads_in_chunks(registry_):
+    class RowLoader(AnnotationSchema):
+        @post_load
+        def make_row(self, data):
+            return Row(**data)
+
+        class Meta:
+            registry = registry_
+            target = Row
+
+    schema = RowLoader()
+    data = [{"id": i, "name": str(i)} for i in range(5)]
+
+    loaded = list(schema.load_iter(iter(data), chunk_size=2))
+
+    assert [(r.id, r.name) for r in loaded] == [(i, str(i)) for i in range(5)]
+
+
+def test_load_iter_raises_for_invalid_records(registry_):
+    class RowLoader(AnnotationSchema):
+        @post_load
+        def make_row(self, data):
+            return Row(**data)
+
+        class Meta:
+            registry = registry_
+            target = Row
+
+    schema = RowLoader()
+    loaded = []
+
+    with pytest.raises(ValidationError) as excinfo:
+        for row in schema.load_iter(io.BytesIO(NDJSON), chunk_size=2):
+            loaded.append(row)
+
+    assert [r.id for r in loaded] == [1, 2]
+    assert list(excinfo.value.messages) == [2]
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_load_iter_pairs_records_with_errors(registry_, strict):
+    class RowLoader(AnnotationSchema):
+        @post_load
+        def make_row(self, data):
+            return Row(**data)
+
+        class Meta:
+            registry = registry_
+            target = Row
+
+    schema = RowLoader(strict=strict)
+
+    pairs = list(schema.load_iter(io.BytesIO(NDJSON), chunk_size=2, with_errors=True))
+
+    assert [isinstance(obj, Row) for obj, _ in pairs] == [True, True, False]
+    assert [bool(errors) for _, errors in pairs] == [False, False, True]
+    assert "id" in pairs[2][1]
+
+
+def test_load_iter_pairs_records_with_errors_for_many_schema(registry_):
+    class RowLoader(AnnotationSchema):
+        @post_load
+        def make_row(self, data):
+            return Row(**data)
+
+        class Meta:
+            registry = registry_
+            target = Row
+
+    schema = RowLoader(many=True)
+
+    pairs = list(schema.load_iter(io.BytesIO(NDJSON), chunk_size=3, with_errors=True))
+
+    assert [(obj.id, errors) for obj, errors in pairs[:2]] == [(1, {}), (2, {})]
+    assert "id" in pairs[2][1]
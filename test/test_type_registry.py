@@ -1,4 +1,6 @@
+from enum import IntEnum
 from ipaddress import IPv4Address
+from threading import Thread
 
 from marshmallow import Schema, fields
 
@@ -65,3 +67,118 @@ def test_can_preregister_type_field_mapping():
     preregistered = {IPv4Address: field_factory(fields.String)}
     registry = DefaultTypeRegistry(preregistered)
     assert registry.get(IPv4Address) is preregistered[IPv4Address]
+
+
+def test_subclass_resolves_through_mro():
+    class Color(IntEnum):
+        red = 1
+
+    class Name(str):
+        pass
+
+    registry = DefaultTypeRegistry()
+
+    assert registry.get(Color) is registry.get(int)
+    assert registry.get(Name) is registry.get(str)
+    assert registry.has(Color)
+    assert not registry.has(IPv4Address)
+
+
+def test_subclass_does_not_resolve_to_base_scheme():
+    class Base:
+        pass
+
+    class Sub(Base):
+        pass
+
+    registry = DefaultTypeRegistry()
+    registry.register_scheme_factory(Base, "BaseScheme")
+
+    assert registry.has(Base)
+    assert not registry.has(Sub)
+    with pytest.raises(AnnotationConversionError):
+        registry.get(Sub)
+
+
+def test_registering_invalidates_resolutions():
+    class Name(str):
+        pass
+
+    registry = DefaultTypeRegistry()
+    assert registry.get(Name) is registry.get(str)
+
+    constructor = field_factory(fields.Email)
+    registry.register(Name, constructor)
+
+    assert registry.get(Name) is constructor
+
+
+def test_unhashable_hints_are_not_memoized():
+    registry = DefaultTypeRegistry()
+
+    with pytest.raises(AnnotationConversionError):
+        registry.get([int])
+
+
+def test_registering_bumps_version_and_keeps_old_snapshots():
+    registry = DefaultTypeRegistry()
+    version = registry.version
+    snapshot = registry._registry
+
+    registry.register_field_for_type(IPv4Address, fields.String)
+
+    assert registry.version == version + 1
+    assert IPv4Address not in snapshot
+    assert registry.has(IPv4Address)
+
+
+def test_concurrent_registration_keeps_every_entry():
+    registry = DefaultTypeRegistry()
+    targets = [type(f"Target{i}", (), {}) for i in range(200)]
+
+    def register(chunk):
+        for target in chunk:
+            registry.register_field_for_type(target, fields.Raw)
+            assert registry.has(target)
+
+    threads = [Thread(target=register, args=(targets[i::4],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(registry.has(t) for t in targets)
+    assert registry.version == len(targets)
+
+
+def test_child_registry_overlays_parent():
+    parent = DefaultTypeRegistry()
+    child = parent.new_child({int: field_factory(fields.Float)})
+
+    assert child.get(int) is not parent.get(int)
+    assert child.get(str) is parent.get(str)
+    assert list(child._registry) == [int]
+
+    class Color(IntEnum):
+        red = 1
+
+    assert child.get(Color) is child.get(int)
+
+
+def test_child_sees_later_parent_registrations():
+    parent = DefaultTypeRegistry()
+    child = parent.new_child()
+    version = child.version
+
+    with pytest.raises(AnnotationConversionError):
+        child.get(IPv4Address)
+
+    parent.register_field_for_type(IPv4Address, fields.String)
+
+    assert child.version != version
+    assert child.has(IPv4Address)
+    assert not parent.new_child().has(object)
+
+
+def test_registry_without_overrides_shares_defaults():
+    assert DefaultTypeRegistry()._registry is DefaultTypeRegistry._registry
@@ -0,0 +1,106 @@
+import gc
+import typing as t
+
+from marshmallow import Schema, fields
+
+import pytest
+from marshmallow_annotations.scheme import AnnotationSchema
+from marshmallow_annotations.warmup import warmup
+
+
+class Label:
+    name: str
+
+
+class Track:
+    name: str
+
+
+class Album:
+    name: str
+    tracks: t.List[Track]
+
+
+class Playlist:
+    name: str
+    ratings: t.List[int]
+    albums: t.List[Album]
+
+
+def test_warmup_builds_lazy_and_nested_schema(registry_):
+    class TrackScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Track
+            register_as_scheme = True
+
+    class AlbumScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Album
+            lazy = True
+
+    report = warmup(registries=(registry_,))
+
+    assert {AlbumScheme, TrackScheme} <= set(report.schemas)
+    assert "_deferred_fields_ignore" not in AlbumScheme.__dict__
+    assert TrackScheme.__dict__["_shared_nested_instances"]
+    assert report.nested >= 1
+    assert not report.frozen
+
+
+def test_warmup_walks_fields_inside_lists(registry_):
+    class AlbumScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Album
+            register_as_scheme = True
+            auto_nested = True
+
+    class PlaylistScheme(AnnotationSchema):
+        class Meta:
+            registry = registry_
+            target = Playlist
+
+    report = warmup(registries=(registry_,))
+
+    assert {AlbumScheme, PlaylistScheme} <= set(report.schemas)
+    assert PlaylistScheme not in [schema for schema, _ in report.errors]
+
+
+def test_warmup_includes_schema_registered_by_name(registry_):
+    class LabelSchema(Schema):
+        name = fields.String()
+
+    registry_.register_scheme_factory(Label, "LabelSchema")
+
+    report = warmup(registries=(registry_,))
+
+    assert LabelSchema in report.schemas
+
+
+def test_warmup_reports_broken_schema(registry_):
+    class BrokenScheme(AnnotationSchema):
+        def __init__(self, *args, **kwargs):
+            raise RuntimeError("needs arguments")
+
+        class Meta:
+            registry = registry_
+            target = Label
+
+    report = warmup(registries=())
+
+    assert BrokenScheme not in report.schemas
+    assert BrokenScheme in [schema for schema, _ in report.errors]
+
+
+@pytest.mark.skipif(not hasattr(gc, "freeze"), reason="Requires gc.freeze")
+def test_warmup_freezes_garbage_collector(monkeypatch):
+    calls = []
+    monkeypatch.setattr(gc, "collect", lambda: calls.append("collect"))
+    monkeypatch.setattr(gc, "freeze", lambda: calls.append("freeze"))
+
+    report = warmup(registries=(), freeze=True)
+
+    assert report.frozen
+    assert calls == ["collect", "freeze"]